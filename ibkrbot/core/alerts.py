@@ -121,9 +121,9 @@ class AlertManager:
                     data = json.load(f)
                 for alert_id, alert_data in data.get('alerts', {}).items():
                     self._alerts[alert_id] = PriceAlert.from_dict(alert_data)
-                _log.info(f"Loaded {len(self._alerts)} alerts")
+                _log.info("Loaded %s alerts", len(self._alerts))
             except Exception as e:
-                _log.error(f"Error loading alerts: {e}")
+                _log.error("Error loading alerts: %s", e)
 
     def _save(self) -> None:
         """Save alerts to disk."""
@@ -137,7 +137,7 @@ class AlertManager:
             with open(self._alerts_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2)
         except Exception as e:
-            _log.error(f"Error saving alerts: {e}")
+            _log.error("Error saving alerts: %s", e)
 
     def _generate_id(self) -> str:
         """Generate unique alert ID."""
@@ -167,7 +167,7 @@ class AlertManager:
         )
         self._alerts[alert_id] = alert
         self._save()
-        _log.info(f"Added alert {alert_id}: {alert.get_description()}")
+        _log.info("Added alert %s: %s", alert_id, alert.get_description())
         return alert
 
     def remove_alert(self, alert_id: str) -> bool:
@@ -175,7 +175,7 @@ class AlertManager:
         if alert_id in self._alerts:
             del self._alerts[alert_id]
             self._save()
-            _log.info(f"Removed alert {alert_id}")
+            _log.info("Removed alert %s", alert_id)
             return True
         return False
 
@@ -254,9 +254,9 @@ class AlertManager:
                     try:
                         callback(alert, current_price)
                     except Exception as e:
-                        _log.error(f"Alert callback error: {e}")
+                        _log.error("Alert callback error: %s", e)
 
-                _log.info(f"Alert triggered: {alert.get_description()} at ${current_price:.2f}")
+                _log.info("Alert triggered: %s at $%.2f", alert.get_description(), current_price)
 
         if triggered:
             self._save()
@@ -279,7 +279,7 @@ class AlertManager:
         self._running = True
         self._monitor_thread = threading.Thread(target=self._monitor_loop, args=(interval_seconds,), daemon=True)
         self._monitor_thread.start()
-        _log.info(f"Alert monitoring started (interval: {interval_seconds}s)")
+        _log.info("Alert monitoring started (interval: %ss)", interval_seconds)
 
     def stop_monitoring(self) -> None:
         """Stop background monitoring."""
@@ -303,7 +303,7 @@ class AlertManager:
                     if price is not None:
                         self.check_alerts(symbol, price)
                 except Exception as e:
-                    _log.debug(f"Error fetching price for {symbol}: {e}")
+                    _log.debug("Error fetching price for %s: %s", symbol, e)
 
             # Sleep in small increments to allow quick shutdown
             for _ in range(int(interval)):
@@ -139,7 +139,7 @@ class AutoReconnectManager:
             try:
                 self._on_reconnect_start()
             except Exception as e:
-                _log.error(f"Error in on_reconnect_start callback: {e}")
+                _log.error("Error in on_reconnect_start callback: %s", e)
 
         delay = self._config.initial_delay_seconds
 
@@ -154,7 +154,7 @@ class AutoReconnectManager:
                 self._attempt_count += 1
                 current_attempt = self._attempt_count
 
-            _log.info(f"Reconnection attempt {current_attempt}/{self._config.max_attempts} in {delay:.1f}s")
+            _log.info("Reconnection attempt %s/%s in %.1fs", current_attempt, self._config.max_attempts, delay)
 
             # Wait before attempting
             self._interruptible_sleep(delay)
@@ -174,7 +174,7 @@ class AutoReconnectManager:
                 try:
                     success = self._connect_callback()
                 except Exception as e:
-                    _log.warning(f"Reconnection attempt {current_attempt} failed: {e}")
+                    _log.warning("Reconnection attempt %s failed: %s", current_attempt, e)
                     success = False
 
             if success:
@@ -186,30 +186,30 @@ class AutoReconnectManager:
                     try:
                         self._on_reconnect_success()
                     except Exception as e:
-                        _log.error(f"Error in on_reconnect_success callback: {e}")
+                        _log.error("Error in on_reconnect_success callback: %s", e)
                 break
             else:
-                _log.warning(f"Reconnection attempt {current_attempt} failed")
+                _log.warning("Reconnection attempt %s failed", current_attempt)
 
                 if self._on_reconnect_failed:
                     try:
                         self._on_reconnect_failed(current_attempt)
                     except Exception as e:
-                        _log.error(f"Error in on_reconnect_failed callback: {e}")
+                        _log.error("Error in on_reconnect_failed callback: %s", e)
 
                 # Increase delay with backoff
                 delay = min(delay * self._config.backoff_multiplier, self._config.max_delay_seconds)
 
         # Check if we exhausted all attempts
         if self._running and self._attempt_count >= self._config.max_attempts:
-            _log.error(f"All {self._config.max_attempts} reconnection attempts exhausted")
+            _log.error("All %s reconnection attempts exhausted", self._config.max_attempts)
             self._running = False
 
             if self._on_reconnect_exhausted:
                 try:
                     self._on_reconnect_exhausted()
                 except Exception as e:
-                    _log.error(f"Error in on_reconnect_exhausted callback: {e}")
+                    _log.error("Error in on_reconnect_exhausted callback: %s", e)
 
     def _interruptible_sleep(self, seconds: float) -> None:
         """Sleep that can be interrupted by stopping."""
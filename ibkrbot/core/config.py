@@ -1,6 +1,7 @@
 from __future__ import annotations
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict
 
@@ -30,14 +31,24 @@ def load_config() -> Dict[str, Any]:
         try:
             user_cfg = json.loads(user_p.read_text(encoding="utf-8"))
         except Exception as e:
-            _log.warning(f"Failed to load user config, using defaults: {e}")
+            _log.warning("Failed to load user config, using defaults: %s", e)
             user_cfg = {}
     else:
         user_cfg = {}
     return _deep_merge(default_cfg, user_cfg)
 
+def dumps_user_config(cfg: Dict[str, Any]) -> str:
+    return json.dumps(cfg, indent=2)
+
+def write_user_config_text(text: str) -> None:
+    """Write already-serialized config; safe to call from a worker thread."""
+    p = user_config_path()
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, p)
+
 def save_user_config(cfg: Dict[str, Any]) -> None:
-    user_config_path().write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+    write_user_config_text(dumps_user_config(cfg))
 
 
 def validate_config(cfg: Dict[str, Any]) -> list[str]:
@@ -94,6 +105,6 @@ def get_safe_config_value(cfg: Dict[str, Any], path: str, default: Any, expected
             return default
 
     if not isinstance(value, expected_type):
-        _log.warning(f"Config {path} has wrong type {type(value).__name__}, expected {expected_type.__name__}")
+        _log.warning("Config %s has wrong type %s, expected %s", path, type(value).__name__, expected_type.__name__)
         return default
     return value
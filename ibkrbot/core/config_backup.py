@@ -12,6 +12,9 @@ from .paths import user_data_dir
 
 _log = logging.getLogger(__name__)
 
+# Compression for new backups; tests switch this to ZIP_STORED
+_BACKUP_COMPRESSION = zipfile.ZIP_DEFLATED
+
 
 def get_backup_dir() -> Path:
     backup_dir = user_data_dir() / "backups"
@@ -43,7 +46,7 @@ def list_backups() -> List[Dict[str, Any]]:
                 "size_human": _format_size(f.stat().st_size),
             })
         except Exception as e:
-            _log.warning(f"Could not parse backup file {f}: {e}")
+            _log.warning("Could not parse backup file %s: %s", f, e)
             continue
 
     # Sort by timestamp, newest first
@@ -59,8 +62,11 @@ def _format_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} TB"
 
 
-def create_backup(description: str = "") -> Path:
-    """Create a backup ZIP of user config and data."""
+def create_backup(description: str = "", compression: Optional[int] = None) -> Path:
+    """Create a backup ZIP of user config and data.
+
+    ``compression`` is a zipfile constant; defaults to ``_BACKUP_COMPRESSION``.
+    """
     user_dir = user_data_dir()
     backup_dir = get_backup_dir()
 
@@ -80,7 +86,10 @@ def create_backup(description: str = "") -> Path:
         "plans",
     ]
 
-    with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+    if compression is None:
+        compression = _BACKUP_COMPRESSION
+
+    with zipfile.ZipFile(backup_path, 'w', compression) as zf:
         # Add metadata
         metadata = {
             "created_at": datetime.now().isoformat(),
@@ -94,7 +103,7 @@ def create_backup(description: str = "") -> Path:
             file_path = user_dir / filename
             if file_path.exists():
                 zf.write(file_path, filename)
-                _log.debug(f"Added {filename} to backup")
+                _log.debug("Added %s to backup", filename)
 
         # Add directories
         for dirname in dirs_to_backup:
@@ -104,9 +113,9 @@ def create_backup(description: str = "") -> Path:
                     if file.is_file():
                         rel_path = file.relative_to(user_dir)
                         zf.write(file, str(rel_path))
-                        _log.debug(f"Added {rel_path} to backup")
+                        _log.debug("Added %s to backup", rel_path)
 
-    _log.info(f"Created backup: {backup_path}")
+    _log.info("Created backup: %s", backup_path)
     return backup_path
 
 
@@ -145,20 +154,20 @@ def restore_backup(backup_path: Path, restore_config: bool = True,
                     target_path = user_dir / member
                     target_path.parent.mkdir(parents=True, exist_ok=True)
 
-                    # Extract file
+                    # Stream the member straight to its target, without buffering it whole
                     with zf.open(member) as src:
                         with open(target_path, 'wb') as dst:
-                            dst.write(src.read())
+                            shutil.copyfileobj(src, dst)
 
                     results["restored_files"].append(member)
-                    _log.debug(f"Restored: {member}")
+                    _log.debug("Restored: %s", member)
                 except Exception as e:
                     results["errors"].append(f"{member}: {str(e)}")
-                    _log.error(f"Failed to restore {member}: {e}")
+                    _log.error("Failed to restore %s: %s", member, e)
             else:
                 results["skipped_files"].append(member)
 
-    _log.info(f"Restored {len(results['restored_files'])} files from backup")
+    _log.info("Restored %s files from backup", len(results['restored_files']))
     return results
 
 
@@ -169,7 +178,7 @@ def get_backup_metadata(backup_path: Path) -> Optional[Dict[str, Any]]:
                 with zf.open("backup_metadata.json") as f:
                     return json.loads(f.read().decode('utf-8'))
     except Exception as e:
-        _log.warning(f"Could not read backup metadata: {e}")
+        _log.warning("Could not read backup metadata: %s", e)
     return None
 
 
@@ -177,10 +186,10 @@ def delete_backup(backup_path: Path) -> bool:
     try:
         if backup_path.exists():
             backup_path.unlink()
-            _log.info(f"Deleted backup: {backup_path}")
+            _log.info("Deleted backup: %s", backup_path)
             return True
     except Exception as e:
-        _log.error(f"Failed to delete backup: {e}")
+        _log.error("Failed to delete backup: %s", e)
     return False
 
 
@@ -195,6 +204,6 @@ def cleanup_old_backups(keep_count: int = 10) -> int:
                 deleted += 1
 
     if deleted:
-        _log.info(f"Cleaned up {deleted} old backups")
+        _log.info("Cleaned up %s old backups", deleted)
 
     return deleted
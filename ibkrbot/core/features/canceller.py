@@ -1,10 +1,12 @@
 from __future__ import annotations
 import time
-from typing import Dict
-from ..task_runner import TaskContext
-from ..ibkr.client import IbkrClient
+from typing import TYPE_CHECKING, Dict
 from ..constants import Timeouts, OrderStatus, RetryDefaults
 
+if TYPE_CHECKING:
+    from ..task_runner import TaskContext
+    from ..ibkr.client import IbkrClient
+
 def cancel_open_brackets(ctx: TaskContext, ib: IbkrClient, symbol: str, retries: int = RetryDefaults.MAX_RETRIES, wait_s: float = RetryDefaults.DELAY_SEC) -> Dict[str, int]:
     """Cancel all active orders for symbol with retry/refresh."""
     attempted = 0
@@ -2,13 +2,15 @@ from __future__ import annotations
 import datetime as dt
 import logging
 import re
-from typing import Any, Dict, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 
-from ..task_runner import TaskContext
-from ..ibkr.client import IbkrClient
 from ..constants import Timeouts, OrderStatus, AutomationDefaults
 from .canceller import cancel_open_brackets
 
+if TYPE_CHECKING:
+    from ..task_runner import TaskContext
+    from ..ibkr.client import IbkrClient
+
 _log = logging.getLogger(__name__)
 
 
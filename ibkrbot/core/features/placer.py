@@ -1,16 +1,17 @@
 from __future__ import annotations
-from typing import Any, Dict, Optional
-import json
+from typing import TYPE_CHECKING, Any, Dict, Optional
 import time
 
-from ..task_runner import TaskContext
-from ..ibkr.client import IbkrClient
 from ..ibkr.contracts import from_symbol_cfg
 from ..ibkr.orders import bracket_orders
 from ..plan import now_iso, latest_plan, load_json
 from ..constants import Timeouts, OrderStatus
 from ..ibkr.error_codes import IBKRErrorCodes
 
+if TYPE_CHECKING:
+    from ..task_runner import TaskContext
+    from ..ibkr.client import IbkrClient
+
 class DuplicateBracketError(RuntimeError):
     pass
 
@@ -135,7 +136,10 @@ def place_bracket_from_plan(ctx: TaskContext, ib: IbkrClient, symbol_cfg: Dict[s
             raise RuntimeError(_friendly_reject(err))
         raise RuntimeError(f"Order status indicates failure: {st}")
 
-    plan2 = json.loads(json.dumps(plan))  # deep copy
+    # Copy only the sections updated below; the input may be a shared cached plan
+    plan2 = dict(plan)
+    plan2["status"] = dict(plan.get("status") or {})
+    plan2["status"]["ibkr"] = dict(plan2["status"].get("ibkr") or {})
     plan2["status"]["placed"] = True
     plan2["status"]["ibkr"].update({
         "parent_order_id": parent_id,
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
-from ..task_runner import TaskContext
 from ..data_sources import fetch_yahoo_ohlc, atr
 from ..plan import now_iso
 from ..paths import ensure_subdirs
 from ..visual.chart import snapshot_from_dataframe, save_price_thumbnail
 
+if TYPE_CHECKING:
+    from ..task_runner import TaskContext
+
 _log = logging.getLogger(__name__)
 
 
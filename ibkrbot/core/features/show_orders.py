@@ -1,12 +1,88 @@
 from __future__ import annotations
-from typing import Any, Dict
-from ..task_runner import TaskContext
-from ..ibkr.client import IbkrClient
-from ..constants import Timeouts
+from collections import defaultdict
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from ..constants import OrderStatus, Timeouts
+
+if TYPE_CHECKING:
+    from ..task_runner import TaskContext
+    from ..ibkr.client import IbkrClient
 
 def fetch_orders_and_positions(ctx: TaskContext, ib: IbkrClient) -> Dict[str, Any]:
     ctx.check_cancelled()
-    orders = ib.fetch_open_orders(timeout=Timeouts.IBKR_STANDARD)
+    # Both requests go out before either reply is awaited
+    orders, positions = ib.fetch_orders_and_positions(timeout=Timeouts.IBKR_STANDARD)
     ctx.check_cancelled()
-    positions = ib.fetch_positions(timeout=Timeouts.IBKR_STANDARD)
     return {"orders": orders, "positions": positions}
+
+# Order statuses after which a bracket leg no longer counts as working
+_FINAL_STATUSES = frozenset(OrderStatus.FINAL)
+
+# OpenOrderRow fields in orders-table column order
+_ORDER_FIELDS = attrgetter("orderId", "parentId", "symbol", "action", "orderType",
+                           "totalQuantity", "lmtPrice", "auxPrice", "status")
+
+def _int_or(x: Any, default: int = 0) -> int:
+    return int(x) if isinstance(x, (int, float)) else default
+
+def _is_working(o: Any) -> bool:
+    st = o.status
+    if not isinstance(st, str):
+        st = str(st) if st else ""
+    return st not in _FINAL_STATUSES
+
+def order_table_rows(orders: List[Any]) -> Tuple[List[Tuple[str, ...]], bool]:
+    """Shape open orders into display rows plus an "any bracket still working" flag.
+
+    Bracket-friendly grouping: each parent (parentId == 0) is followed by its
+    children (shown with a "↳ " prefix); children whose parent isn't listed go
+    at the end. Values are already strings, in the orders table's column order
+    (OrderId, ParentId, Symbol, Action, Type, Qty, Lmt, Aux, Status).
+    """
+    parents: Dict[int, Any] = {}
+    children_by_parent: Dict[int, List[Any]] = defaultdict(list)
+    top_level: List[Any] = []
+
+    for o in orders:
+        pid = _int_or(o.parentId)
+        if pid:
+            children_by_parent[pid].append(o)
+        else:
+            parents[_int_or(o.orderId)] = o
+            top_level.append(o)
+
+    # Build display list with indentation levels
+    display: List[Tuple[Any, int]] = []
+    open_bracket = False
+    for parent in top_level:
+        kids = children_by_parent.get(_int_or(parent.orderId), [])
+        display.append((parent, 0))
+        display.extend((child, 1) for child in kids)
+        # If any order in a bracket is still working, consider it open
+        if kids and not open_bracket:
+            open_bracket = _is_working(parent) or any(map(_is_working, kids))
+
+    # Orphan children (if any) — show at the end
+    for pid, kids in children_by_parent.items():
+        if pid not in parents:
+            display.extend((child, 1) for child in kids)
+
+    rows = []
+    for o, indent in display:
+        row = [str(v) for v in _ORDER_FIELDS(o)]
+        if indent:
+            row[2] = "↳ " + row[2]
+        rows.append(tuple(row))
+    return rows, open_bracket
+
+def position_table_rows(positions: List[Any]) -> List[Tuple[str, ...]]:
+    """Shape positions (dicts from ibapi, or attribute objects) into display rows."""
+    rows = []
+    for pos in positions:
+        if isinstance(pos, dict):
+            vals = (pos.get("symbol", ""), pos.get("position", ""), pos.get("avgCost", ""), pos.get("account", ""))
+        else:
+            vals = (getattr(pos, "symbol", ""), getattr(pos, "position", ""),
+                    getattr(pos, "avgCost", ""), getattr(pos, "account", ""))
+        rows.append(tuple(str(v) for v in vals))
+    return rows
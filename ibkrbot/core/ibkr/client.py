@@ -1,7 +1,8 @@
 from __future__ import annotations
 import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ibapi.client import EClient
 from ibapi.wrapper import EWrapper
@@ -61,6 +62,10 @@ class IbkrClient(EWrapper, EClient):
         self._req_id_lock = threading.Lock()
         self._next_req_id = 10001
 
+        # Called from the API thread when the socket drops unexpectedly
+        self.on_disconnected: Optional[Callable[[], None]] = None
+        self._stopping = False
+
     # --- callbacks ---
     def nextValidId(self, orderId: int):
         with self._next_id_lock:
@@ -84,6 +89,15 @@ class IbkrClient(EWrapper, EClient):
             if evt:
                 evt.set()
 
+    def connectionClosed(self):
+        self._logger.info("IBKR connection closed")
+        cb = self.on_disconnected
+        if cb is not None and not self._stopping:
+            try:
+                cb()
+            except Exception:
+                self._logger.exception("on_disconnected callback failed")
+
     def orderStatus(self, orderId: int, status: str, filled: float, remaining: float, avgFillPrice: float,
                     permId: int, parentId: int, lastFillPrice: float, clientId: int, whyHeld: str, mktCapPrice: float):
         with self._order_status_lock:
@@ -168,6 +182,7 @@ class IbkrClient(EWrapper, EClient):
             return
         self._logger.info("Connecting to IBKR %s:%s clientId=%s", host, port, client_id)
         self._next_id_evt.clear()
+        self._stopping = False
         super().connect(host, int(port), int(client_id))
         self._thread = threading.Thread(target=self.run, name="IBKRApiThread", daemon=True)
         self._thread.start()
@@ -178,6 +193,7 @@ class IbkrClient(EWrapper, EClient):
         if not self.isConnected():
             return
         self._logger.info("Disconnecting IBKR...")
+        self._stopping = True
         try:
             self.disconnect()
         except Exception:
@@ -257,6 +273,27 @@ class IbkrClient(EWrapper, EClient):
         with self._positions_lock:
             return list(self._positions)
 
+    def fetch_orders_and_positions(self, timeout: float = 6.0) -> Tuple[List[OpenOrderRow], List[Dict[str, Any]]]:
+        """Request open orders and positions together and wait for both (one round-trip of latency)."""
+        self._open_orders_evt.clear()
+        self._positions_evt.clear()
+        with self._open_orders_lock:
+            self._open_orders = []
+        with self._positions_lock:
+            self._positions = []
+        self.reqOpenOrders()
+        self.reqPositions()
+        deadline = time.monotonic() + timeout
+        if not self._open_orders_evt.wait(timeout=timeout):
+            raise TimeoutError("Timed out waiting for open orders.")
+        if not self._positions_evt.wait(timeout=max(0.0, deadline - time.monotonic())):
+            raise TimeoutError("Timed out waiting for positions.")
+        with self._open_orders_lock:
+            orders = list(self._open_orders)
+        with self._positions_lock:
+            positions = list(self._positions)
+        return orders, positions
+
     def cancel_order_safe(self, order_id: int) -> None:
         try:
             self.cancelOrder(int(order_id))
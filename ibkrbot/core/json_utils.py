@@ -0,0 +1,47 @@
+"""Shared JSON helpers."""
+from __future__ import annotations
+import json
+import math
+from typing import Any
+
+try:
+    import orjson  # optional: faster plan/journal (de)serialization
+except ImportError:
+    orjson = None
+
+
+def has_non_finite(obj: Any) -> bool:
+    """True if obj holds a NaN/Infinity float anywhere (e.g. ATR-derived levels)."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(has_non_finite(v) for v in obj)
+    return False
+
+
+def dumps_bytes(obj: Any, *, non_finite: bool = False) -> bytes:
+    """Pretty-printed JSON for obj, using orjson when it is installed.
+
+    orjson writes NaN/Infinity as null, so callers pass non_finite=True when
+    obj may hold them; the stdlib encoder then keeps them as NaN/Infinity.
+    """
+    if orjson is not None and not non_finite:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # e.g. numpy scalars or non-str keys; let the stdlib handle them
+            pass
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def loads_bytes(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity written by the stdlib encoder; only json accepts them
+            pass
+    return json.loads(data.decode("utf-8"))
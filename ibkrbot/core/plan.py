@@ -1,8 +1,9 @@
 from __future__ import annotations
-import json
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
+from .json_utils import dumps_bytes, has_non_finite, loads_bytes
 from .paths import ensure_subdirs
 
 def now_iso() -> str:
@@ -16,11 +17,44 @@ def save_plan(plan: Dict[str, Any], kind: str) -> Path:
     sym = plan.get("symbol", "UNKNOWN")
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     p = plan_dir() / f"{sym}_{kind}_{ts}.json"
-    p.write_text(json.dumps(plan, indent=2), encoding="utf-8")
+    p.write_bytes(_dumps_bytes(plan))
     return p
 
+def _dumps_bytes(plan: Dict[str, Any]) -> bytes:
+    # NaN/Infinity only come from the ATR-derived levels/risk; skip data_snapshot
+    non_finite = has_non_finite(plan.get("levels")) or has_non_finite(plan.get("risk"))
+    return dumps_bytes(plan, non_finite=non_finite)
+
+def dumps_plan(plan: Dict[str, Any]) -> str:
+    """Pretty-print a plan for display."""
+    return _dumps_bytes(plan).decode("utf-8")
+
+def clone_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a plan so its levels/risk can be edited without touching the original.
+
+    Only the sections callers mutate are copied; large read-only parts such as
+    data_snapshot are shared instead of deep-copied.
+    """
+    out = dict(plan)
+    out["levels"] = dict(plan.get("levels") or {})
+    out["risk"] = dict(plan.get("risk") or {})
+    return out
+
 def load_json(p: Path) -> Dict[str, Any]:
-    return json.loads(p.read_text(encoding="utf-8"))
+    return loads_bytes(p.read_bytes())
+
+@lru_cache(maxsize=64)
+def _load_json_at(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    return load_json(Path(path))
+
+def load_json_cached(p: Path) -> Dict[str, Any]:
+    """load_json() memoized on (path, mtime, size); rewriting the file invalidates it.
+
+    The returned dict is shared between callers: treat it as read-only, or
+    clone_plan() it before editing.
+    """
+    st = p.stat()
+    return _load_json_at(str(p), st.st_mtime_ns, st.st_size)
 
 def latest_plan(symbol: str, kind: str) -> Optional[Path]:
     files = sorted(plan_dir().glob(f"{symbol}_{kind}_*.json"), reverse=True)
@@ -119,7 +119,7 @@ class TrayIconManager:
         icon = icon_map.get(icon_type, QSystemTrayIcon.Information)
 
         self._tray_icon.showMessage(title, message, icon, duration_ms)
-        _log.debug(f"Tray notification: {title} - {message}")
+        _log.debug("Tray notification: %s - %s", title, message)
 
     def set_show_callback(self, callback: Callable) -> None:
         self._show_callback = callback
@@ -1,13 +1,18 @@
 """Trade journal with P&L tracking."""
 from __future__ import annotations
-import json
 import logging
+import math
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, asdict, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
+import numpy as np
+
+from .json_utils import dumps_bytes, loads_bytes
 from .paths import user_data_dir
 
 _log = logging.getLogger(__name__)
@@ -25,7 +30,7 @@ class TradeSide(Enum):
     SHORT = "short"
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeEntry:
     id: str
     symbol: str
@@ -65,15 +70,15 @@ class TradeEntry:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        d = {name: getattr(self, name) for name in _TRADE_FIELDS}
+        d['tags'] = list(self.tags)  # the only mutable field; don't share it
+        return d
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TradeEntry':
         """Create from dictionary."""
-        # Handle missing fields for backwards compatibility
-        if 'tags' not in data:
-            data['tags'] = []
-        return cls(**data)
+        # Missing optional fields take their defaults (backwards compatibility)
+        return cls(**{k: data[k] for k in _TRADE_FIELDS if k in data})
 
     @property
     def is_open(self) -> bool:
@@ -100,6 +105,21 @@ class TradeEntry:
         return None
 
 
+_TRADE_FIELDS = tuple(f.name for f in fields(TradeEntry))
+# The only fields that can hold NaN/Infinity, which orjson would write as null
+_trade_floats = attrgetter(
+    "entry_price", "exit_price", "stop_price", "take_profit_price", "realized_pnl", "commission",
+)
+
+
+def _has_non_finite_floats(trades: Iterable[TradeEntry]) -> bool:
+    """True if any trade holds a NaN/Infinity price or P&L."""
+    return any(
+        v is not None and not math.isfinite(v)
+        for t in trades for v in _trade_floats(t)
+    )
+
+
 class TradeJournal:
     def __init__(self, journal_dir: Optional[Path] = None):
         if journal_dir is None:
@@ -108,25 +128,51 @@ class TradeJournal:
         self._journal_dir.mkdir(parents=True, exist_ok=True)
         self._journal_file = self._journal_dir / "trades.json"
         self._trades: Dict[str, TradeEntry] = {}
+        # Bumped on every change; keys the statistics / sorted-trades caches
+        self._revision = 0
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._sorted_cache: Optional[Tuple[int, List[TradeEntry]]] = None
+        # Inside batch(), saves only mark the journal dirty
+        self._batch_depth = 0
+        self._dirty = False
         self._load()
 
     def _load(self) -> None:
         """Load trades from disk."""
         if self._journal_file.exists():
             try:
-                with open(self._journal_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = loads_bytes(self._journal_file.read_bytes())
                 for trade_id, trade_data in data.get('trades', {}).items():
                     self._trades[trade_id] = TradeEntry.from_dict(trade_data)
-                _log.info(f"Loaded {len(self._trades)} trades from journal")
+                _log.info("Loaded %s trades from journal", len(self._trades))
             except Exception as e:
-                _log.error(f"Error loading trade journal: {e}")
+                _log.error("Error loading trade journal: %s", e)
                 self._trades = {}
         else:
             _log.debug("No existing trade journal found")
 
     def _save(self) -> None:
+        """Record a change and persist it, unless inside batch()."""
+        self._revision += 1
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator[TradeJournal]:
+        """Group several changes into a single write to disk on exit."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self.flush()
+
+    def flush(self) -> None:
         """Save trades to disk with automatic backup."""
+        self._dirty = False
         try:
             # Create backup before overwriting
             if self._journal_file.exists():
@@ -137,11 +183,11 @@ class TradeJournal:
                 'updated_at': datetime.now(timezone.utc).isoformat(),
                 'trades': {tid: t.to_dict() for tid, t in self._trades.items()}
             }
-            with open(self._journal_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            _log.debug(f"Saved {len(self._trades)} trades to journal")
+            non_finite = _has_non_finite_floats(self._trades.values())
+            self._journal_file.write_bytes(dumps_bytes(data, non_finite=non_finite))
+            _log.debug("Saved %s trades to journal", len(self._trades))
         except Exception as e:
-            _log.error(f"Error saving trade journal: {e}")
+            _log.error("Error saving trade journal: %s", e)
 
     def _create_backup(self) -> None:
         """Create a rolling backup of the journal."""
@@ -161,9 +207,9 @@ class TradeJournal:
             for old_backup in backups[5:]:
                 old_backup.unlink()
 
-            _log.debug(f"Created journal backup: {backup_file.name}")
+            _log.debug("Created journal backup: %s", backup_file.name)
         except Exception as e:
-            _log.warning(f"Failed to create journal backup: {e}")
+            _log.warning("Failed to create journal backup: %s", e)
 
     def _generate_id(self) -> str:
         """Generate a unique trade ID."""
@@ -207,7 +253,7 @@ class TradeJournal:
         )
         self._trades[trade_id] = trade
         self._save()
-        _log.info(f"Added trade {trade_id}: {side} {quantity} {symbol} @ {entry_price}")
+        _log.info("Added trade %s: %s %s %s @ %s", trade_id, side, quantity, symbol, entry_price)
         return trade
 
     def close_trade(
@@ -221,7 +267,7 @@ class TradeJournal:
         """Close an existing trade."""
         trade = self._trades.get(trade_id)
         if not trade:
-            _log.warning(f"Trade {trade_id} not found")
+            _log.warning("Trade %s not found", trade_id)
             return None
 
         trade.exit_time = datetime.now(timezone.utc).isoformat()
@@ -245,7 +291,7 @@ class TradeJournal:
             trade.status = TradeStatus.PARTIAL.value
 
         self._save()
-        _log.info(f"Closed trade {trade_id}: P&L ${trade.realized_pnl:.2f}")
+        _log.info("Closed trade %s: P&L $%.2f", trade_id, trade.realized_pnl)
         return trade
 
     def cancel_trade(self, trade_id: str, reason: str = "") -> Optional[TradeEntry]:
@@ -258,7 +304,7 @@ class TradeJournal:
         if reason:
             trade.notes = f"{trade.notes}\nCancelled: {reason}".strip()
         self._save()
-        _log.info(f"Cancelled trade {trade_id}")
+        _log.info("Cancelled trade %s", trade_id)
         return trade
 
     def update_notes(self, trade_id: str, notes: str) -> Optional[TradeEntry]:
@@ -290,7 +336,18 @@ class TradeJournal:
 
     def get_all_trades(self) -> List[TradeEntry]:
         """Get all trades, sorted by entry time (newest first)."""
-        return sorted(self._trades.values(), key=lambda t: t.entry_time, reverse=True)
+        if self._sorted_cache is None or self._sorted_cache[0] != self._revision:
+            trades = sorted(self._trades.values(), key=lambda t: t.entry_time, reverse=True)
+            self._sorted_cache = (self._revision, trades)
+        return list(self._sorted_cache[1])
+
+    def recent(self, n: int = 500) -> List[TradeEntry]:
+        """Get the ``n`` newest trades (same order as get_all_trades)."""
+        self.get_all_trades()
+        return self._sorted_cache[1][:n]
+
+    def __len__(self) -> int:
+        return len(self._trades)
 
     def get_open_trades(self) -> List[TradeEntry]:
         """Get all open trades."""
@@ -305,7 +362,12 @@ class TradeJournal:
         return [t for t in self._trades.values() if t.symbol == symbol]
 
     def get_statistics(self) -> Dict[str, Any]:
-        """Calculate trading statistics."""
+        """Trading statistics, recomputed only after the journal changes."""
+        if self._stats_cache is None or self._stats_cache[0] != self._revision:
+            self._stats_cache = (self._revision, self._compute_statistics())
+        return dict(self._stats_cache[1])
+
+    def _compute_statistics(self) -> Dict[str, Any]:
         closed = self.get_closed_trades()
         if not closed:
             return {
@@ -323,12 +385,15 @@ class TradeJournal:
                 'avg_r_multiple': 0.0,
             }
 
-        winners = [t for t in closed if t.realized_pnl and t.realized_pnl > 0]
-        losers = [t for t in closed if t.realized_pnl and t.realized_pnl < 0]
+        pnl = np.fromiter((t.realized_pnl or 0.0 for t in closed), dtype=np.float64, count=len(closed))
+        win_mask = pnl > 0
+        loss_mask = pnl < 0
+        n_winners = int(win_mask.sum())
+        n_losers = int(loss_mask.sum())
 
-        total_pnl = sum(t.realized_pnl or 0 for t in closed)
-        gross_profit = sum(t.realized_pnl for t in winners) if winners else 0
-        gross_loss = abs(sum(t.realized_pnl for t in losers)) if losers else 0
+        total_pnl = float(pnl.sum())
+        gross_profit = float(pnl[win_mask].sum())
+        gross_loss = float(-pnl[loss_mask].sum())
 
         r_multiples = [t.r_multiple for t in closed if t.r_multiple is not None]
 
@@ -336,17 +401,17 @@ class TradeJournal:
             'total_trades': len(self._trades),
             'open_trades': len(self.get_open_trades()),
             'closed_trades': len(closed),
-            'winners': len(winners),
-            'losers': len(losers),
-            'win_rate': len(winners) / len(closed) * 100 if closed else 0,
+            'winners': n_winners,
+            'losers': n_losers,
+            'win_rate': n_winners / len(closed) * 100,
             'total_pnl': total_pnl,
-            'avg_pnl': total_pnl / len(closed) if closed else 0,
-            'avg_winner': gross_profit / len(winners) if winners else 0,
-            'avg_loser': -gross_loss / len(losers) if losers else 0,
-            'best_trade': max((t.realized_pnl or 0) for t in closed) if closed else 0,
-            'worst_trade': min((t.realized_pnl or 0) for t in closed) if closed else 0,
+            'avg_pnl': total_pnl / len(closed),
+            'avg_winner': gross_profit / n_winners if n_winners else 0,
+            'avg_loser': -gross_loss / n_losers if n_losers else 0,
+            'best_trade': float(pnl.max()),
+            'worst_trade': float(pnl.min()),
             'profit_factor': gross_profit / gross_loss if gross_loss > 0 else float('inf'),
-            'avg_r_multiple': sum(r_multiples) / len(r_multiples) if r_multiples else 0,
+            'avg_r_multiple': float(np.mean(r_multiples)) if r_multiples else 0,
         }
 
     def export_to_csv(self, filepath: Path) -> bool:
@@ -369,10 +434,10 @@ class TradeJournal:
                 for trade in trades:
                     writer.writerow(trade.to_dict())
 
-            _log.info(f"Exported {len(trades)} trades to {filepath}")
+            _log.info("Exported %s trades to %s", len(trades), filepath)
             return True
         except Exception as e:
-            _log.error(f"Error exporting trades: {e}")
+            _log.error("Error exporting trades: %s", e)
             return False
 
     def export_to_excel(self, filepath: Path) -> bool:
@@ -476,10 +541,10 @@ class TradeJournal:
                 ws_stats.cell(row=row_idx, column=2, value=value)
 
             wb.save(filepath)
-            _log.info(f"Exported {len(trades)} trades to {filepath}")
+            _log.info("Exported %s trades to %s", len(trades), filepath)
             return True
         except Exception as e:
-            _log.error(f"Error exporting to Excel: {e}")
+            _log.error("Error exporting to Excel: %s", e)
             return False
 
 
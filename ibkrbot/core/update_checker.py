@@ -2,7 +2,8 @@
 from __future__ import annotations
 import logging
 import threading
-from typing import Optional, Tuple, Callable
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Callable
 from dataclasses import dataclass
 
 from .constants import AppInfo
@@ -21,6 +22,7 @@ class UpdateInfo:
     is_update_available: bool
 
 
+@lru_cache(maxsize=128)
 def parse_version(version: str) -> Tuple[int, ...]:
     """Parse version string like '1.0.2' into tuple (1, 0, 2)."""
     try:
@@ -50,7 +52,7 @@ def check_for_updates(timeout: float = 10.0) -> Optional[UpdateInfo]:
         import urllib.request
         import json
 
-        _log.debug(f"Checking for updates at {GITHUB_API_URL}")
+        _log.debug("Checking for updates at %s", GITHUB_API_URL)
 
         request = urllib.request.Request(
             GITHUB_API_URL,
@@ -79,9 +81,9 @@ def check_for_updates(timeout: float = 10.0) -> Optional[UpdateInfo]:
         )
 
         if update_available:
-            _log.info(f"Update available: {current_version} -> {latest_version}")
+            _log.info("Update available: %s -> %s", current_version, latest_version)
         else:
-            _log.debug(f"No update available (current: {current_version}, latest: {latest_version})")
+            _log.debug("No update available (current: %s, latest: %s)", current_version, latest_version)
 
         return info
 
@@ -89,13 +91,13 @@ def check_for_updates(timeout: float = 10.0) -> Optional[UpdateInfo]:
         if e.code == 404:
             _log.debug("No releases found on GitHub")
         else:
-            _log.warning(f"HTTP error checking for updates: {e.code}")
+            _log.warning("HTTP error checking for updates: %s", e.code)
         return None
     except urllib.error.URLError as e:
-        _log.debug(f"Network error checking for updates: {e}")
+        _log.debug("Network error checking for updates: %s", e)
         return None
     except Exception as e:
-        _log.warning(f"Error checking for updates: {e}")
+        _log.warning("Error checking for updates: %s", e)
         return None
 
 
@@ -123,10 +125,13 @@ def check_for_updates_async(
 
 
 class UpdateChecker:
-    def __init__(self, check_interval_hours: float = 24.0):
+    def __init__(self, check_interval_hours: float = 24.0,
+                 timer_factory: Callable[[float, Callable[[], None]], Any] = threading.Timer):
         self._interval = check_interval_hours * 3600  # Convert to seconds
+        # Builds the threading.Timer-like object for each scheduled check
+        self._timer_factory = timer_factory
         self._last_check: Optional[UpdateInfo] = None
-        self._timer: Optional[threading.Timer] = None
+        self._timer: Optional[Any] = None
         self._callback: Optional[Callable[[UpdateInfo], None]] = None
         self._running = False
 
@@ -135,7 +140,7 @@ class UpdateChecker:
         self._callback = callback
         self._running = True
         self._schedule_check()
-        _log.info(f"Update checker started (interval: {self._interval/3600:.1f} hours)")
+        _log.info("Update checker started (interval: %.1f hours)", self._interval/3600)
 
     def stop(self) -> None:
         """Stop periodic update checks."""
@@ -155,7 +160,7 @@ class UpdateChecker:
         if not self._running:
             return
 
-        self._timer = threading.Timer(self._interval, self._do_check)
+        self._timer = self._timer_factory(self._interval, self._do_check)
         self._timer.daemon = True
         self._timer.start()
 
@@ -49,6 +49,9 @@ def _float_to_pct(x: float) -> float:
     return x * 100.0
 
 
+_PNL_FMT = ",.2f"
+
+
 def _fmt_money(x: float) -> str:
     try:
         return f"{x:,.2f}"
@@ -220,42 +223,45 @@ class DiffDialog(QDialog):
         self.setLayout(lay)
 
 
+# (label, key path) for the fields compared by compute_plan_diff
+DIFF_FIELDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("created_at", ("created_at",)),
+    ("symbol", ("symbol",)),
+    ("exchange", ("exchange",)),
+    ("currency", ("currency",)),
+    ("entry_limit", ("levels", "entry_limit")),
+    ("stop", ("levels", "stop")),
+    ("take_profit", ("levels", "take_profit")),
+    ("qty", ("risk", "qty")),
+    ("atr", ("levels", "atr")),
+    ("risk_per_share", ("levels", "risk_per_share")),
+    ("est_notional", ("risk", "estimated_notional")),
+    ("est_risk", ("risk", "estimated_risk")),
+    ("take_r", ("risk", "take_r")),
+)
+
+
+def _get_path(d: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    cur: Any = d
+    for part in keys:
+        if not isinstance(cur, dict):
+            return None
+        cur = cur.get(part)
+    return cur
+
+
 def compute_plan_diff(draft: Dict[str, Any], placed: Dict[str, Any]) -> str:
-    def g(d: Dict[str, Any], path: str, default: Any = None) -> Any:
-        cur: Any = d
-        for part in path.split("."):
-            if not isinstance(cur, dict) or part not in cur:
-                return default
-            cur = cur[part]
-        return cur
-
-    fields = [
-        ("created_at", "created_at"),
-        ("symbol", "symbol"),
-        ("exchange", "exchange"),
-        ("currency", "currency"),
-        ("entry_limit", "levels.entry_limit"),
-        ("stop", "levels.stop"),
-        ("take_profit", "levels.take_profit"),
-        ("qty", "risk.qty"),
-        ("atr", "levels.atr"),
-        ("risk_per_share", "levels.risk_per_share"),
-        ("est_notional", "risk.estimated_notional"),
-        ("est_risk", "risk.estimated_risk"),
-        ("take_r", "risk.take_r"),
+    diffs = [
+        (name, a, b) for name, keys in DIFF_FIELDS
+        if (a := _get_path(draft, keys)) != (b := _get_path(placed, keys))
     ]
 
     lines: List[str] = []
     lines.append(f"{'FIELD':<18} | {'DRAFT':>18} | {'PLACED':>18}")
     lines.append("-"*60)
-    changed = 0
-    for name, path in fields:
-        a = g(draft, path)
-        b = g(placed, path)
-        if a != b:
-            changed += 1
-            lines.append(f"{name:<18} | {str(a):>18} | {str(b):>18}")
-    if changed == 0:
+    for name, a, b in diffs:
+        lines.append(f"{name:<18} | {str(a):>18} | {str(b):>18}")
+    if not diffs:
         lines.append("(No differences found for key fields.)")
     return "\n".join(lines)
 
@@ -698,18 +704,19 @@ class PerformanceAnalyticsDialog(QDialog):
         pnl_layout = QFormLayout()
 
         total_pnl = stats.get('total_pnl', 0)
-        pnl_label = QLabel(f"${total_pnl:,.2f}")
-        if total_pnl > 0:
-            pnl_label.setStyleSheet("color: green; font-weight: bold;")
-        elif total_pnl < 0:
-            pnl_label.setStyleSheet("color: red; font-weight: bold;")
+        pnl_text = "$" + format(total_pnl, _PNL_FMT)
+        if total_pnl:
+            # Inline rich text avoids a per-label stylesheet parse
+            color = "green" if total_pnl > 0 else "red"
+            pnl_text = f'<b><span style="color:{color}">{pnl_text}</span></b>'
+        pnl_label = QLabel(pnl_text)
 
         pnl_layout.addRow("Total P&L:", pnl_label)
-        pnl_layout.addRow("Avg P&L per Trade:", QLabel(f"${stats.get('avg_pnl', 0):,.2f}"))
-        pnl_layout.addRow("Avg Winner:", QLabel(f"${stats.get('avg_winner', 0):,.2f}"))
-        pnl_layout.addRow("Avg Loser:", QLabel(f"${stats.get('avg_loser', 0):,.2f}"))
-        pnl_layout.addRow("Best Trade:", QLabel(f"${stats.get('best_trade', 0):,.2f}"))
-        pnl_layout.addRow("Worst Trade:", QLabel(f"${stats.get('worst_trade', 0):,.2f}"))
+        pnl_layout.addRow("Avg P&L per Trade:", QLabel("$" + format(stats.get('avg_pnl', 0), _PNL_FMT)))
+        pnl_layout.addRow("Avg Winner:", QLabel("$" + format(stats.get('avg_winner', 0), _PNL_FMT)))
+        pnl_layout.addRow("Avg Loser:", QLabel("$" + format(stats.get('avg_loser', 0), _PNL_FMT)))
+        pnl_layout.addRow("Best Trade:", QLabel("$" + format(stats.get('best_trade', 0), _PNL_FMT)))
+        pnl_layout.addRow("Worst Trade:", QLabel("$" + format(stats.get('worst_trade', 0), _PNL_FMT)))
 
         pnl_group.setLayout(pnl_layout)
         layout.addWidget(pnl_group)
@@ -754,7 +761,6 @@ class PerformanceAnalyticsDialog(QDialog):
 
     def _export(self, journal, format_type: str) -> None:
         from PySide6.QtWidgets import QFileDialog
-        from pathlib import Path
         from datetime import datetime
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -783,6 +789,12 @@ class PerformanceAnalyticsDialog(QDialog):
                     QMessageBox.warning(self, "Export Failed", "No trades to export or error occurred.\nNote: openpyxl package may be required for Excel export.")
 
 
+def _f(d: Dict[str, Any], k: str, default: float = 0.0) -> float:
+    # Single lookup; missing, None and 0 all fall back to the default
+    v = d.get(k)
+    return float(v) if v else default
+
+
 def format_trade_ticket_summary(plan: Dict[str, Any], cfg: Dict[str, Any]) -> str:
     symbol = plan.get("symbol", "—")
     mode = plan.get("mode", cfg.get("ibkr", {}).get("mode", "paper"))
@@ -791,23 +803,24 @@ def format_trade_ticket_summary(plan: Dict[str, Any], cfg: Dict[str, Any]) -> st
     exchange = listing.get("exchange", "SMART")
     currency = listing.get("currency", "USD")
 
-    lv = plan.get("levels", {}) or {}
-    rk = plan.get("risk", {}) or {}
+    lv = plan.get("levels") or {}
+    rk = plan.get("risk") or {}
+    cfg_risk = cfg.get("risk") or {}
 
-    entry = float(lv.get("entry_limit", 0.0) or 0.0)
-    stop = float(lv.get("stop", 0.0) or 0.0)
-    take = float(lv.get("take_profit", 0.0) or 0.0)
-    atr = float(lv.get("atr", 0.0) or 0.0)
+    entry = _f(lv, "entry_limit")
+    stop = _f(lv, "stop")
+    take = _f(lv, "take_profit")
+    atr = _f(lv, "atr")
 
-    qty = int(rk.get("qty", 0) or 0)
-    netliq = float(rk.get("net_liq", 0.0) or 0.0)
-    max_notional_pct = float(cfg.get("risk", {}).get("max_notional_pct", rk.get("max_notional_pct", 0.05)))
-    max_loss_pct = float(cfg.get("risk", {}).get("max_loss_pct", rk.get("max_loss_pct", 0.005)))
+    qty = int(rk.get("qty") or 0)
+    netliq = _f(rk, "net_liq")
+    max_notional_pct = float(cfg_risk.get("max_notional_pct", rk.get("max_notional_pct", 0.05)))
+    max_loss_pct = float(cfg_risk.get("max_loss_pct", rk.get("max_loss_pct", 0.005)))
 
-    est_notional = float(rk.get("estimated_notional", qty * entry) or (qty * entry))
-    rps = float(lv.get("risk_per_share", abs(entry - stop)) or abs(entry - stop))
-    est_risk = float(rk.get("estimated_risk", qty * rps) or (qty * rps))
-    take_r = float(rk.get("take_r", 0.0) or 0.0)
+    est_notional = _f(rk, "estimated_notional", qty * entry)
+    rps = _f(lv, "risk_per_share", abs(entry - stop))
+    est_risk = _f(rk, "estimated_risk", qty * rps)
+    take_r = _f(rk, "take_r")
 
     lines = []
     lines.append(f"IBKRBot Trade Ticket ({mode.upper()}) - {direction}")
@@ -1,10 +1,25 @@
 from __future__ import annotations
 import logging
+import time
 from PySide6.QtCore import QObject, Signal
 
 class QtLogEmitter(QObject):
     message = Signal(str)
 
+class QtLogFormatter(logging.Formatter):
+    """Formatter that renders asctime once per second instead of once per record."""
+    def __init__(self, fmt: str, datefmt: str = "%Y-%m-%d %H:%M:%S"):
+        super().__init__(fmt, datefmt)
+        self._last_sec = -1
+        self._last_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_str = time.strftime(datefmt or self.datefmt, time.localtime(sec))
+        return self._last_str
+
 class QtLogHandler(logging.Handler):
     def __init__(self, emitter: QtLogEmitter):
         super().__init__()
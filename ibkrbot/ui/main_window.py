@@ -1,6 +1,5 @@
 from __future__ import annotations
-import json
-import copy
+import time
 from typing import Any, Dict, Optional, Tuple
 from datetime import datetime, timezone
 
@@ -10,17 +9,21 @@ from PySide6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QGroupBox, QSizePolicy, QCheckBox,
     QDoubleSpinBox, QSpinBox, QProgressBar, QStatusBar, QMenuBar, QMenu, QApplication, QDialog, QLineEdit, QGridLayout
 )
-from PySide6.QtCore import Qt, QThread, QSettings, QUrl, QTimer, QEvent
-from PySide6.QtGui import QDesktopServices, QFont, QPixmap, QAction, QKeySequence, QShortcut, QKeyEvent
+from PySide6.QtCore import Qt, QThread, QSettings, QUrl, QTimer, QEvent, Signal
+from PySide6.QtGui import QDesktopServices, QFont, QPixmap, QAction, QKeySequence, QShortcut, QKeyEvent, QPainter, QColor, QBrush
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 from ..core.task_runner import TaskRunner, Task
 from ..core.config import load_config
-from ..core.plan import save_plan, latest_plan, load_json, now_iso
+from ..core.plan import save_plan, latest_plan, load_json, load_json_cached, now_iso, clone_plan, dumps_plan
 from ..core.features.proposer import propose_swing_plan
 from ..core.features.placer import place_bracket_from_plan, DuplicateBracketError
-from ..core.features.show_orders import fetch_orders_and_positions
+from ..core.features.show_orders import fetch_orders_and_positions, order_table_rows, position_table_rows
 from ..core.features.canceller import cancel_open_brackets
 from ..core.features.janitor import janitor_check_and_cancel
 from ..core.features.manager import ManagerWorker
@@ -28,7 +31,7 @@ from ..core.ibkr.client import IbkrClient
 from ..core.paths import ensure_subdirs, resource_path
 from ..core.visual.chart import save_thumbnail_from_plan
 from ..core.constants import Timeouts, OrderStatus
-from .logging_handler import QtLogEmitter, QtLogHandler
+from .logging_handler import QtLogEmitter, QtLogFormatter, QtLogHandler
 from .dialogs import TradeTicketDialog, SettingsDialog, DiffDialog, PerformanceAnalyticsDialog, compute_plan_diff, format_trade_ticket_summary
 from .theme import Colors, Fonts, Styles, Spacing, ThemeMode, get_theme_manager, apply_theme
 
@@ -36,18 +39,232 @@ from .theme import Colors, Fonts, Styles, Spacing, ThemeMode, get_theme_manager,
 from ..core.sound import get_sound_player, SOUND_SUCCESS, SOUND_ERROR, SOUND_ORDER_FILLED, SOUND_CONNECT, SOUND_DISCONNECT
 from ..core.update_checker import check_for_updates_async, UpdateInfo
 from ..core.trade_journal import get_trade_journal
-from ..core.alerts import get_alert_manager, AlertCondition
 from ..core.system_tray import get_tray_manager
 from ..core.auto_reconnect import get_reconnect_manager, ReconnectConfig
 
+# Stylesheets are built once; identical strings let Qt skip re-styling
+_STYLE_SECONDARY = Styles.secondary_text()
+_STYLE_WORKFLOW_STEP = Styles.workflow_step()
+_STYLE_WORKFLOW_NEXT = Styles.workflow_next_box()
+_STYLE_UNSAVED = Styles.unsaved_warning()
+_STYLE_CHART = Styles.chart_border()
+_STYLE_WARNING_BANNER = Styles.warning_banner()
+# Mode combo: red/bold for live (strong warning), subtle gray for paper
+_STYLE_MODE_LIVE = """
+    QComboBox {
+        background-color: #ffe6e6;
+        color: #cc0000;
+        font-weight: bold;
+        border: 2px solid #ff4444;
+        padding: 5px 8px;
+        font-size: 11pt;
+    }
+    QComboBox::drop-down {
+        border-left: 1px solid #ff4444;
+    }
+"""
+_STYLE_MODE_PAPER = """
+    QComboBox {
+        background-color: #f5f5f5;
+        color: #333333;
+        font-weight: bold;
+        border: 2px solid #999999;
+        padding: 5px 8px;
+        font-size: 11pt;
+    }
+    QComboBox::drop-down {
+        border-left: 1px solid #999999;
+    }
+"""
+_NOTE_TEXT_PAPER = "✅ Paper Mode: Simulated trading (NetLiq often shows $1,000,000)"
+_NOTE_TEXT_LIVE = "🔴 LIVE MODE: Real money! All orders require confirmation."
+_NOTE_STYLE_PAPER = "color: #006600; font-weight: bold;"
+_NOTE_STYLE_LIVE = "color: #cc0000; font-weight: bold; background-color: #ffeeee; padding: 5px;"
+
+_SHORTCUTS_HTML = """<h3>Keyboard Shortcuts</h3>
+
+<table style="width:100%">
+<tr><td><b>Ctrl+R</b></td><td>Refresh orders and positions</td></tr>
+<tr><td><b>Ctrl+P</b></td><td>Propose new plan for current symbol</td></tr>
+<tr><td><b>Ctrl+L</b></td><td>Place bracket order from draft</td></tr>
+<tr><td><b>Ctrl+S</b></td><td>Open Settings dialog</td></tr>
+<tr><td><b>Ctrl+Q</b></td><td>Quit application</td></tr>
+<tr><td><b>F1</b></td><td>Show this help</td></tr>
+</table>
+
+<p><i>Tip: Hover over buttons to see tooltips explaining each action.</i></p>"""
+
+_LIVE_WARNING_HTML = """<p><b>You are about to switch to LIVE trading mode.</b></p>
+
+<p><b style='color: #cc0000;'>This means:</b></p>
+<ul>
+<li>❌ Orders will be placed on your REAL account</li>
+<li>❌ Real money will be used</li>
+<li>❌ You can lose real money</li>
+<li>❌ All trades will execute for real</li>
+</ul>
+
+<p><b>Before proceeding:</b></p>
+<ul>
+<li>✓ Ensure IB Gateway is connected to live account (port 4001)</li>
+<li>✓ Verify you have sufficient funds</li>
+<li>✓ Test thoroughly in paper mode first</li>
+<li>✓ Understand you may lose money</li>
+</ul>"""
+
+# Workflow step labels, indexed by the step's boolean state (False, True)
+_WF1 = ("1) Connect to IB Gateway: ❌", "1) Connect to IB Gateway: ✅")
+_WF2 = ("2) Propose draft plan: ❌", "2) Propose draft plan: ✅")
+_WF3 = ("3) Review / edit draft: —", "3) Review / edit draft: ✅ reviewed")
+_WF3_UNSAVED = "3) Review / edit draft: ⚠ unsaved edits"
+_WF4 = ("4) Place bracket: —", "4) Place bracket: pending")
+_WF4_PLACED = "4) Place bracket: ✅ placed plan exists"
+_WF5_NONE = "5) Refresh & monitor: —"
+_WF6 = ("6) Manager: stopped", "6) Manager: running")
+_WF7 = "7) Janitor: on-demand"
+
+# Risk gauge text; only the percentages change between edits
+_NOTIONAL_FMT = "Notional usage: {:.1f}% (max {:.2f}% NetLiq)"
+_LOSS_FMT = "Loss usage: {:.1f}% (max {:.2f}% NetLiq)"
+_GAUGE_OVER_TIP = "Over limit. Override confirmation required."
+
+# How long a latest_plan() directory scan is trusted before re-globbing
+_LATEST_PLAN_TTL_S = 2.0
+# Trade Journal dialog lists this many newest trades until "Load all" is pressed
+_JOURNAL_RECENT_ROWS = 500
+
+# Recent trades table: (row background, P&L foreground, indicator) by P&L sign
+_TRADE_WIN = (QBrush(QColor("#E8F5E9")), QBrush(QColor("#2E7D32")), "✓")  # green
+_TRADE_LOSS = (QBrush(QColor("#FFEBEE")), QBrush(QColor("#C62828")), "✗")  # red
+_TRADE_FLAT = (QBrush(QColor("#FFFFFF")), QBrush(QColor("#666666")), "—")
+
+# Bright green/red that stay visible in both light and dark mode
+_DOT_COLOR_CONN = "#00ff00"
+_DOT_COLOR_DISC = "#ff5555"
+
+def _set_text(w, text: str) -> None:
+    """setText() only when the text differs; avoids relayout on no-op updates."""
+    if w.text() != text:
+        w.setText(text)
+
+
+def _set_style(w, sheet: str) -> None:
+    """setStyleSheet() only when the sheet differs; Qt re-polishes on every call."""
+    if w.styleSheet() != sheet:
+        w.setStyleSheet(sheet)
+
+
+def _set_enabled(w, on: bool) -> None:
+    if w.isEnabled() != on:
+        w.setEnabled(on)
+
+
+def _set_gauge(pb: QProgressBar, pct: float, fmt: str) -> None:
+    """Update a usage bar, touching only the parts whose value changed."""
+    value = int(min(max(pct, 0.0), 100.0))
+    if pb.value() != value:
+        pb.setValue(value)
+    if pb.format() != fmt:
+        pb.setFormat(fmt)
+    tip = _GAUGE_OVER_TIP if pct > 100.0 else ""
+    if pb.toolTip() != tip:
+        pb.setToolTip(tip)
+
+
+_READ_ONLY_ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+def _read_only_item(text: str) -> QTableWidgetItem:
+    """Create a non-editable table item, so no editor is set up on double-click."""
+    item = QTableWidgetItem(text)
+    item.setFlags(_READ_ONLY_ITEM_FLAGS)
+    return item
+
+def _fill_table(table: QTableWidget, rows: list) -> None:
+    """Populate a QTableWidget in one pass, reusing existing items where possible.
+
+    Cells whose text is unchanged are left alone, so a refresh that returns the
+    same orders/positions repaints nothing. New items are read-only.
+    """
+    sorting = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    try:
+        table.setRowCount(len(rows))
+        for r, values in enumerate(rows):
+            for c, v in enumerate(values):
+                text = v if isinstance(v, str) else str(v)
+                item = table.item(r, c)
+                if item is None:
+                    table.setItem(r, c, _read_only_item(text))
+                elif item.text() != text:
+                    item.setText(text)
+    finally:
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        table.setSortingEnabled(sorting)
+
+def _journal_row(trade: Any) -> Tuple[str, ...]:
+    """Trade Journal dialog cells for one TradeEntry."""
+    return (
+        trade.id,
+        trade.symbol,
+        trade.side,
+        trade.status,
+        f"${trade.entry_price:.2f}",
+        f"${trade.exit_price:.2f}" if trade.exit_price else "--",
+        str(trade.quantity),
+        f"${trade.realized_pnl:+,.2f}" if trade.realized_pnl else "--",
+        f"{trade.r_multiple:.2f}R" if trade.r_multiple else "--",
+    )
+
+def _settings_bool(v: Any, default: bool) -> bool:
+    # QSettings returns "true"/"false" strings from INI files and ints from the registry
+    if v is None:
+        return default
+    if isinstance(v, str):
+        return v.strip().lower() in ("true", "1", "yes")
+    return bool(v)
+
+@lru_cache(maxsize=8)
+def _load_pixmap(path: str, mtime: float) -> QPixmap:
+    # mtime is part of the key so a regenerated PNG is decoded again
+    return QPixmap(path)
+
+def _make_dot(color: str, size: int = 12) -> QPixmap:
+    """Render a filled status circle once, so state changes are a plain setPixmap."""
+    pix = QPixmap(size, size)
+    pix.fill(Qt.transparent)
+    painter = QPainter(pix)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(color))
+    painter.drawEllipse(1, 1, size - 2, size - 2)
+    painter.end()
+    return pix
+
 def _ts_now() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 class MainWindow(QMainWindow):
+    """Main application window.
+
+    Threading contract: widgets are only touched on the GUI thread. Work that
+    runs elsewhere (TaskRunner tasks, the manager QThread, the IBKR API thread,
+    auto-reconnect and update-check threads, the chart pool) reports back
+    through Qt signals connected with Qt.QueuedConnection.
+    """
+    # Emitted from background threads; queued onto the GUI thread
+    _ib_disconnected = Signal()
+    _chart_ready = Signal(str, object)  # thumbnail path, plan it was rendered for
+    _reconnected = Signal(float)
+    _reconnect_exhausted = Signal()
+    _update_checked = Signal(object)
+
     def __init__(self, logger: logging.Logger):
         super().__init__()
         self.logger = logger
-        self.cfg = load_config()
+        self._set_cfg(load_config())
         self.runner = TaskRunner()
         self.ib = IbkrClient(logger=self.logger)
         self._net_liq: Optional[float] = None
@@ -63,23 +280,62 @@ class MainWindow(QMainWindow):
         self._last_refresh_at: Optional[str] = None
 
         self._settings = QSettings("IBKRBot", "IBKRBot")
-
-        # Connection health monitoring
+        # Last geometry/symbol known to be in QSettings (see _save_settings)
+        self._stored_geometry: Any = None
+        self._stored_symbol: Any = None
+
+        # Nesting depth for _batched_ui_updates()
+        self._update_depth = 0
+        # Last state rendered by _update_workflow() / _on_preview_edited()
+        self._wf_state_cache: Optional[tuple] = None
+        self._last_preview_key: Optional[tuple] = None
+        # (dialog, input, confirm button), built on first live-mode switch
+        self._live_confirm_dlg: Optional[Tuple[QDialog, QLineEdit, QPushButton]] = None
+        # Results of _compute_preview() / _risk_limits(); see _get_preview()
+        self._preview_cache: Optional[Dict[str, float]] = None
+        self._risk_cache: Optional[tuple] = None
+        # (symbol, kind) -> (looked up at, path); see _latest_plan()
+        self._latest_plan_cache: Dict[Tuple[str, str], Tuple[float, Optional[Path]]] = {}
+        # (order rows, position rows) from the last refresh, not yet shown; see _refresh_done()
+        self._pending_tables: Optional[Tuple[list, list]] = None
+
+        # Chart thumbnails (matplotlib) are rendered off the GUI thread
+        self._chart_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart")
+        # Config writes; a single worker keeps saves in submission order
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-io")
+        self._chart_ready.connect(self._on_chart_ready, Qt.QueuedConnection)
+        self._update_checked.connect(self._on_update_checked, Qt.QueuedConnection)
+
+        # Connection health monitoring: react to socket drops immediately,
+        # keep a slow poll only as a safety net
+        self._ib_disconnected.connect(self._check_connection_health, Qt.QueuedConnection)
+        self.ib.on_disconnected = self._ib_disconnected.emit
         self._connection_check_timer = QTimer()
         self._connection_check_timer.timeout.connect(self._check_connection_health)
-        self._connection_check_timer.setInterval(30000)  # Check every 30 seconds
+        self._connection_check_timer.setInterval(300000)  # Check every 5 minutes
 
         # Auto-backup draft timer (every 2 minutes)
         self._auto_backup_timer = QTimer()
         self._auto_backup_timer.timeout.connect(self._auto_backup_draft)
         self._auto_backup_timer.start(120000)
 
-        # v1.0.2 feature initialization
-        self._sound_player = get_sound_player()
-        self._trade_journal = get_trade_journal()
-        self._alert_manager = get_alert_manager()
-        self._tray_manager = get_tray_manager()
-        self._reconnect_manager = get_reconnect_manager()
+        # Coalesce bursts of spinbox edits into a single preview recompute
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self._on_preview_edited)
+
+        # Collapse back-to-back refresh requests (place/cancel/button) into one fetch
+        self._refresh_pending = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self._do_refresh_now)
+        # Bumped whenever a running refresh's result would be stale; see _supersede_refresh()
+        self._refresh_token = 0
+        self._refresh_task: Optional[Task] = None
+
+        # v1.0.2 features are created on first use (see properties below)
         self._dark_mode_enabled = False
 
         # Session statistics tracking
@@ -119,7 +375,7 @@ class MainWindow(QMainWindow):
         # Mode selector (Paper/Live)
         self.mode_combo = QComboBox()
         self.mode_combo.addItems(["paper", "live"])
-        current_mode = self.cfg.get("ibkr", {}).get("mode", "paper")
+        current_mode = self._ibkr_cfg.get("mode", "paper")
         self.mode_combo.setCurrentText(current_mode)
         self.mode_combo.currentTextChanged.connect(self._on_mode_changed)
 
@@ -150,14 +406,14 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("Idle")
         self.netliq_label = QLabel("NetLiq: (not connected)")
         self.paper_note = QLabel("")
-        self.paper_note.setStyleSheet(Styles.secondary_text())
+        self.paper_note.setStyleSheet(_STYLE_SECONDARY)
 
         self.last_proposal_label = QLabel("Last proposal: —")
-        self.last_proposal_label.setStyleSheet(Styles.secondary_text())
+        self.last_proposal_label.setStyleSheet(_STYLE_SECONDARY)
         self.open_bracket_label = QLabel("Open bracket: unknown (refresh)")
-        self.open_bracket_label.setStyleSheet(Styles.secondary_text())
+        self.open_bracket_label.setStyleSheet(_STYLE_SECONDARY)
         self.manager_label = QLabel("Manager: stopped")
-        self.manager_label.setStyleSheet(Styles.secondary_text())
+        self.manager_label.setStyleSheet(_STYLE_SECONDARY)
 
         # Buttons
         self.btn_connect = QPushButton("Connect")
@@ -203,12 +459,12 @@ class MainWindow(QMainWindow):
         self.wf_step6 = QLabel("6) Manager: stopped")
         self.wf_step7 = QLabel("7) Janitor: on-demand")
         for w in [self.wf_step1, self.wf_step2, self.wf_step3, self.wf_step4, self.wf_step5, self.wf_step6, self.wf_step7]:
-            w.setStyleSheet(Styles.workflow_step())
+            w.setStyleSheet(_STYLE_WORKFLOW_STEP)
             wf_l.addWidget(w)
 
         self.wf_next = QLabel("Next: Connect to IB Gateway")
         self.wf_next.setWordWrap(True)
-        self.wf_next.setStyleSheet(Styles.workflow_next_box())
+        self.wf_next.setStyleSheet(_STYLE_WORKFLOW_NEXT)
         wf_l.addWidget(self.wf_next)
 
         self.workflow_box.setLayout(wf_l)
@@ -247,7 +503,7 @@ class MainWindow(QMainWindow):
 
         # Unsaved edits indicator
         self.unsaved_label = QLabel("")
-        self.unsaved_label.setStyleSheet(Styles.unsaved_warning())
+        self.unsaved_label.setStyleSheet(_STYLE_UNSAVED)
         self.unsaved_label.hide()
 
         # Risk gauge bars
@@ -263,7 +519,7 @@ class MainWindow(QMainWindow):
         self.chart_label.setMinimumHeight(150)
         self.chart_label.setMaximumHeight(200)
         self.chart_label.setAlignment(Qt.AlignCenter)
-        self.chart_label.setStyleSheet(Styles.chart_border())
+        self.chart_label.setStyleSheet(_STYLE_CHART)
         self.chart_label.setScaledContents(True)
         self.pb_loss.setRange(0, 100)
         self.pb_loss.setValue(0)
@@ -272,10 +528,9 @@ class MainWindow(QMainWindow):
         # Risk banner (override warning)
         self.risk_banner = QLabel("")
         self.risk_banner.setWordWrap(True)
-        self.risk_banner.setStyleSheet(Styles.warning_banner())
+        self.risk_banner.setStyleSheet(_STYLE_WARNING_BANNER)
         self.risk_banner.hide()
         self.chart_label.setText('(chart will appear after Propose)')
-        self.chart_label.setPixmap(QPixmap())
 
         self.preview_form.addRow("Symbol:", self.lbl_symbol)
         self.preview_form.addRow("Entry (LMT):", self.entry_spin)
@@ -311,6 +566,7 @@ class MainWindow(QMainWindow):
         self.positions_table.setAlternatingRowColors(True)
 
         # Recent trades history table with P&L colors
+        self._trades_rows: Optional[list] = None
         self.trades_table = QTableWidget(0, 6)
         self.trades_table.setHorizontalHeaderLabels(["Time", "Symbol", "Side", "Qty", "P&L", "R"])
         self.trades_table.setAlternatingRowColors(True)
@@ -336,6 +592,8 @@ class MainWindow(QMainWindow):
         self.log_view = QTextEdit()
         self.log_view.setReadOnly(True)
         self.log_view.setLineWrapMode(QTextEdit.NoWrap)
+        # Keep only the most recent lines so repaint cost stays bounded
+        self.log_view.document().setMaximumBlockCount(2000)
 
         # --- Layout ---
         top = QWidget()
@@ -406,9 +664,11 @@ class MainWindow(QMainWindow):
         self.status = QStatusBar()
         self.setStatusBar(self.status)
 
-        self.conn_dot = QLabel("●")
-        # Use bright red that's visible in both light and dark mode
-        self.conn_dot.setStyleSheet("color: #ff5555; font-size: 16px;")
+        self.conn_dot = QLabel()
+        self._pix_conn = _make_dot(_DOT_COLOR_CONN)
+        self._pix_disc = _make_dot(_DOT_COLOR_DISC)
+        self._dot_connected: Optional[bool] = None
+        self._set_conn_dot(False)
         self.conn_text = QLabel("Disconnected")
         self.task_text = QLabel("Ready")
         self.task_spinner = QProgressBar()
@@ -431,12 +691,35 @@ class MainWindow(QMainWindow):
         self.status.addPermanentWidget(self.task_text, 1)
         self.status.addPermanentWidget(self.task_spinner)
 
+        # Buttons disabled while a task runs (see _on_busy_changed)
+        self._busy_buttons = (
+            self.btn_connect, self.btn_propose, self.btn_place, self.btn_refresh, self.btn_cancel,
+            self.btn_cancel_all, self.btn_janitor, self.btn_view_plan, self.btn_compare,
+            self.btn_save_draft_edits,
+        )
+        self._last_busy: Optional[bool] = None
+
+        # Labels that only ever show plain text; skips the rich-text sniffing on each setText
+        for lbl in (
+            self.wf_step1, self.wf_step2, self.wf_step3, self.wf_step4, self.wf_step5,
+            self.wf_step6, self.wf_step7, self.wf_next, self.status_label, self.task_text,
+            self.conn_text, self.netliq_label, self.open_bracket_label, self.last_proposal_label,
+            self.unsaved_label, self.paper_note,
+        ):
+            lbl.setTextFormat(Qt.PlainText)
+
         # --- Log to UI ---
         self.qt_emitter = QtLogEmitter()
         handler = QtLogHandler(self.qt_emitter)
-        handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(message)s"))
+        handler.setFormatter(QtLogFormatter("%(asctime)s | %(levelname)s | %(message)s"))
         self.logger.addHandler(handler)
-        self.qt_emitter.message.connect(self.log_view.append)
+        # Buffer log lines and flush them to the view at most every 100 ms
+        self._log_q: deque[str] = deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_log_queue)
+        self.qt_emitter.message.connect(self._enqueue_log)
 
         # --- Signals ---
         self.btn_connect.clicked.connect(self._on_connect)
@@ -455,13 +738,13 @@ class MainWindow(QMainWindow):
         self.btn_copy_ticket.clicked.connect(self._on_copy_ticket)
 
         # Live-update preview metrics + risk banner
-        self.entry_spin.valueChanged.connect(lambda _v: self._on_preview_edited())
-        self.stop_spin.valueChanged.connect(lambda _v: self._on_preview_edited())
-        self.take_spin.valueChanged.connect(lambda _v: self._on_preview_edited())
-        self.qty_spin.valueChanged.connect(lambda _v: self._on_preview_edited())
+        for spin in (self.entry_spin, self.stop_spin, self.take_spin, self.qty_spin):
+            spin.valueChanged.connect(self._invalidate_preview_cache)
+            spin.valueChanged.connect(self._schedule_preview_update)
 
         self.runner.busy_changed.connect(self._on_busy_changed)
-        self.symbol_combo.currentTextChanged.connect(lambda _s: (self._sync_preview_from_latest(), self._update_favorite_button()))
+        self.symbol_combo.currentTextChanged.connect(self._sync_preview_from_latest)
+        self.symbol_combo.currentTextChanged.connect(self._update_favorite_button)
 
         # --- Keyboard shortcuts ---
         self._setup_shortcuts()
@@ -509,7 +792,8 @@ class MainWindow(QMainWindow):
         m_file.addSeparator()
         m_file.addAction(act_exit)
 
-        # View menu (v1.0.2)
+        # View menu (v1.0.2). Stateful toggles exist up front because settings
+        # restore touches them; the dialog entries are added on first open.
         m_view = QMenu("&View", self)
         bar.addMenu(m_view)
 
@@ -520,64 +804,84 @@ class MainWindow(QMainWindow):
         m_view.addAction(self.act_dark_mode)
 
         m_view.addSeparator()
+        self._view_menu_anchor = m_view.addSeparator()
+
+        self.act_sound = QAction("Sound Notifications", self)
+        self.act_sound.setCheckable(True)
+        self.act_sound.triggered.connect(self._toggle_sound)
+        m_view.addAction(self.act_sound)
+
+        self.act_tray = QAction("Minimize to Tray", self)
+        self.act_tray.setCheckable(True)
+        self.act_tray.triggered.connect(self._toggle_minimize_to_tray)
+        m_view.addAction(self.act_tray)
+
+        # Sound/tray state is read once the window is up
+        QTimer.singleShot(0, self._finalize_menu_state)
+
+        self._m_view = m_view
+        self._view_menu_built = False
+        m_view.aboutToShow.connect(self._populate_view_menu_once)
+
+        # Help menu: About stays visible (menus must not be empty on macOS),
+        # everything else is added on first open.
+        m_help = QMenu("&Help", self)
+        bar.addMenu(m_help)
+
+        self._act_about = QAction("About", self)
+        self._act_about.triggered.connect(self._about)
+        m_help.addAction(self._act_about)
+
+        self._m_help = m_help
+        self._help_menu_built = False
+        m_help.aboutToShow.connect(self._populate_help_menu_once)
+
+    def _populate_view_menu_once(self) -> None:
+        if self._view_menu_built:
+            return
+        self._view_menu_built = True
 
         act_trade_journal = QAction("Trade Journal...", self)
         act_trade_journal.triggered.connect(self._show_trade_journal)
-        m_view.addAction(act_trade_journal)
 
         act_alerts = QAction("Price Alerts...", self)
         act_alerts.triggered.connect(self._show_alerts)
-        m_view.addAction(act_alerts)
 
         act_stats = QAction("Trade Statistics...", self)
         act_stats.triggered.connect(self._show_trade_stats)
-        m_view.addAction(act_stats)
 
         act_session = QAction("Session Statistics...", self)
         act_session.triggered.connect(self._show_session_stats)
-        m_view.addAction(act_session)
 
-        m_view.addSeparator()
+        self._m_view.insertActions(self._view_menu_anchor, [act_trade_journal, act_alerts, act_stats, act_session])
 
-        self.act_sound = QAction("Sound Notifications", self)
-        self.act_sound.setCheckable(True)
-        self.act_sound.setChecked(self._sound_player.enabled)
-        self.act_sound.triggered.connect(self._toggle_sound)
-        m_view.addAction(self.act_sound)
-
-        self.act_tray = QAction("Minimize to Tray", self)
-        self.act_tray.setCheckable(True)
-        self.act_tray.setChecked(self._tray_manager.minimize_to_tray_enabled if self._tray_manager.is_available else False)
-        self.act_tray.setEnabled(self._tray_manager.is_available)
-        self.act_tray.triggered.connect(self._toggle_minimize_to_tray)
-        m_view.addAction(self.act_tray)
-
-        m_help = QMenu("&Help", self)
-        bar.addMenu(m_help)
+    def _populate_help_menu_once(self) -> None:
+        if self._help_menu_built:
+            return
+        self._help_menu_built = True
+        m_help = self._m_help
+        before = self._act_about
 
         act_start_here = QAction("Open START_HERE", self)
         act_setup = QAction("Open SETUP_CHECKLIST", self)
         act_shortcuts = QAction("Keyboard Shortcuts", self)
         act_disclaimer = QAction("View Disclaimer", self)
-        act_about = QAction("About", self)
+        act_check_updates = QAction("Check for Updates...", self)
 
         act_start_here.triggered.connect(lambda: self._open_doc("START_HERE.txt"))
         act_setup.triggered.connect(lambda: self._open_doc("SETUP_CHECKLIST.txt"))
         act_shortcuts.triggered.connect(self._show_keyboard_shortcuts)
         act_disclaimer.triggered.connect(self._show_disclaimer)
-        act_about.triggered.connect(self._about)
-
-        m_help.addAction(act_start_here)
-        m_help.addAction(act_setup)
-        m_help.addSeparator()
-        m_help.addAction(act_shortcuts)
-        m_help.addAction(act_disclaimer)
-        m_help.addSeparator()
-        act_check_updates = QAction("Check for Updates...", self)
         act_check_updates.triggered.connect(self._check_for_updates)
-        m_help.addAction(act_check_updates)
-        m_help.addSeparator()
-        m_help.addAction(act_about)
+
+        m_help.insertAction(before, act_start_here)
+        m_help.insertAction(before, act_setup)
+        m_help.insertSeparator(before)
+        m_help.insertAction(before, act_shortcuts)
+        m_help.insertAction(before, act_disclaimer)
+        m_help.insertSeparator(before)
+        m_help.insertAction(before, act_check_updates)
+        m_help.insertSeparator(before)
 
     def _setup_shortcuts(self) -> None:
         """Setup keyboard shortcuts for common actions"""
@@ -593,12 +897,12 @@ class MainWindow(QMainWindow):
 
         # Ctrl+L: Place bracket (if enabled)
         shortcut_place = QShortcut(QKeySequence("Ctrl+L"), self)
-        shortcut_place.activated.connect(lambda: self._on_place() if self.btn_place.isEnabled() else None)
+        shortcut_place.activated.connect(self.btn_place.click)  # click() is a no-op while disabled
         self.btn_place.setToolTip("Place bracket order (Ctrl+L)")
 
         # Ctrl+S: Save draft edits (if enabled)
         shortcut_save = QShortcut(QKeySequence("Ctrl+S"), self)
-        shortcut_save.activated.connect(lambda: self._on_save_draft_edits() if self.btn_save_draft_edits.isEnabled() else None)
+        shortcut_save.activated.connect(self.btn_save_draft_edits.click)
         self.btn_save_draft_edits.setToolTip("Save draft changes (Ctrl+S)")
 
         # Ctrl+Q: Quit application
@@ -609,8 +913,42 @@ class MainWindow(QMainWindow):
         shortcut_help = QShortcut(QKeySequence("F1"), self)
         shortcut_help.activated.connect(self._show_keyboard_shortcuts)
 
+    def _enqueue_log(self, msg: str) -> None:
+        self._log_q.append(msg)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log_queue(self) -> None:
+        if not self._log_q:
+            return
+        self.log_view.append("\n".join(self._log_q))
+        self._log_q.clear()
+
+    def _set_conn_dot(self, connected: bool) -> None:
+        if connected is not self._dot_connected:
+            self._dot_connected = connected
+            self.conn_dot.setPixmap(self._pix_conn if connected else self._pix_disc)
+
+    @contextmanager
+    def _batched_ui_updates(self):
+        """Suspend repaints of the central widget until the outermost block exits."""
+        central = self.centralWidget()
+        if central is None:
+            yield
+            return
+        if self._update_depth == 0:
+            central.setUpdatesEnabled(False)
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0:
+                central.setUpdatesEnabled(True)
+                central.update()
+
     def _check_connection_health(self) -> None:
-        """Periodic check for connection health"""
+        """Handle a dropped connection (socket callback or periodic safety check)"""
         if not self.ib:
             return
 
@@ -619,11 +957,11 @@ class MainWindow(QMainWindow):
             if not is_connected and self.conn_text.text() != "Disconnected":
                 # Connection lost
                 self.logger.warning("Connection to IB Gateway lost")
-                # Use bright red that's visible in both light and dark mode
-                self.conn_dot.setStyleSheet("color: #ff5555; font-size: 16px;")
-                self.conn_text.setText("Disconnected")
-                self.status_label.setText("Connection lost")
-                self._update_workflow()
+                with self._batched_ui_updates():
+                    self._set_conn_dot(False)
+                    self.conn_text.setText("Disconnected")
+                    self.status_label.setText("Connection lost")
+                    self._update_workflow()
 
                 # Play disconnect sound
                 self._sound_player.play(SOUND_DISCONNECT)
@@ -636,23 +974,23 @@ class MainWindow(QMainWindow):
                 # Trigger auto-reconnect
                 self._reconnect_manager.on_connection_lost()
         except Exception as e:
-            self.logger.error(f"Connection health check failed: {e}")
+            self.logger.error("Connection health check failed: %s", e)
 
     def _open_folder(self, path: Path) -> None:
         try:
             QDesktopServices.openUrl(QUrl.fromLocalFile(str(path)))
         except Exception as e:
-            QMessageBox.warning(self, "Open folder failed", str(e))
+            self._warn("Open folder failed", str(e))
 
     def _open_doc(self, filename: str) -> None:
         try:
             p = resource_path(filename)
             if not p.exists():
-                QMessageBox.warning(self, "Missing doc", f"Document not found: {filename}")
+                self._warn("Missing doc", f"Document not found: {filename}")
                 return
             QDesktopServices.openUrl(QUrl.fromLocalFile(str(p)))
         except Exception as e:
-            QMessageBox.warning(self, "Open doc failed", str(e))
+            self._warn("Open doc failed", str(e))
 
     def _about(self) -> None:
         from .. import __version__, __author__
@@ -780,81 +1118,67 @@ class MainWindow(QMainWindow):
         msg.setWindowTitle("Keyboard Shortcuts")
         msg.setIcon(QMessageBox.Information)
 
-        shortcuts_text = """<h3>Keyboard Shortcuts</h3>
-
-<table style="width:100%">
-<tr><td><b>Ctrl+R</b></td><td>Refresh orders and positions</td></tr>
-<tr><td><b>Ctrl+P</b></td><td>Propose new plan for current symbol</td></tr>
-<tr><td><b>Ctrl+L</b></td><td>Place bracket order from draft</td></tr>
-<tr><td><b>Ctrl+S</b></td><td>Open Settings dialog</td></tr>
-<tr><td><b>Ctrl+Q</b></td><td>Quit application</td></tr>
-<tr><td><b>F1</b></td><td>Show this help</td></tr>
-</table>
-
-<p><i>Tip: Hover over buttons to see tooltips explaining each action.</i></p>"""
-
-        msg.setText(shortcuts_text)
+        msg.setText(_SHORTCUTS_HTML)
         msg.setTextFormat(Qt.RichText)
         msg.exec()
 
     def _open_settings(self) -> None:
         dlg = SettingsDialog(self.cfg, parent=self)
         if dlg.exec() == QDialog.Accepted and dlg.saved_config:
-            self.cfg = dlg.saved_config
+            self._set_cfg(dlg.saved_config)
             self._reload_symbol_combo(keep_current=True)
             self.logger.info("Settings saved and reloaded.")
             # Update displays and workflow
             self._update_gauges()
             self._update_risk_banner()
             self._update_workflow()
-            QMessageBox.information(self, "Settings", "Settings saved. (Reconnect if you changed IBKR host/ports/clientId.)")
+            self._info("Settings", "Settings saved. (Reconnect if you changed IBKR host/ports/clientId.)")
+
+    def _set_cfg(self, cfg: Dict[str, Any]) -> None:
+        """Install a (re)loaded config and the lookups derived from it."""
+        self.cfg = cfg
+        self._ibkr_cfg: Dict[str, Any] = cfg.setdefault("ibkr", {})
+        self._risk_cfg: Dict[str, Any] = cfg.setdefault("risk", {})
+        # symbol -> config entry; also rebuilt whenever the symbol combo reloads
+        self._symbol_index: Dict[str, Dict[str, Any]] = {s["symbol"]: s for s in cfg.get("symbols", [])}
+
+    def _save_user_config_async(self) -> None:
+        from ..core.config import dumps_user_config, write_user_config_text
+
+        def _done(fut: Future) -> None:
+            try:
+                fut.result()
+            except Exception as e:
+                self.logger.error("Failed to save user config: %s", e)
+
+        fut = self._io_pool.submit(write_user_config_text, dumps_user_config(self.cfg))
+        fut.add_done_callback(_done)
 
     def _update_window_title(self) -> None:
         """Update window title to reflect current mode"""
         from ..core.constants import AppInfo
-        mode = self.cfg.get("ibkr", {}).get("mode", "paper")
+        mode = self._ibkr_cfg.get("mode", "paper")
         mode_display = "PAPER" if mode == "paper" else "🔴 LIVE"
         self.setWindowTitle(f"{AppInfo.get_full_name()} ({mode_display})")
 
     def _update_mode_combo_style(self) -> None:
         """Style the mode combo based on selection"""
-        mode = self.mode_combo.currentText()
-        if mode == "live":
-            # Red/bold for live mode - strong warning
-            self.mode_combo.setStyleSheet("""
-                QComboBox {
-                    background-color: #ffe6e6;
-                    color: #cc0000;
-                    font-weight: bold;
-                    border: 2px solid #ff4444;
-                    padding: 5px 8px;
-                    font-size: 11pt;
-                }
-                QComboBox::drop-down {
-                    border-left: 1px solid #ff4444;
-                }
-            """)
+        live = self.mode_combo.currentText() == "live"
+        _set_style(self.mode_combo, _STYLE_MODE_LIVE if live else _STYLE_MODE_PAPER)
+
+    def _update_paper_note(self, mode: str) -> None:
+        if mode == "paper":
+            _set_text(self.paper_note, _NOTE_TEXT_PAPER)
+            _set_style(self.paper_note, _NOTE_STYLE_PAPER)
         else:
-            # Subtle gray for paper mode - neutral
-            self.mode_combo.setStyleSheet("""
-                QComboBox {
-                    background-color: #f5f5f5;
-                    color: #333333;
-                    font-weight: bold;
-                    border: 2px solid #999999;
-                    padding: 5px 8px;
-                    font-size: 11pt;
-                }
-                QComboBox::drop-down {
-                    border-left: 1px solid #999999;
-                }
-            """)
+            _set_text(self.paper_note, _NOTE_TEXT_LIVE)
+            _set_style(self.paper_note, _NOTE_STYLE_LIVE)
 
     def _on_mode_changed(self, new_mode: str) -> None:
         """Handle mode change with confirmation"""
-        old_mode = self.cfg.get("ibkr", {}).get("mode", "paper")
+        old_mode = self._ibkr_cfg.get("mode", "paper")
 
-        self.logger.info(f"Mode change requested: {old_mode} -> {new_mode}")
+        self.logger.info("Mode change requested: %s -> %s", old_mode, new_mode)
 
         # If changing to live, require strong confirmation
         if new_mode == "live" and old_mode != "live":
@@ -872,52 +1196,49 @@ class MainWindow(QMainWindow):
             return
 
         # Update config
-        if "ibkr" not in self.cfg:
-            self.cfg["ibkr"] = {}
-        self.cfg["ibkr"]["mode"] = new_mode
+        self._ibkr_cfg["mode"] = new_mode
 
-        # Save to user config
-        from ..core.config import save_user_config
-        save_user_config(self.cfg)
-        self.logger.info(f"Mode changed and saved: {new_mode}")
+        # Save to user config (serialized here, written off the GUI thread)
+        self._save_user_config_async()
+        self.logger.info("Mode changed: %s", new_mode)
 
         # Update UI
         self._update_mode_combo_style()
         self._update_window_title()
 
         # Update paper note label based on new mode
-        if new_mode == "paper":
-            self.paper_note.setText("✅ Paper Mode: Simulated trading (NetLiq often shows $1,000,000)")
-            self.paper_note.setStyleSheet("color: #006600; font-weight: bold;")
-        else:
-            self.paper_note.setText("🔴 LIVE MODE: Real money! All orders require confirmation.")
-            self.paper_note.setStyleSheet("color: #cc0000; font-weight: bold; background-color: #ffeeee; padding: 5px;")
+        self._update_paper_note(new_mode)
 
         # If connected, need to reconnect with new mode
         if self.ib and self.ib.isConnected():
-            reply = QMessageBox.question(
-                self,
-                "Reconnect Required",
-                f"Mode changed to {new_mode.upper()}.\n\nReconnect now to use the new mode?",
-                QMessageBox.Yes | QMessageBox.No
-            )
-            if reply == QMessageBox.Yes:
-                # Disconnect and reconnect
-                try:
-                    self.ib.disconnect_and_stop()
-                except Exception:
-                    pass
-                QTimer.singleShot(500, self._on_connect)
+            # Non-blocking prompt: the mode/title/note updates above paint first
+            mb = QMessageBox(self)
+            mb.setAttribute(Qt.WA_DeleteOnClose)
+            mb.setIcon(QMessageBox.Question)
+            mb.setWindowTitle("Reconnect Required")
+            mb.setText(f"Mode changed to {new_mode.upper()}.\n\nReconnect now to use the new mode?")
+            mb.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+            mb.buttonClicked.connect(lambda b: self._finish_mode_change(mb.standardButton(b) == QMessageBox.Yes))
+            mb.open()
         else:
-            QMessageBox.information(
-                self,
+            self._info(
                 "Mode Changed",
                 f"Mode changed to {new_mode.upper()}.\n\nClick Connect to use the new mode."
             )
 
-    def _confirm_live_mode_switch(self) -> bool:
-        """Show strong confirmation dialog for switching to live mode"""
-        # Create custom dialog
+    def _finish_mode_change(self, reconnect: bool) -> None:
+        if not reconnect:
+            return
+        # Disconnect and reconnect; disconnect_and_stop joins the reader thread,
+        # so the new connect can be queued straight away
+        try:
+            self.ib.disconnect_and_stop()
+        except Exception:
+            pass
+        QTimer.singleShot(0, self._on_connect)
+
+    def _build_live_confirm_dialog(self) -> Tuple[QDialog, QLineEdit, QPushButton]:
+        """Build the live-mode confirmation dialog (once; see _confirm_live_mode_switch)."""
         dlg = QDialog(self)
         dlg.setWindowTitle("⚠️ SWITCH TO LIVE MODE")
         dlg.setModal(True)
@@ -931,26 +1252,7 @@ class MainWindow(QMainWindow):
         header.setAlignment(Qt.AlignCenter)
         layout.addWidget(header)
 
-        # Warning text
-        warning_text = """<p><b>You are about to switch to LIVE trading mode.</b></p>
-
-<p><b style='color: #cc0000;'>This means:</b></p>
-<ul>
-<li>❌ Orders will be placed on your REAL account</li>
-<li>❌ Real money will be used</li>
-<li>❌ You can lose real money</li>
-<li>❌ All trades will execute for real</li>
-</ul>
-
-<p><b>Before proceeding:</b></p>
-<ul>
-<li>✓ Ensure IB Gateway is connected to live account (port 4001)</li>
-<li>✓ Verify you have sufficient funds</li>
-<li>✓ Test thoroughly in paper mode first</li>
-<li>✓ Understand you may lose money</li>
-</ul>"""
-
-        warning_label = QLabel(warning_text)
+        warning_label = QLabel(_LIVE_WARNING_HTML)
         warning_label.setTextFormat(Qt.RichText)
         warning_label.setWordWrap(True)
         layout.addWidget(warning_label)
@@ -986,40 +1288,81 @@ class MainWindow(QMainWindow):
 
         cancel_btn.clicked.connect(dlg.reject)
         confirm_btn.clicked.connect(dlg.accept)
+        return dlg, input_edit, confirm_btn
 
+    def _confirm_live_mode_switch(self) -> bool:
+        """Show strong confirmation dialog for switching to live mode"""
+        if self._live_confirm_dlg is None:
+            self._live_confirm_dlg = self._build_live_confirm_dialog()
+        dlg, input_edit, confirm_btn = self._live_confirm_dlg
+
+        # Start every showing from a blank, disabled state
+        input_edit.clear()
+        confirm_btn.setEnabled(False)
+        input_edit.setFocus()
         result = dlg.exec()
 
         if result == QDialog.Accepted and input_edit.text().strip().upper() == "LIVE":
             # Show one more final confirmation
-            final = QMessageBox.warning(
-                self,
+            final = self._show_message(
+                "_live_final_mb", QMessageBox.Warning, QMessageBox.Yes | QMessageBox.No, QMessageBox.No,
                 "Final Confirmation",
                 "Are you absolutely sure you want to switch to LIVE trading?\n\n"
                 "This is your last chance to cancel.",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
             )
             return final == QMessageBox.Yes
 
         return False
 
+    def _finalize_menu_state(self) -> None:
+        self.act_sound.setChecked(self._sound_player.enabled)
+        tray_available = self._tray_manager.is_available
+        self.act_tray.setChecked(self._tray_manager.minimize_to_tray_enabled if tray_available else False)
+        self.act_tray.setEnabled(tray_available)
+
+    # --------------------- v1.0.2 features (lazy) ---------------------
+    @property
+    def _sound_player(self):
+        return get_sound_player()
+
+    @property
+    def _trade_journal(self):
+        return get_trade_journal()
+
+    @property
+    def _alert_manager(self):
+        from ..core.alerts import get_alert_manager
+        return get_alert_manager()
+
+    @property
+    def _tray_manager(self):
+        return get_tray_manager()
+
+    @property
+    def _reconnect_manager(self):
+        return get_reconnect_manager()
+
     # --------------------- Window state ---------------------
     def _restore_settings(self) -> None:
         try:
-            g = self._settings.value("geometry")
+            # Read every stored key once and restore from the snapshot
+            snapshot = {k: self._settings.value(k) for k in self._settings.allKeys()}
+            self._stored_geometry = snapshot.get("geometry")
+            self._stored_symbol = snapshot.get("last_symbol")
+            g = snapshot.get("geometry")
             if g:
                 self.restoreGeometry(g)
-            sym = self._settings.value("last_symbol")
+            sym = snapshot.get("last_symbol")
             if sym:
-                idx = self.symbol_combo.findText(str(sym))
+                idx = self._symbol_rows.get(str(sym), -1)
                 if idx >= 0:
                     self.symbol_combo.setCurrentIndex(idx)
             # Restore sound setting
-            sound_enabled = self._settings.value("sound_enabled", True, type=bool)
+            sound_enabled = _settings_bool(snapshot.get("sound_enabled"), True)
             self._sound_player.enabled = sound_enabled
             self.act_sound.setChecked(sound_enabled)
             # Restore minimize to tray setting
-            tray_enabled = self._settings.value("minimize_to_tray", False, type=bool)
+            tray_enabled = _settings_bool(snapshot.get("minimize_to_tray"), False)
             if tray_enabled and self._tray_manager.is_available:
                 self._tray_manager.set_minimize_to_tray(True)
                 self._setup_tray_icon()
@@ -1029,8 +1372,17 @@ class MainWindow(QMainWindow):
 
     def _save_settings(self) -> None:
         try:
-            self._settings.setValue("geometry", self.saveGeometry())
-            self._settings.setValue("last_symbol", self._get_current_symbol())
+            # Only write what changed since restore; unchanged values cost a backend write each
+            geom = self.saveGeometry()
+            if geom != self._stored_geometry:
+                self._settings.setValue("geometry", geom)
+                self._stored_geometry = geom
+            sym = self._get_current_symbol()
+            if sym != self._stored_symbol:
+                self._settings.setValue("last_symbol", sym)
+                self._stored_symbol = sym
+            # Flush to disk once, on shutdown
+            self._settings.sync()
         except Exception:
             pass
 
@@ -1038,30 +1390,25 @@ class MainWindow(QMainWindow):
         if not self._draft_plan:
             return
         try:
-            import json
             backup_path = self._paths["root"] / "draft_backup.json"
-            pv = self._compute_preview()
-            backup_plan = copy.deepcopy(self._draft_plan)
+            pv = self._get_preview()
+            backup_plan = clone_plan(self._draft_plan)
             backup_plan["levels"]["entry_limit"] = pv["entry"]
             backup_plan["levels"]["stop"] = pv["stop"]
             backup_plan["levels"]["take_profit"] = pv["take"]
             backup_plan["risk"]["qty"] = pv["qty"]
             backup_plan["_backup_time"] = _ts_now()
-            backup_path.write_text(json.dumps(backup_plan, indent=2), encoding="utf-8")
+            backup_path.write_text(dumps_plan(backup_plan), encoding="utf-8")
         except Exception:
             pass
 
     def closeEvent(self, event):
         # Check for unsaved draft edits
         if self._has_unsaved_edits():
-            reply = QMessageBox.question(
-                self,
+            if not self._confirm(
                 "Unsaved Changes",
                 "You have unsaved draft edits.\n\nDo you want to exit anyway?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            if reply != QMessageBox.Yes:
+            ):
                 event.ignore()
                 return
 
@@ -1078,16 +1425,17 @@ class MainWindow(QMainWindow):
             self.ib.disconnect_and_stop()
         except Exception:
             pass
+        self._chart_pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=True)  # let pending config saves land
         super().closeEvent(event)
 
     # --------------------- Symbol reload ---------------------
     def _reload_symbol_combo(self, keep_current: bool = True) -> None:
         cur = self._get_current_symbol() if (keep_current and hasattr(self, '_symbol_data')) else ""
-        self.symbol_combo.blockSignals(True)
-        self.symbol_combo.clear()
 
-        # Store symbol data for tooltips
+        # Store symbol data for tooltips, and each symbol's row in the combo
         self._symbol_data = {}
+        self._symbol_rows: Dict[str, int] = {}
 
         # Get favorites filter
         favorites_only = hasattr(self, 'cb_favorites_only') and self.cb_favorites_only.isChecked()
@@ -1095,6 +1443,7 @@ class MainWindow(QMainWindow):
 
         # Group symbols by category
         symbols = self.cfg.get("symbols", [])
+        self._symbol_index = {s["symbol"]: s for s in symbols}
         categories = {}
         for s in symbols:
             sym_name = s["symbol"]
@@ -1113,27 +1462,43 @@ class MainWindow(QMainWindow):
             "7. Extreme Risk", "Other"
         ]
 
+        # Build the full item list first, then hand it to the combo in one call
+        texts: list[str] = []
+        header_rows: list[int] = []
+        tooltips: list[tuple[int, str]] = []
         for cat in category_order:
             if cat in categories:
-                # Add category header as disabled item
-                self.symbol_combo.addItem(f"─ {cat} ─")
-                idx = self.symbol_combo.count() - 1
-                self.symbol_combo.model().item(idx).setEnabled(False)
+                # Category header, disabled below
+                header_rows.append(len(texts))
+                texts.append(f"─ {cat} ─")
 
                 for s in categories[cat]:
                     sym_name = s["symbol"]
                     risk = s.get("risk", "Unknown")
                     desc = s.get("description", "")
-                    self.symbol_combo.addItem(sym_name)
+                    tooltips.append((len(texts), f"[{risk} Risk] {desc}"))
+                    self._symbol_rows[sym_name] = len(texts)
+                    texts.append(sym_name)
                     self._symbol_data[sym_name] = s
-                    item_idx = self.symbol_combo.count() - 1
-                    self.symbol_combo.setItemData(item_idx, f"[{risk} Risk] {desc}", Qt.ToolTipRole)
-
-        if cur:
-            idx = self.symbol_combo.findText(cur)
-            if idx >= 0:
-                self.symbol_combo.setCurrentIndex(idx)
-        self.symbol_combo.blockSignals(False)
+
+        self.symbol_combo.blockSignals(True)
+        self.symbol_combo.setUpdatesEnabled(False)
+        try:
+            self.symbol_combo.clear()
+            self.symbol_combo.addItems(texts)
+            model = self.symbol_combo.model()
+            for row in header_rows:
+                model.item(row).setEnabled(False)
+            for row, tip in tooltips:
+                self.symbol_combo.setItemData(row, tip, Qt.ToolTipRole)
+
+            if cur:
+                idx = self._symbol_rows.get(cur, -1)
+                if idx >= 0:
+                    self.symbol_combo.setCurrentIndex(idx)
+        finally:
+            self.symbol_combo.setUpdatesEnabled(True)
+            self.symbol_combo.blockSignals(False)
         # Update favorite button state
         if hasattr(self, 'btn_favorite'):
             self._update_favorite_button()
@@ -1146,28 +1511,15 @@ class MainWindow(QMainWindow):
 
     def _refresh_trades_table(self) -> None:
         """Refresh the recent trades table with color-coded P&L."""
-        from PySide6.QtGui import QColor, QBrush
-
         # Only show closed trades (not cancelled or open)
         all_trades = self._trade_journal.get_all_trades()
         trades = [t for t in all_trades if t.status == "closed"][:20]
-        self.trades_table.setRowCount(len(trades))
 
-        for row, trade in enumerate(trades):
+        rows = []
+        for trade in trades:
             # Determine colors based on P&L
             pnl = trade.realized_pnl or 0
-            if pnl > 0:
-                bg_color = QColor("#E8F5E9")  # Light green
-                pnl_color = QColor("#2E7D32")  # Dark green
-                indicator = "✓"
-            elif pnl < 0:
-                bg_color = QColor("#FFEBEE")  # Light red
-                pnl_color = QColor("#C62828")  # Dark red
-                indicator = "✗"
-            else:
-                bg_color = QColor("#FFFFFF")
-                pnl_color = QColor("#666666")
-                indicator = "—"
+            style = _TRADE_WIN if pnl > 0 else _TRADE_LOSS if pnl < 0 else _TRADE_FLAT
 
             # Format time
             try:
@@ -1175,22 +1527,39 @@ class MainWindow(QMainWindow):
             except:
                 time_str = "—"
 
-            items = [
-                QTableWidgetItem(time_str),
-                QTableWidgetItem(trade.symbol),
-                QTableWidgetItem(trade.side.upper() if trade.side else "—"),
-                QTableWidgetItem(str(trade.quantity)),
-                QTableWidgetItem(f"{indicator} ${pnl:+,.2f}"),
-                QTableWidgetItem(f"{trade.r_multiple:.1f}R" if trade.r_multiple else "—"),
-            ]
-
-            for col, item in enumerate(items):
-                item.setBackground(QBrush(bg_color))
-                if col == 4:  # P&L column
-                    item.setForeground(QBrush(pnl_color))
-                self.trades_table.setItem(row, col, item)
+            rows.append((style, (
+                time_str,
+                trade.symbol,
+                trade.side.upper() if trade.side else "—",
+                str(trade.quantity),
+                f"{style[2]} ${pnl:+,.2f}",
+                f"{trade.r_multiple:.1f}R" if trade.r_multiple else "—",
+            )))
+
+        # Called after every orders refresh; most of the time nothing changed
+        if rows == self._trades_rows:
+            return
+        self._trades_rows = rows
 
-        self.trades_table.resizeColumnsToContents()
+        table = self.trades_table
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(rows))
+            for row, ((bg_brush, pnl_brush, _), texts) in enumerate(rows):
+                for col, text in enumerate(texts):
+                    item = _read_only_item(text)
+                    item.setBackground(bg_brush)
+                    if col == 4:  # P&L column
+                        item.setForeground(pnl_brush)
+                    table.setItem(row, col, item)
+            table.resizeColumnsToContents()
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting)
 
     def _update_symbol_tooltip(self) -> None:
         sym = self._get_current_symbol()
@@ -1203,28 +1572,35 @@ class MainWindow(QMainWindow):
 
     # --------------------- UI state + helpers ---------------------
     def _on_busy_changed(self, busy: bool) -> None:
-        self.btn_cancel_task.setEnabled(busy)
-        for b in [self.btn_connect, self.btn_propose, self.btn_place, self.btn_refresh, self.btn_cancel, self.btn_cancel_all, self.btn_janitor, self.btn_view_plan, self.btn_compare, self.btn_save_draft_edits]:
-            b.setEnabled(not busy)
-        # re-apply draft dependent constraints
-        self._apply_draft_state()
+        if busy == self._last_busy:
+            return
+        self._last_busy = busy
+        with self._batched_ui_updates():
+            _set_enabled(self.btn_cancel_task, busy)
+            for b in self._busy_buttons:
+                _set_enabled(b, not busy)
+            # re-apply draft dependent constraints
+            self._apply_draft_state()
+
+            self.status_label.setText("Busy" if busy else "Idle")
+            self.task_spinner.setVisible(busy)
+            if not busy:
+                self.task_text.setText("Ready")
 
-        self.status_label.setText("Busy" if busy else "Idle")
-        self.task_spinner.setVisible(busy)
-        if not busy:
-            self.task_text.setText("Ready")
+            self._update_workflow()
 
-        self._update_workflow()
+        if not busy and self._refresh_pending:
+            self._refresh_timer.start()
 
     def _apply_draft_state(self) -> None:
         has_draft = self._draft_plan is not None
         if self.runner.busy:
-            self.btn_place.setEnabled(False)
-            self.btn_save_draft_edits.setEnabled(False)
+            _set_enabled(self.btn_place, False)
+            _set_enabled(self.btn_save_draft_edits, False)
             return
-        self.btn_place.setEnabled(has_draft and self.ib.isConnected())
-        self.btn_save_draft_edits.setEnabled(has_draft and self._has_unsaved_edits())
-        self.btn_copy_ticket.setEnabled(has_draft)
+        _set_enabled(self.btn_place, has_draft and self.ib.isConnected())
+        _set_enabled(self.btn_save_draft_edits, has_draft and self._has_unsaved_edits())
+        _set_enabled(self.btn_copy_ticket, has_draft)
 
     def _get_current_symbol(self) -> str:
         """Get the clean symbol name from the combo box (strips category prefixes)."""
@@ -1236,55 +1612,85 @@ class MainWindow(QMainWindow):
 
     def _current_symbol_cfg(self) -> Dict[str, Any]:
         sym = self._get_current_symbol()
-        # Check in cached symbol data first
-        if hasattr(self, '_symbol_data') and sym in self._symbol_data:
-            return self._symbol_data[sym]
-        # Fallback to config search
-        for s in self.cfg.get("symbols", []):
-            if s["symbol"] == sym:
-                return s
+        s = self._symbol_index.get(sym)
+        if s is not None:
+            return s
         return {"symbol": sym, "exchange": "SMART", "currency": "USD"}
 
-    def _sync_preview_from_latest(self) -> None:
+    def _latest_plan(self, sym: str, kind: str) -> Optional[Path]:
+        """latest_plan() with a short TTL; the workflow panel asks on every edit."""
+        key = (sym, kind)
+        now = time.monotonic()
+        hit = self._latest_plan_cache.get(key)
+        if hit is not None and now - hit[0] < _LATEST_PLAN_TTL_S:
+            return hit[1]
+        p = latest_plan(sym, kind)
+        self._latest_plan_cache[key] = (now, p)
+        return p
+
+    def _forget_latest_plan(self, sym: Optional[str] = None, kind: Optional[str] = None) -> None:
+        if sym is None:
+            self._latest_plan_cache.clear()
+        else:
+            self._latest_plan_cache.pop((sym, kind), None)
+
+    def _sync_preview_from_latest(self, *_args: Any) -> None:
         sym = self._get_current_symbol()
-        p = latest_plan(sym, "draft")
+        p = self._latest_plan(sym, "draft")
         self._draft_plan = None
         self._draft_baseline = None
+        self._supersede_refresh()
         self._has_open_bracket = None
         self.open_bracket_label.setText("Open bracket: unknown (refresh)")
         if p and p.exists():
             try:
-                plan = load_json(p)
+                plan = load_json_cached(p)
                 self._draft_plan = plan
                 self._show_plan(plan)
                 self.last_proposal_label.setText(f"Last proposal: {plan.get('created_at','—')}")
             except Exception as e:
-                self.logger.error(f"Failed to load draft plan for {sym}: {e}")
+                self.logger.error("Failed to load draft plan for %s: %s", sym, e)
                 self._clear_preview()
-                QMessageBox.warning(self, "Draft Load Error", f"Failed to load draft plan:\n{str(e)}\n\nPropose a new plan.")
+                self._warn("Draft Load Error", f"Failed to load draft plan:\n{str(e)}\n\nPropose a new plan.")
         else:
             self._clear_preview()
         self._apply_draft_state()
         self._update_workflow()
 
+    def _set_spins_silently(self, entry: float, stop: float, take: float, qty: int) -> None:
+        """Set the four level spinboxes without firing the edit cascade for each one."""
+        spins = (self.entry_spin, self.stop_spin, self.take_spin, self.qty_spin)
+        for w in spins:
+            w.blockSignals(True)
+        try:
+            self.entry_spin.setValue(entry)
+            self.stop_spin.setValue(stop)
+            self.take_spin.setValue(take)
+            self.qty_spin.setValue(qty)
+        finally:
+            for w in spins:
+                w.blockSignals(False)
+        self._invalidate_preview_cache()
+
     def _clear_preview(self) -> None:
-        self.lbl_symbol.setText("—")
-        self.entry_spin.setValue(0)
-        self.stop_spin.setValue(0)
-        self.take_spin.setValue(0)
-        self.qty_spin.setValue(0)
-        self.lbl_atr.setText("—")
-        self.lbl_netliq.setText("—")
-        self.lbl_est_notional.setText("—")
-        self.lbl_est_risk.setText("—")
-        self.lbl_take_r.setText("—")
-        self.pb_notional.setValue(0); self.pb_notional.setFormat("Notional usage: —")
-        self.pb_loss.setValue(0); self.pb_loss.setFormat("Loss usage: —")
-        self.unsaved_label.hide()
-        self.risk_banner.hide()
-        self.chart_label.setText('(chart will appear after Propose)')
-        self.chart_label.setPixmap(QPixmap())
-        self.preview_box.setTitle("Proposal Preview (Draft)")
+        self._last_preview_key = None
+        with self._batched_ui_updates():
+            self.lbl_symbol.setText("—")
+            self._set_spins_silently(0, 0, 0, 0)
+            self.lbl_atr.setText("—")
+            self.lbl_netliq.setText("—")
+            self.lbl_est_notional.setText("—")
+            self.lbl_est_risk.setText("—")
+            self.lbl_take_r.setText("—")
+            self.lbl_potential_profit.setText("—")
+            self.lbl_potential_loss.setText("—")
+            self.pb_notional.setValue(0); self.pb_notional.setFormat("Notional usage: —")
+            self.pb_loss.setValue(0); self.pb_loss.setFormat("Loss usage: —")
+            self.unsaved_label.hide()
+            self.risk_banner.hide()
+            # setText() drops any pixmap; a following setPixmap(QPixmap()) would wipe the text
+            self.chart_label.setText('(chart will appear after Propose)')
+            self.preview_box.setTitle("Proposal Preview (Draft)")
 
     def _risk_limits(self) -> Tuple[float, float, float, float, float]:
         net_liq = 0.0
@@ -1296,12 +1702,29 @@ class MainWindow(QMainWindow):
         if net_liq <= 0 and self._net_liq:
             net_liq = float(self._net_liq)
 
-        max_notional_pct = float(self.cfg.get("risk", {}).get("max_notional_pct", 0.05))
-        max_loss_pct = float(self.cfg.get("risk", {}).get("max_loss_pct", 0.005))
+        max_notional_pct = float(self._risk_cfg.get("max_notional_pct", 0.05))
+        max_loss_pct = float(self._risk_cfg.get("max_loss_pct", 0.005))
         max_notional = max_notional_pct * net_liq
         max_loss = max_loss_pct * net_liq
         return net_liq, max_notional_pct, max_loss_pct, max_notional, max_loss
 
+    def _invalidate_preview_cache(self, *_args: Any) -> None:
+        self._preview_cache = None
+
+    def _get_preview(self) -> Dict[str, float]:
+        # Spin edits (and _show_plan's silent updates) drop the cache, so a
+        # refresh pass reads the spinboxes once instead of once per widget
+        if self._preview_cache is None:
+            self._preview_cache = self._compute_preview()
+        return self._preview_cache
+
+    def _get_risk_limits(self) -> Tuple[float, float, float, float, float]:
+        # Holds the plan/cfg objects themselves so identity checks can't be fooled by id reuse
+        c = self._risk_cache
+        if c is None or c[0] is not self._draft_plan or c[1] != self._net_liq or c[2] is not self.cfg:
+            c = self._risk_cache = (self._draft_plan, self._net_liq, self.cfg, self._risk_limits())
+        return c[3]
+
     def _compute_preview(self) -> Dict[str, float]:
         entry = float(self.entry_spin.value())
         stop = float(self.stop_spin.value())
@@ -1342,7 +1765,7 @@ class MainWindow(QMainWindow):
             self.market_status.setText(f"Market: {msg}")
             self.market_status.setStyleSheet("color: #F44336;")
 
-    def _update_gauges(self) -> None:
+    def _update_gauges(self, pv: Optional[Dict[str, float]] = None, limits: Optional[Tuple[float, float, float, float, float]] = None) -> None:
         if not self._draft_plan:
             self.pb_notional.setValue(0); self.pb_notional.setFormat("Notional usage: —")
             self.pb_loss.setValue(0); self.pb_loss.setFormat("Loss usage: —")
@@ -1350,8 +1773,8 @@ class MainWindow(QMainWindow):
             self.lbl_potential_loss.setText("—")
             return
 
-        pv = self._compute_preview()
-        net_liq, max_notional_pct, max_loss_pct, max_notional, max_loss = self._risk_limits()
+        pv = pv or self._get_preview()
+        net_liq, max_notional_pct, max_loss_pct, max_notional, max_loss = limits or self._get_risk_limits()
 
         # Update P&L estimates
         self.lbl_potential_profit.setText(f"+${pv['potential_profit']:,.2f}")
@@ -1365,27 +1788,15 @@ class MainWindow(QMainWindow):
         notional_pct = (pv["est_notional"] / max_notional) * 100.0
         loss_pct = (pv["est_risk"] / max_loss) * 100.0
 
-        self.pb_notional.setValue(int(min(max(notional_pct, 0.0), 100.0)))
-        self.pb_loss.setValue(int(min(max(loss_pct, 0.0), 100.0)))
-
-        self.pb_notional.setFormat(f"Notional usage: {notional_pct:.1f}% (max {max_notional_pct*100:.2f}% NetLiq)")
-        self.pb_loss.setFormat(f"Loss usage: {loss_pct:.1f}% (max {max_loss_pct*100:.2f}% NetLiq)")
-
-        if notional_pct > 100.0:
-            self.pb_notional.setToolTip("Over limit. Override confirmation required.")
-        else:
-            self.pb_notional.setToolTip("")
-        if loss_pct > 100.0:
-            self.pb_loss.setToolTip("Over limit. Override confirmation required.")
-        else:
-            self.pb_loss.setToolTip("")
-    def _update_risk_banner(self) -> bool:
+        _set_gauge(self.pb_notional, notional_pct, _NOTIONAL_FMT.format(notional_pct, max_notional_pct * 100))
+        _set_gauge(self.pb_loss, loss_pct, _LOSS_FMT.format(loss_pct, max_loss_pct * 100))
+    def _update_risk_banner(self, pv: Optional[Dict[str, float]] = None, limits: Optional[Tuple[float, float, float, float, float]] = None) -> bool:
         if not self._draft_plan:
             self.risk_banner.hide()
             return False
 
-        pv = self._compute_preview()
-        net_liq, max_notional_pct, max_loss_pct, max_notional, max_loss = self._risk_limits()
+        pv = pv or self._get_preview()
+        net_liq, max_notional_pct, max_loss_pct, max_notional, max_loss = limits or self._get_risk_limits()
 
         # If net_liq unknown, don't warn
         if net_liq <= 0:
@@ -1410,35 +1821,65 @@ class MainWindow(QMainWindow):
         self.risk_banner.show()
         return True
 
-    def _recalc_preview_metrics(self) -> None:
-        pv = self._compute_preview()
+    def _recalc_preview_metrics(self, pv: Optional[Dict[str, float]] = None) -> None:
+        pv = pv or self._get_preview()
         self.lbl_est_notional.setText(f"{pv['est_notional']:,.2f}")
         self.lbl_est_risk.setText(f"{pv['est_risk']:,.2f}")
         self.lbl_take_r.setText(f"{pv['take_r']:.2f}")
 
-    def _has_unsaved_edits(self) -> bool:
+    def _has_unsaved_edits(self, pv: Optional[Dict[str, float]] = None) -> bool:
         if not self._draft_baseline:
             return False
-        pv = self._compute_preview()
+        pv = pv or self._preview_cache
+        if pv is not None:
+            e, st, t, q = pv["entry"], pv["stop"], pv["take"], pv["qty"]
+        else:
+            # Only four scalars are compared; no need to build a full preview
+            e, st, t, q = self.entry_spin.value(), self.stop_spin.value(), self.take_spin.value(), self.qty_spin.value()
         e0, s0, t0, q0 = self._draft_baseline
-        return (abs(pv["entry"] - e0) > 0.005) or (abs(pv["stop"] - s0) > 0.005) or (abs(pv["take"] - t0) > 0.005) or (int(pv["qty"]) != int(q0))
+        return (abs(e - e0) > 0.005) or (abs(st - s0) > 0.005) or (abs(t - t0) > 0.005) or (int(q) != int(q0))
 
-    def _update_unsaved_indicator(self) -> None:
-        if self._has_unsaved_edits():
+    def _update_unsaved_indicator(self, pv: Optional[Dict[str, float]] = None) -> None:
+        if self._has_unsaved_edits(pv):
             self.unsaved_label.setText("Unsaved edits: values differ from last saved draft.")
             self.unsaved_label.show()
         else:
             self.unsaved_label.hide()
         self._apply_draft_state()
 
+    def _schedule_preview_update(self, *_args: Any) -> None:
+        # Restarting the timer means only the last edit in a burst triggers a recompute
+        self._preview_timer.start()
+
     def _on_preview_edited(self) -> None:
-        self._recalc_preview_metrics()
-        self._update_gauges()
-        self._update_risk_banner()
-        self._update_unsaved_indicator()
-        self._update_workflow()
+        self._preview_timer.stop()
+        self._invalidate_preview_cache()
+        # Nothing to do if neither the spin values nor what they are measured against changed.
+        # The plan/cfg objects themselves are kept and compared by identity (see _get_risk_limits)
+        values = (
+            self.entry_spin.value(), self.stop_spin.value(), self.take_spin.value(), self.qty_spin.value(),
+            self.direction_combo.currentData(), self._draft_baseline, self._net_liq,
+        )
+        last = self._last_preview_key
+        if last is not None and last[0] == values and last[1] is self._draft_plan and last[2] is self.cfg:
+            return
+        self._last_preview_key = (values, self._draft_plan, self.cfg)
+        # One read of the spins and limits, shared by every widget below
+        pv = self._get_preview()
+        limits = self._get_risk_limits()
+        with self._batched_ui_updates():
+            self._recalc_preview_metrics(pv)
+            self._update_gauges(pv, limits)
+            self._update_risk_banner(pv, limits)
+            self._update_unsaved_indicator(pv)
+            self._update_workflow()
 
     def _show_plan(self, plan: Dict[str, Any]) -> None:
+        with self._batched_ui_updates():
+            self._show_plan_fields(plan)
+        self._on_preview_edited()
+
+    def _show_plan_fields(self, plan: Dict[str, Any]) -> None:
         self.lbl_symbol.setText(plan.get("symbol","—"))
         entry = float(plan["levels"].get("entry_limit", 0.0) or 0.0)
         stop = float(plan["levels"].get("stop", 0.0) or 0.0)
@@ -1446,10 +1887,8 @@ class MainWindow(QMainWindow):
         qty = int(plan["risk"].get("qty", 0) or 0)
         self._draft_baseline = (entry, stop, take, qty)
 
-        self.entry_spin.setValue(entry)
-        self.stop_spin.setValue(stop)
-        self.take_spin.setValue(take)
-        self.qty_spin.setValue(qty)
+        # Set all four values silently; one recompute runs at the end
+        self._set_spins_silently(entry, stop, take, qty)
 
         # Update direction combo to match loaded plan
         direction = plan.get("direction", "Long")
@@ -1460,6 +1899,7 @@ class MainWindow(QMainWindow):
                 self.direction_combo.setCurrentIndex(i)
                 break
         self.direction_combo.blockSignals(False)
+        self._invalidate_preview_cache()
         self._update_direction_style()
 
         # Update preview box title to show direction
@@ -1467,14 +1907,59 @@ class MainWindow(QMainWindow):
 
         self.lbl_atr.setText(f"{float(plan['levels'].get('atr',0.0) or 0.0):.4f}")
         self.lbl_netliq.setText(f"{float(plan['risk'].get('net_liq',0.0) or 0.0):,.2f}")
-        self._on_preview_edited()
+
+        thumb_rel = (plan.get("artifacts") or {}).get("thumbnail_rel")
+        if thumb_rel:
+            self._set_chart_pixmap(str(self._paths["root"] / thumb_rel))
+
+    def _message_box(self, attr: str, icon, buttons, default) -> QMessageBox:
+        """Return the cached message box stored on ``attr``, building it on first use.
+
+        A box that is already showing (e.g. a task error arriving while another
+        warning is open) can't be exec()'d again, so a one-off box is used then.
+        """
+        mb = getattr(self, attr, None)
+        if mb is not None and not mb.isVisible():
+            return mb
+        box = QMessageBox(self)
+        box.setIcon(icon)
+        box.setStandardButtons(buttons)
+        box.setDefaultButton(default)
+        if mb is None:
+            setattr(self, attr, box)
+        return box
+
+    def _show_message(self, attr: str, icon, buttons, default, title: str, text: str) -> int:
+        mb = self._message_box(attr, icon, buttons, default)
+        mb.setWindowTitle(title)
+        mb.setText(text)
+        result = mb.exec()
+        if mb is not getattr(self, attr):
+            mb.deleteLater()  # one-off box; don't keep it parented to the window
+        return result
 
     def _confirm(self, title: str, text: str) -> bool:
-        return QMessageBox.question(self, title, text, QMessageBox.Yes | QMessageBox.No, QMessageBox.No) == QMessageBox.Yes
+        yes_no = QMessageBox.Yes | QMessageBox.No
+        return self._show_message("_confirm_mb", QMessageBox.Question, yes_no, QMessageBox.No, title, text) == QMessageBox.Yes
+
+    def _warn(self, title: str, text: str) -> None:
+        self._show_message("_warn_mb", QMessageBox.Warning, QMessageBox.Ok, QMessageBox.Ok, title, text)
+
+    def _info(self, title: str, text: str) -> None:
+        self._show_message("_info_mb", QMessageBox.Information, QMessageBox.Ok, QMessageBox.Ok, title, text)
+
+    def _error(self, title: str, text: str) -> None:
+        self._show_message("_error_mb", QMessageBox.Critical, QMessageBox.Ok, QMessageBox.Ok, title, text)
 
     def _require_connected(self) -> bool:
         if not self.ib.isConnected():
-            QMessageBox.warning(self, "Not connected", "Click Connect first (IB Gateway must be running).")
+            self._warn("Not connected", "Click Connect first (IB Gateway must be running).")
+            return False
+        return True
+
+    def _require_idle(self, action: str) -> bool:
+        if self.runner.busy:
+            self._warn("Busy", f"{action} needs the current task to finish first. Please wait and try again.")
             return False
         return True
 
@@ -1493,52 +1978,65 @@ class MainWindow(QMainWindow):
         connected = self.ib.isConnected()
         has_draft = self._draft_plan is not None
         unsaved = self._has_unsaved_edits()
-        placed_p = latest_plan(sym, "placed")
+        placed_p = self._latest_plan(sym, "placed")
         has_placed = bool(placed_p and placed_p.exists())
+        mgr_running = self._manager_thread is not None
+
+        # Skip relabelling entirely when nothing the panel shows has changed
+        state = (connected, has_draft, unsaved, has_placed, self._has_open_bracket,
+                 self._last_refresh_at, mgr_running, self.runner.busy)
+        if state == self._wf_state_cache:
+            return
+        self._wf_state_cache = state
+
+        with self._batched_ui_updates():
+            self._render_workflow(connected, has_draft, unsaved, has_placed, mgr_running)
+
+    def _render_workflow(self, connected: bool, has_draft: bool, unsaved: bool,
+                         has_placed: bool, mgr_running: bool) -> None:
         open_br = self._has_open_bracket
 
-        self.wf_step1.setText(f"1) Connect to IB Gateway: {'✅' if connected else '❌'}")
-        self.wf_step2.setText(f"2) Propose draft plan: {'✅' if has_draft else '❌'}")
-        self.wf_step3.setText("3) Review / edit draft: " + ("⚠ unsaved edits" if unsaved else ("✅ reviewed" if has_draft else "—")))
-        self.wf_step4.setText("4) Place bracket: " + ("✅ placed plan exists" if has_placed else ("—" if not has_draft else "pending")))
+        _set_text(self.wf_step1, _WF1[connected])
+        _set_text(self.wf_step2, _WF2[has_draft])
+        _set_text(self.wf_step3, _WF3_UNSAVED if unsaved else _WF3[has_draft])
+        _set_text(self.wf_step4, _WF4_PLACED if has_placed else _WF4[has_draft])
         if self._last_refresh_at:
-            self.wf_step5.setText(f"5) Refresh & monitor: last refresh {self._last_refresh_at}")
+            _set_text(self.wf_step5, f"5) Refresh & monitor: last refresh {self._last_refresh_at}")
         else:
-            self.wf_step5.setText("5) Refresh & monitor: —")
-        mgr_running = self._manager_thread is not None
-        self.wf_step6.setText(f"6) Manager: {'running' if mgr_running else 'stopped'}")
-        self.wf_step7.setText("7) Janitor: on-demand")
+            _set_text(self.wf_step5, _WF5_NONE)
+        _set_text(self.wf_step6, _WF6[mgr_running])
+        _set_text(self.wf_step7, _WF7)
 
         # Next suggestion
         if self.runner.busy:
-            self.wf_next.setText("Next: wait for the current task to finish (or Cancel Current Task).")
+            _set_text(self.wf_next, "Next: wait for the current task to finish (or Cancel Current Task).")
             return
         if not connected:
-            self.wf_next.setText("Next: Click Connect (IB Gateway must be running on the configured host/port).")
+            _set_text(self.wf_next, "Next: Click Connect (IB Gateway must be running on the configured host/port).")
             return
         if not has_draft:
-            self.wf_next.setText("Next: Click Propose to generate a draft plan, then review the ticket.")
+            _set_text(self.wf_next, "Next: Click Propose to generate a draft plan, then review the ticket.")
             return
         if unsaved:
-            self.wf_next.setText("Next: Save Draft Changes (optional) to make your edits official, then Place.")
+            _set_text(self.wf_next, "Next: Save Draft Changes (optional) to make your edits official, then Place.")
             return
         if open_br is None:
-            self.wf_next.setText("Next: Click Show Orders / Refresh to confirm whether an open bracket already exists (no-duplicates safety).")
+            _set_text(self.wf_next, "Next: Click Show Orders / Refresh to confirm whether an open bracket already exists (no-duplicates safety).")
             return
         if open_br:
-            self.wf_next.setText("Next: Monitor the open bracket (Refresh), start Manager if desired, or Cancel Open Brackets.")
+            _set_text(self.wf_next, "Next: Monitor the open bracket (Refresh), start Manager if desired, or Cancel Open Brackets.")
             return
         if not has_placed:
-            self.wf_next.setText("Next: Click Place Bracket. You'll see a trade ticket confirmation before submit.")
+            _set_text(self.wf_next, "Next: Click Place Bracket. You'll see a trade ticket confirmation before submit.")
             return
-        self.wf_next.setText("Next: Refresh & monitor. Start Manager to track R-multiples and manage exits if configured.")
+        _set_text(self.wf_next, "Next: Refresh & monitor. Start Manager to track R-multiples and manage exits if configured.")
 
     # --------------------- Actions ---------------------
     def _on_connect(self) -> None:
-        mode = self.cfg["ibkr"]["mode"]
-        port = int(self.cfg["ibkr"]["port_paper"] if mode == "paper" else self.cfg["ibkr"]["port_live"])
-        host = self.cfg["ibkr"]["host"]
-        client_id = int(self.cfg["ibkr"]["client_id"])
+        mode = self._ibkr_cfg["mode"]
+        port = int(self._ibkr_cfg["port_paper"] if mode == "paper" else self._ibkr_cfg["port_live"])
+        host = self._ibkr_cfg["host"]
+        client_id = int(self._ibkr_cfg["client_id"])
 
         def work(ctx):
             ctx.progress("Connecting to IBKR…")
@@ -1550,47 +2048,41 @@ class MainWindow(QMainWindow):
         task = Task("Connect", work)
         self._wire_task_logs(task)
         task.signals.finished.connect(self._connect_done)
-        task.signals.error.connect(lambda e: QMessageBox.warning(self, "Connect failed", e))
+        task.signals.error.connect(lambda e: self._warn("Connect failed", e))
         self.runner.start(task)
 
     def _connect_done(self, res: Dict[str, Any]) -> None:
         self._net_liq = float(res["net_liq"])
-        mode = self.cfg["ibkr"]["mode"]
+        mode = self._ibkr_cfg["mode"]
         mode_display = mode.upper()
         self.netliq_label.setText(f"NetLiq: {self._net_liq:,.2f} ({mode_display})")
 
         # Update connection status indicator FIRST (before any potentially failing operations)
         self.logger.info("Connected. NetLiq=%.2f mode=%s", self._net_liq, mode)
         self._session_stats["connections"] += 1
-        # Use bright green that's visible in both light and dark mode
-        self.conn_dot.setStyleSheet("color: #00ff00; font-size: 16px;")
+        self._set_conn_dot(True)
         self.conn_text.setText(f"Connected ({mode_display})")
 
         # Play connect sound (may fail silently)
         try:
             self._sound_player.play(SOUND_CONNECT)
         except Exception as e:
-            self.logger.warning(f"Failed to play connect sound: {e}")
+            self.logger.warning("Failed to play connect sound: %s", e)
 
         # Update tray status (may fail silently)
         try:
             if self._tray_manager.is_available:
                 self._tray_manager.set_status(f"Connected ({mode_display})")
         except Exception as e:
-            self.logger.warning(f"Failed to update tray status: {e}")
+            self.logger.warning("Failed to update tray status: %s", e)
 
         # Notify reconnect manager of successful connection
         try:
             self._reconnect_manager.on_connection_success()
         except Exception as e:
-            self.logger.warning(f"Failed to notify reconnect manager: {e}")
+            self.logger.warning("Failed to notify reconnect manager: %s", e)
 
-        if mode == "paper":
-            self.paper_note.setText("✅ Paper Mode: Simulated trading (NetLiq often shows $1,000,000)")
-            self.paper_note.setStyleSheet("color: #006600; font-weight: bold;")
-        else:
-            self.paper_note.setText("🔴 LIVE MODE: Real money! All orders require confirmation.")
-            self.paper_note.setStyleSheet("color: #cc0000; font-weight: bold; background-color: #ffeeee; padding: 5px;")
+        self._update_paper_note(mode)
 
         # Start connection health monitoring
         self._connection_check_timer.start()
@@ -1615,6 +2107,7 @@ class MainWindow(QMainWindow):
         task = Task("Propose", work)
         self._wire_task_logs(task)
         def _done(r):
+            self._forget_latest_plan(r["plan"].get("symbol", ""), "draft")
             self._draft_plan = r["plan"]
             self._show_plan(r["plan"])
             self.last_proposal_label.setText(f"Last proposal: {r['plan'].get('created_at','—')}")
@@ -1622,7 +2115,7 @@ class MainWindow(QMainWindow):
             self._session_stats["proposals"] += 1
             self._update_workflow()
         task.signals.finished.connect(_done)
-        task.signals.error.connect(lambda e: (self._session_stats.__setitem__("errors", self._session_stats["errors"] + 1), QMessageBox.warning(self, "Propose failed", e)))
+        task.signals.error.connect(lambda e: (self._session_stats.__setitem__("errors", self._session_stats["errors"] + 1), self._warn("Propose failed", e)))
         self.runner.start(task)
 
     def _require_override_confirm_if_over(self, action_name: str) -> bool:
@@ -1638,10 +2131,10 @@ class MainWindow(QMainWindow):
         sym = self._get_current_symbol()
         draft_p = latest_plan(sym, "draft")
         if not draft_p:
-            QMessageBox.warning(self, "No draft", "No draft plan found. Click Propose first.")
+            self._warn("No draft", "No draft plan found. Click Propose first.")
             return
         if not self._has_unsaved_edits():
-            QMessageBox.information(self, "No changes", "Nothing changed from the last saved draft.")
+            self._info("No changes", "Nothing changed from the last saved draft.")
             return
 
         if not self._confirm("Save Draft Changes", "Save your edited entry/stop/take/qty as a NEW draft revision?"):
@@ -1653,29 +2146,29 @@ class MainWindow(QMainWindow):
         plan = load_json(draft_p)
         self._draft_plan = plan
 
-        pv = self._compute_preview()
+        pv = self._get_preview()
         entry = pv["entry"]; stop = pv["stop"]; take = pv["take"]; qty = pv["qty"]
         direction = plan.get("direction", "Long")
 
         if qty <= 0 or entry <= 0 or stop <= 0 or take <= 0:
-            QMessageBox.warning(self, "Invalid values", "Entry/Stop/Take must be > 0 and Qty must be > 0.")
+            self._warn("Invalid values", "Entry/Stop/Take must be > 0 and Qty must be > 0.")
             return
 
         # Validate price relationships based on direction
         if direction == "Short":
             if stop <= entry:
-                QMessageBox.warning(self, "Invalid stop", "Stop must be above entry for a short bracket.")
+                self._warn("Invalid stop", "Stop must be above entry for a short bracket.")
                 return
             if take >= entry:
-                QMessageBox.warning(self, "Invalid take", "Take profit must be below entry for a short bracket.")
+                self._warn("Invalid take", "Take profit must be below entry for a short bracket.")
                 return
             rps = max(stop - entry, 1e-6)
         else:
             if stop >= entry:
-                QMessageBox.warning(self, "Invalid stop", "Stop must be below entry for a long bracket.")
+                self._warn("Invalid stop", "Stop must be below entry for a long bracket.")
                 return
             if take <= entry:
-                QMessageBox.warning(self, "Invalid take", "Take profit must be above entry for a long bracket.")
+                self._warn("Invalid take", "Take profit must be above entry for a long bracket.")
                 return
             rps = max(entry - stop, 1e-6)
 
@@ -1693,41 +2186,68 @@ class MainWindow(QMainWindow):
 
         # Regenerate thumbnail to reflect edited levels (uses saved snapshot)
         fname = f"{plan.get('symbol','SYMBOL')}_draft.png"
-        out_path = self._paths["thumbs"] / fname
-        try:
-            made = save_thumbnail_from_plan(plan, out_path=out_path)
-            if made:
-                plan.setdefault("artifacts", {})["thumbnail_rel"] = f"thumbs/{fname}"
-        except Exception:
-            pass
+        snap = plan.get("data_snapshot") or {}
+        if snap.get("t") and snap.get("close"):
+            plan.setdefault("artifacts", {})["thumbnail_rel"] = f"thumbs/{fname}"
+            self._render_thumbnail_async(plan, self._paths["thumbs"] / fname)
 
         new_p = save_plan(plan, "draft")
+        self._forget_latest_plan(plan.get("symbol", ""), "draft")
         self._draft_plan = plan
         self._show_plan(plan)
-        QMessageBox.information(self, "Draft Saved", f"Saved new draft revision:\n{new_p}")
+        self._info("Draft Saved", f"Saved new draft revision:\n{new_p}")
         self._update_workflow()
 
+    def _render_thumbnail_async(self, plan: Dict[str, Any], out_path: Path) -> None:
+        """Render ``plan``'s thumbnail off the GUI thread; the worker draws a clone."""
+        def _done(fut: Future) -> None:
+            try:
+                made = fut.result()
+            except Exception as e:
+                self.logger.warning("Failed to regenerate chart thumbnail: %s", e)
+                return
+            if made:
+                self._chart_ready.emit(str(made), plan)
+
+        fut = self._chart_pool.submit(save_thumbnail_from_plan, clone_plan(plan), out_path=out_path)
+        fut.add_done_callback(_done)
+
+    def _on_chart_ready(self, path: str, plan: Dict[str, Any]) -> None:
+        # Drop renders that finished after the user moved to another draft or symbol
+        if plan is not self._draft_plan or plan.get("symbol") != self._get_current_symbol():
+            return
+        self._set_chart_pixmap(path)
+
+    def _set_chart_pixmap(self, path: str) -> None:
+        try:
+            mtime = Path(path).stat().st_mtime
+        except OSError:
+            _load_pixmap.cache_clear()  # plans/thumbs wiped externally
+            return
+        pix = _load_pixmap(path, mtime)
+        if pix.isNull():
+            return
+        self.chart_label.setText("")
+        self.chart_label.setPixmap(pix)
+
     def _on_copy_ticket(self) -> None:
         """Copy a human-readable trade ticket summary to the clipboard."""
         if not self._draft_plan:
-            QMessageBox.information(self, "No draft loaded", "Load or propose a trade first, then try again.")
+            self._info("No draft loaded", "Load or propose a trade first, then try again.")
             return
 
         # Build a temporary ticket from current UI values (does not save to disk).
-        plan = copy.deepcopy(self._draft_plan)
+        plan = clone_plan(self._draft_plan)
         try:
-            pv = self._compute_preview()
+            pv = self._get_preview()
         except Exception:
             pv = None
 
         if pv:
-            entry, stop, take, qty, _ = pv
-            plan.setdefault("levels", {})
-            plan["levels"]["entry_limit"] = entry
-            plan["levels"]["stop"] = stop
-            plan["levels"]["take_profit"] = take
-            plan.setdefault("risk", {})
-            plan["risk"]["qty"] = int(qty)
+            plan["levels"]["entry_limit"] = pv["entry"]
+            plan["levels"]["stop"] = pv["stop"]
+            plan["levels"]["take_profit"] = pv["take"]
+            plan["risk"]["qty"] = int(pv["qty"])
 
         sym = self._get_current_symbol()
         if sym and not plan.get("symbol"):
@@ -1736,7 +2256,7 @@ class MainWindow(QMainWindow):
         try:
             ticket = format_trade_ticket_summary(plan, self.cfg)
         except Exception as e:
-            QMessageBox.warning(self, "Ticket formatting error", f"Couldn't format ticket summary: {e}")
+            self._warn("Ticket formatting error", f"Couldn't format ticket summary: {e}")
             return
 
         QApplication.clipboard().setText(ticket)
@@ -1750,27 +2270,23 @@ class MainWindow(QMainWindow):
         from ..core.constants import MarketHours
         is_open, message = MarketHours.is_market_open()
         if not is_open:
-            reply = QMessageBox.question(
-                self,
+            if not self._confirm(
                 "Market Closed",
                 f"{message}\n\nLimit orders can be placed anytime, but will only fill during market hours.\n\nContinue placing order?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            if reply != QMessageBox.Yes:
+            ):
                 return
 
         sym = self._get_current_symbol()
         draft = latest_plan(sym, "draft")
         if not draft:
-            QMessageBox.warning(self, "No draft", "Propose first to create a draft plan.")
+            self._warn("No draft", "Propose first to create a draft plan.")
             return
 
         try:
-            plan = load_json(draft)
+            plan = load_json_cached(draft)
         except Exception as e:
-            self.logger.error(f"Failed to load draft plan: {e}")
-            QMessageBox.critical(self, "Draft Load Error", f"Cannot load draft plan:\n{str(e)}\n\nPropose a new plan.")
+            self.logger.error("Failed to load draft plan: %s", e)
+            self._error("Draft Load Error", f"Cannot load draft plan:\n{str(e)}\n\nPropose a new plan.")
             return
 
         self._draft_plan = plan
@@ -1784,22 +2300,22 @@ class MainWindow(QMainWindow):
         direction = plan.get("direction", "Long")
 
         if entry <= 0 or stop <= 0 or take <= 0:
-            QMessageBox.warning(self, "Invalid Prices", "Entry, stop, and take prices must all be positive.")
+            self._warn("Invalid Prices", "Entry, stop, and take prices must all be positive.")
             return
 
         # Validate price relationships
         if direction == "Long":
             if not (stop < entry < take):
-                QMessageBox.warning(
-                    self, "Invalid Price Levels",
+                self._warn(
+                    "Invalid Price Levels",
                     f"For a Long position, prices must follow: stop < entry < take\n\n"
                     f"Current: stop ({stop:.2f}) < entry ({entry:.2f}) < take ({take:.2f})"
                 )
                 return
         else:  # Short
             if not (take < entry < stop):
-                QMessageBox.warning(
-                    self, "Invalid Price Levels",
+                self._warn(
+                    "Invalid Price Levels",
                     f"For a Short position, prices must follow: take < entry < stop\n\n"
                     f"Current: take ({take:.2f}) < entry ({entry:.2f}) < stop ({stop:.2f})"
                 )
@@ -1809,15 +2325,11 @@ class MainWindow(QMainWindow):
         if last_close > 0:
             pct_diff = abs(entry - last_close) / last_close * 100
             if pct_diff > 10:
-                reply = QMessageBox.question(
-                    self,
+                if not self._confirm(
                     "Entry Price Warning",
                     f"Entry price ({entry:.2f}) is {pct_diff:.1f}% away from last close ({last_close:.2f}).\n\n"
                     "This may indicate stale data or an unusual entry.\n\nContinue anyway?",
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.No
-                )
-                if reply != QMessageBox.Yes:
+                ):
                     return
 
         if self._has_unsaved_edits():
@@ -1826,18 +2338,18 @@ class MainWindow(QMainWindow):
 
         # Build a polished trade ticket dialog for confirmation
         try:
-            mode = self.cfg["ibkr"]["mode"]
+            mode = self._ibkr_cfg["mode"]
             risk_over = self._update_risk_banner()
             dlg = TradeTicketDialog(plan, self.cfg, risk_over=risk_over, mode=mode, parent=self)
             if dlg.exec() != QDialog.Accepted:
                 return
         except Exception as e:
-            self.logger.error(f"Failed to show trade ticket dialog: {e}")
-            QMessageBox.critical(self, "Dialog Error", f"Failed to show confirmation dialog:\n{str(e)}")
+            self.logger.error("Failed to show trade ticket dialog: %s", e)
+            self._error("Dialog Error", f"Failed to show confirmation dialog:\n{str(e)}")
             return
 
         symbol_cfg = self._current_symbol_cfg()
-        block_pos = bool(self.cfg.get("risk", {}).get("no_dupe_block_on_position", True))
+        block_pos = bool(self._risk_cfg.get("no_dupe_block_on_position", True))
 
         def work(ctx):
             try:
@@ -1850,7 +2362,8 @@ class MainWindow(QMainWindow):
         task = Task("Place Bracket", work)
         self._wire_task_logs(task)
         def _done(r):
-            QMessageBox.information(self, "Placed", f"Placed plan saved:\n{r['placed_path']}\n\nRefreshing orders next…")
+            self._forget_latest_plan(r["plan"].get("symbol", ""), "placed")
+            self._info("Placed", f"Placed plan saved:\n{r['placed_path']}\n\nRefreshing orders next…")
             self.open_bracket_label.setText("Open bracket: likely YES (refresh to confirm)")
             self._has_open_bracket = None
             self._update_workflow()
@@ -1873,146 +2386,90 @@ class MainWindow(QMainWindow):
                     plan_file=r.get("placed_path"),
                 )
             except Exception as e:
-                self.logger.warning(f"Failed to log trade to journal: {e}")
+                self.logger.warning("Failed to log trade to journal: %s", e)
 
             self._on_refresh()  # auto refresh after place
         task.signals.finished.connect(_done)
-        task.signals.error.connect(lambda e: (self._sound_player.play(SOUND_ERROR), QMessageBox.warning(self, "Place failed", e)))
+        task.signals.error.connect(lambda e: (self._sound_player.play(SOUND_ERROR), self._warn("Place failed", e)))
         self.runner.start(task)
 
     def _on_refresh(self) -> None:
+        """Schedule a refresh; calls within the debounce window share one fetch."""
+        self._refresh_timer.start()
+
+    def _do_refresh_now(self) -> None:
+        if self.runner.busy:
+            # Run once the current task finishes (see _on_busy_changed)
+            self._refresh_pending = True
+            return
+        self._refresh_pending = False
         if not self._require_connected():
             return
 
         def work(ctx):
-            return fetch_orders_and_positions(ctx, self.ib)
+            # Shape the table rows here so the UI thread only has to fill them
+            res = fetch_orders_and_positions(ctx, self.ib)
+            orders = res.get("orders", []) or []
+            positions = res.get("positions", []) or []
+            order_rows, open_bracket = order_table_rows(orders)
+            return {
+                "order_rows": order_rows,
+                "position_rows": position_table_rows(positions),
+                "open_bracket": open_bracket,
+                "orders_count": len(orders),
+                "positions_count": len(positions),
+            }
 
+        self._refresh_token += 1
+        token = self._refresh_token
         task = Task("Refresh", work)
         self._wire_task_logs(task)
-        task.signals.finished.connect(self._refresh_done)
-        task.signals.error.connect(lambda e: QMessageBox.warning(self, "Refresh failed", e))
+        task.signals.finished.connect(lambda res, t=token: self._refresh_done(res) if t == self._refresh_token else None)
+        task.signals.error.connect(lambda e: self._warn("Refresh failed", e))
+        for sig in (task.signals.finished, task.signals.error, task.signals.cancelled):
+            sig.connect(lambda *_: setattr(self, "_refresh_task", None))
+        self._refresh_task = task
         self.runner.start(task)
 
+    def _supersede_refresh(self) -> None:
+        """Drop the result of any refresh still in flight and ask its worker to stop."""
+        self._refresh_token += 1
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+
     def _refresh_done(self, res: Dict[str, Any]) -> None:
         """Update the Open Orders & Positions tables from a refresh result.
 
         IMPORTANT: this method must be import-safe (no top-level code).
         """
-        orders = list(res.get("orders", []) or [])
-        positions = list(res.get("positions", []) or [])
-
-        # ---- Orders table ----
-        # Bracket-friendly grouping: parent (parentId==0) followed by children (parentId==parent.orderId)
-        from collections import defaultdict
-
-        parents: dict[int, Any] = {}
-        children_by_parent: dict[int, list[Any]] = defaultdict(list)
-        top_level: list[Any] = []
-
-        for o in orders:
-            try:
-                pid = int(getattr(o, "parentId", 0) or 0)
-            except Exception:
-                pid = 0
-            try:
-                oid = int(getattr(o, "orderId", 0) or 0)
-            except Exception:
-                oid = 0
-
-            if pid:
-                children_by_parent[pid].append(o)
-            else:
-                parents[oid] = o
-                top_level.append(o)
-
-        # Build display list with indentation levels
-        display: list[tuple[Any, int]] = []
-        for parent in top_level:
-            try:
-                poid = int(getattr(parent, "orderId", 0) or 0)
-            except Exception:
-                poid = 0
-            display.append((parent, 0))
-            for child in children_by_parent.get(poid, []):
-                display.append((child, 1))
-
-        # Orphan children (if any) — show at the end
-        for pid, kids in children_by_parent.items():
-            if pid not in parents:
-                for child in kids:
-                    display.append((child, 1))
-
-        self.orders_table.setRowCount(0)
-        self.orders_table.setRowCount(len(display))
-
-        # Determine if there is an active bracket
-        final_statuses = {"Filled", "Cancelled", "Inactive"}
-        open_bracket = False
-        for parent in top_level:
-            try:
-                poid = int(getattr(parent, "orderId", 0) or 0)
-            except Exception:
-                poid = 0
-            kids = children_by_parent.get(poid, [])
-            if not kids:
-                continue
-            # If any order in the bracket is still working, consider it open
-            for o in [parent, *kids]:
-                st = str(getattr(o, "status", "") or "")
-                if st not in final_statuses:
-                    open_bracket = True
-                    break
-            if open_bracket:
-                break
-
-        for r, (o, indent) in enumerate(display):
-            sym = str(getattr(o, "symbol", "") or "")
-            if indent:
-                sym = "↳ " + sym
-
-            action = str(getattr(o, "action", "") or "")
-            qty = getattr(o, "totalQty", "")
-            otype = str(getattr(o, "orderType", "") or "")
-            lmt = getattr(o, "lmtPrice", "")
-            aux = getattr(o, "auxPrice", "")
-            tif = str(getattr(o, "tif", "") or "")
-            status = str(getattr(o, "status", "") or "")
-            oid = getattr(o, "orderId", "")
-
-            values = [sym, action, qty, otype, lmt, aux, tif, status, oid]
-            for c, v in enumerate(values):
-                item = QTableWidgetItem(str(v))
-                self.orders_table.setItem(r, c, item)
-
+        open_bracket = bool(res.get("open_bracket"))
+        self._has_open_bracket = open_bracket
         self.open_bracket_label.setText("Open bracket: YES" if open_bracket else "Open bracket: NO")
 
-        # ---- Positions table ----
-        self.positions_table.setRowCount(0)
-        self.positions_table.setRowCount(len(positions))
-        for r, pos in enumerate(positions):
-            # positions may be dicts (from ibapi) or dataclass-like
-            if isinstance(pos, dict):
-                sym = pos.get("symbol", "")
-                qty = pos.get("position", "")
-                avg = pos.get("avgCost", "")
-                acct = pos.get("account", "")
-            else:
-                sym = getattr(pos, "symbol", "")
-                qty = getattr(pos, "position", "")
-                avg = getattr(pos, "avgCost", "")
-                acct = getattr(pos, "account", "")
+        # Tables are only filled while they can be seen; a hidden/minimized
+        # window keeps the latest rows and fills them when it is shown again
+        self._pending_tables = (res.get("order_rows", []), res.get("position_rows", []))
+        if self.isVisible() and not self.isMinimized():
+            self._flush_pending_tables()
 
-            values = [sym, qty, avg, acct]
-            for c, v in enumerate(values):
-                item = QTableWidgetItem(str(v))
-                self.positions_table.setItem(r, c, item)
+        self._last_refresh_at = datetime.now(timezone.utc)
+        self.logger.info("Refreshed: %d open orders, %d positions",
+                         res.get("orders_count", 0), res.get("positions_count", 0))
+        self._update_workflow()
 
+    def _flush_pending_tables(self) -> None:
+        if self._pending_tables is None:
+            return
+        order_rows, position_rows = self._pending_tables
+        self._pending_tables = None
+        _fill_table(self.orders_table, order_rows)
+        _fill_table(self.positions_table, position_rows)
         # Refresh trades history
         self._refresh_trades_table()
 
-        self._last_refresh_at = datetime.now(timezone.utc)
-        self._log(f"Refreshed: {len(orders)} open orders, {len(positions)} positions")
-        self._update_workflow()
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._flush_pending_tables()
 
     def _on_cancel_symbol(self) -> None:
         if not self._require_connected():
@@ -2027,13 +2484,13 @@ class MainWindow(QMainWindow):
         task = Task("Cancel Symbol", work)
         self._wire_task_logs(task)
         def _done(r):
-            QMessageBox.information(self, "Cancel", f"Attempted: {r['attempted']}\nCancel requests sent: {r['cancelled']}\n\nRefreshing orders next…")
+            self._info("Cancel", f"Attempted: {r['attempted']}\nCancel requests sent: {r['cancelled']}\n\nRefreshing orders next…")
             self._session_stats["orders_cancelled"] += r.get("cancelled", 0)
             self._has_open_bracket = None
             self._update_workflow()
             self._on_refresh()
         task.signals.finished.connect(_done)
-        task.signals.error.connect(lambda e: QMessageBox.warning(self, "Cancel failed", e))
+        task.signals.error.connect(lambda e: self._warn("Cancel failed", e))
         self.runner.start(task)
 
     def _on_cancel_all(self) -> None:
@@ -2056,10 +2513,10 @@ class MainWindow(QMainWindow):
         self._wire_task_logs(task)
         def _cancel_all_done(r):
             self._session_stats["orders_cancelled"] += r.get("active", 0)
-            QMessageBox.information(self, "Cancel All", f"Cancel requests sent for {r['active']} active orders. Refreshing next…")
+            self._info("Cancel All", f"Cancel requests sent for {r['active']} active orders. Refreshing next…")
             self._on_refresh()
         task.signals.finished.connect(_cancel_all_done)
-        task.signals.error.connect(lambda e: QMessageBox.warning(self, "Cancel all failed", e))
+        task.signals.error.connect(lambda e: self._warn("Cancel all failed", e))
         self.runner.start(task)
 
     def _on_janitor(self) -> None:
@@ -2077,15 +2534,15 @@ class MainWindow(QMainWindow):
 
         task = Task("Janitor", work)
         self._wire_task_logs(task)
-        task.signals.finished.connect(lambda r: QMessageBox.information(self, "Janitor", json.dumps(r, indent=2)))
-        task.signals.error.connect(lambda e: QMessageBox.warning(self, "Janitor failed", e))
+        task.signals.finished.connect(lambda r: self._info("Janitor", dumps_plan(r)))
+        task.signals.error.connect(lambda e: self._warn("Janitor failed", e))
         self.runner.start(task)
 
     def _on_mgr_start(self) -> None:
         if not self._require_connected():
             return
         if self._manager_thread is not None:
-            QMessageBox.warning(self, "Manager running", "Manager is already running.")
+            self._warn("Manager running", "Manager is already running.")
             return
 
         symbol_cfg = self._current_symbol_cfg()
@@ -2095,8 +2552,8 @@ class MainWindow(QMainWindow):
         self._manager_worker.moveToThread(self._manager_thread)
 
         self._manager_thread.started.connect(self._manager_worker.run)
-        self._manager_worker.log.connect(lambda m: self.logger.info("[MANAGER] %s", m))
-        self._manager_worker.stopped.connect(self._mgr_stopped)
+        self._manager_worker.log.connect(self._on_mgr_log, Qt.QueuedConnection)
+        self._manager_worker.stopped.connect(self._mgr_stopped, Qt.QueuedConnection)
 
         self._manager_thread.start()
         self.btn_mgr_start.setEnabled(False)
@@ -2105,6 +2562,9 @@ class MainWindow(QMainWindow):
         self.logger.info("Manager started.")
         self._update_workflow()
 
+    def _on_mgr_log(self, msg: str) -> None:
+        self.logger.info("[MANAGER] %s", msg)
+
     def _on_mgr_stop(self) -> None:
         if self._manager_worker is None:
             return
@@ -2133,7 +2593,7 @@ class MainWindow(QMainWindow):
         if draft_p and draft_p.exists():
             try:
                 out.append(f"DRAFT FILE: {draft_p}")
-                out.append(json.dumps(load_json(draft_p), indent=2))
+                out.append(dumps_plan(load_json_cached(draft_p)))
             except Exception as e:
                 out.append(f"DRAFT FILE: {draft_p} (failed to load: {e})")
         else:
@@ -2142,7 +2602,7 @@ class MainWindow(QMainWindow):
         if placed_p and placed_p.exists():
             try:
                 out.append(f"PLACED FILE: {placed_p}")
-                out.append(json.dumps(load_json(placed_p), indent=2))
+                out.append(dumps_plan(load_json_cached(placed_p)))
             except Exception as e:
                 out.append(f"PLACED FILE: {placed_p} (failed to load: {e})")
         else:
@@ -2175,16 +2635,16 @@ class MainWindow(QMainWindow):
         draft_p = latest_plan(sym, "draft")
         placed_p = latest_plan(sym, "placed")
         if not (draft_p and draft_p.exists()):
-            QMessageBox.warning(self, "No draft", "No draft plan found for this symbol.")
+            self._warn("No draft", "No draft plan found for this symbol.")
             return
         if not (placed_p and placed_p.exists()):
-            QMessageBox.warning(self, "No placed plan", "No placed plan found for this symbol.")
+            self._warn("No placed plan", "No placed plan found for this symbol.")
             return
         try:
-            draft = load_json(draft_p)
-            placed = load_json(placed_p)
+            draft = load_json_cached(draft_p)
+            placed = load_json_cached(placed_p)
         except Exception as e:
-            QMessageBox.warning(self, "Load failed", str(e))
+            self._warn("Load failed", str(e))
             return
 
         diff = compute_plan_diff(draft, placed)
@@ -2197,10 +2657,10 @@ class MainWindow(QMainWindow):
         """Setup auto-reconnect callbacks."""
         def do_connect() -> bool:
             try:
-                mode = self.cfg["ibkr"]["mode"]
-                port = int(self.cfg["ibkr"]["port_paper"] if mode == "paper" else self.cfg["ibkr"]["port_live"])
-                host = self.cfg["ibkr"]["host"]
-                client_id = int(self.cfg["ibkr"]["client_id"])
+                mode = self._ibkr_cfg["mode"]
+                port = int(self._ibkr_cfg["port_paper"] if mode == "paper" else self._ibkr_cfg["port_live"])
+                host = self._ibkr_cfg["host"]
+                client_id = int(self._ibkr_cfg["client_id"])
                 self.ib.connect_and_start(host, port, client_id, timeout=Timeouts.IBKR_STANDARD)
                 return self.ib.isConnected()
             except Exception:
@@ -2212,15 +2672,24 @@ class MainWindow(QMainWindow):
         def on_reconnect_success():
             self.logger.info("Auto-reconnect successful")
             self._sound_player.play(SOUND_CONNECT)
-            QTimer.singleShot(0, lambda: self._connect_done({"net_liq": self.ib.get_net_liq(timeout=Timeouts.IBKR_STANDARD)}))
+            # Still on the reconnect thread: fetch NetLiq here, update the UI on the GUI thread
+            try:
+                net_liq = self.ib.get_net_liq(timeout=Timeouts.IBKR_STANDARD)
+            except Exception as e:
+                self.logger.warning("Failed to fetch NetLiq after reconnect: %s", e)
+                return
+            self._reconnected.emit(float(net_liq))
 
         def on_reconnect_failed(attempt: int):
-            self.logger.warning(f"Auto-reconnect attempt {attempt} failed")
+            self.logger.warning("Auto-reconnect attempt %s failed", attempt)
 
         def on_exhausted():
             self.logger.error("All auto-reconnect attempts exhausted")
             self._sound_player.play(SOUND_ERROR)
-            QTimer.singleShot(0, lambda: QMessageBox.warning(self, "Connection Lost", "Could not reconnect to IB Gateway after multiple attempts."))
+            self._reconnect_exhausted.emit()
+
+        self._reconnected.connect(self._on_reconnected, Qt.QueuedConnection)
+        self._reconnect_exhausted.connect(self._on_reconnect_exhausted, Qt.QueuedConnection)
 
         self._reconnect_manager.set_callbacks(
             connect=do_connect,
@@ -2230,17 +2699,23 @@ class MainWindow(QMainWindow):
             on_exhausted=on_exhausted,
         )
 
+    def _on_reconnected(self, net_liq: float) -> None:
+        self._connect_done({"net_liq": net_liq})
+
+    def _on_reconnect_exhausted(self) -> None:
+        self._warn("Connection Lost", "Could not reconnect to IB Gateway after multiple attempts.")
+
     def _toggle_dark_mode(self, checked: bool) -> None:
         """Toggle dark mode on/off."""
         self._dark_mode_enabled = checked
         mode = ThemeMode.DARK if checked else ThemeMode.LIGHT
         apply_theme(mode)
-        self.logger.info(f"Dark mode {'enabled' if checked else 'disabled'}")
+        self.logger.info("Dark mode %s", 'enabled' if checked else 'disabled')
 
     def _toggle_sound(self, checked: bool) -> None:
         self._sound_player.enabled = checked
         self._settings.setValue("sound_enabled", checked)
-        self.logger.info(f"Sound notifications {'enabled' if checked else 'disabled'}")
+        self.logger.info("Sound notifications %s", 'enabled' if checked else 'disabled')
 
     def _get_favorites(self) -> list:
         favs = self._settings.value("favorite_symbols", [])
@@ -2257,11 +2732,11 @@ class MainWindow(QMainWindow):
         if symbol in favs:
             favs.remove(symbol)
             self.btn_favorite.setText("☆")
-            self.logger.info(f"Removed {symbol} from favorites")
+            self.logger.info("Removed %s from favorites", symbol)
         else:
             favs.append(symbol)
             self.btn_favorite.setText("★")
-            self.logger.info(f"Added {symbol} to favorites")
+            self.logger.info("Added %s to favorites", symbol)
         self._save_favorites(favs)
         if self.cb_favorites_only.isChecked():
             self._reload_symbol_combo(keep_current=True)
@@ -2270,7 +2745,7 @@ class MainWindow(QMainWindow):
         self._reload_symbol_combo(keep_current=True)
         self._update_favorite_button()
 
-    def _update_favorite_button(self) -> None:
+    def _update_favorite_button(self, *_args: Any) -> None:
         symbol = self._get_current_symbol()
         favs = self._get_favorites()
         if symbol and symbol in favs:
@@ -2303,7 +2778,8 @@ class MainWindow(QMainWindow):
     def _on_direction_changed(self, index: int) -> None:
         """Handle direction change (Long/Short)."""
         direction = self.direction_combo.itemData(index) or "Long"
-        self.logger.info(f"Direction changed to: {direction}")
+        self._invalidate_preview_cache()
+        self.logger.info("Direction changed to: %s", direction)
         self._update_direction_style()
         # Clear draft plan when direction changes since levels would be different
         if self._draft_plan is not None:
@@ -2340,7 +2816,7 @@ class MainWindow(QMainWindow):
         self._settings.setValue("minimize_to_tray", checked)
         if checked and self._tray_manager.is_available:
             self._setup_tray_icon()
-        self.logger.info(f"Minimize to tray {'enabled' if checked else 'disabled'}")
+        self.logger.info("Minimize to tray %s", 'enabled' if checked else 'disabled')
 
     def _setup_tray_icon(self) -> None:
         """Setup system tray icon."""
@@ -2360,7 +2836,8 @@ class MainWindow(QMainWindow):
 
     def _show_trade_journal(self) -> None:
         """Show trade journal dialog."""
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QTableWidget, QTableWidgetItem, QHBoxLayout, QPushButton, QLabel
+        from PySide6.QtWidgets import QDialog, QVBoxLayout, QTableView, QHBoxLayout, QPushButton, QLabel
+        from .widgets.table_models import RecordTableModel
 
         dlg = QDialog(self)
         dlg.setWindowTitle("Trade Journal")
@@ -2382,35 +2859,31 @@ class MainWindow(QMainWindow):
         layout.addWidget(stats_label)
 
         # Trades table
-        trades = self._trade_journal.get_all_trades()
-        table = QTableWidget(len(trades), 9)
-        table.setHorizontalHeaderLabels([
-            "ID", "Symbol", "Side", "Status", "Entry", "Exit", "Qty", "P&L", "R-Multiple"
-        ])
+        # Rows are formatted by the model (_journal_row) as the view paints them
+        # Only the newest trades are listed until "Load all" is pressed
+        total = len(self._trade_journal)
+        table = QTableView()
+        model = RecordTableModel(
+            ["ID", "Symbol", "Side", "Status", "Entry", "Exit", "Qty", "P&L", "R-Multiple"],
+            _journal_row, self._trade_journal.recent(_JOURNAL_RECENT_ROWS), parent=table,
+        )
+        table.setModel(model)
         table.setAlternatingRowColors(True)
 
-        for row, trade in enumerate(trades):
-            items = [
-                QTableWidgetItem(trade.id),
-                QTableWidgetItem(trade.symbol),
-                QTableWidgetItem(trade.side),
-                QTableWidgetItem(trade.status),
-                QTableWidgetItem(f"${trade.entry_price:.2f}"),
-                QTableWidgetItem(f"${trade.exit_price:.2f}" if trade.exit_price else "--"),
-                QTableWidgetItem(str(trade.quantity)),
-                QTableWidgetItem(f"${trade.realized_pnl:+,.2f}" if trade.realized_pnl else "--"),
-                QTableWidgetItem(f"{trade.r_multiple:.2f}R" if trade.r_multiple else "--"),
-            ]
-            for col, item in enumerate(items):
-                table.setItem(row, col, item)
-
         layout.addWidget(table)
 
         # Buttons
         btns = QHBoxLayout()
         btn_export = QPushButton("Export to CSV")
-        btn_export.clicked.connect(lambda: self._export_journal_csv())
+        btn_export.clicked.connect(self._export_journal_csv)
         btns.addWidget(btn_export)
+        if total > _JOURNAL_RECENT_ROWS:
+            btn_all = QPushButton(f"Load all ({total})")
+            def _load_all():
+                model.set_records(self._trade_journal.get_all_trades())
+                btn_all.setEnabled(False)
+            btn_all.clicked.connect(_load_all)
+            btns.addWidget(btn_all)
         btns.addStretch()
         btn_close = QPushButton("Close")
         btn_close.clicked.connect(dlg.accept)
@@ -2427,9 +2900,9 @@ class MainWindow(QMainWindow):
         path, _ = QFileDialog.getSaveFileName(self, "Export Trade Journal", "trades.csv", "CSV Files (*.csv)")
         if path:
             if self._trade_journal.export_to_csv(Path(path)):
-                QMessageBox.information(self, "Export Complete", f"Trades exported to:\n{path}")
+                self._info("Export Complete", f"Trades exported to:\n{path}")
             else:
-                QMessageBox.warning(self, "Export Failed", "Failed to export trades.")
+                self._warn("Export Failed", "Failed to export trades.")
 
     def _show_trade_stats(self) -> None:
         """Show performance analytics dialog with export options."""
@@ -2461,10 +2934,12 @@ class MainWindow(QMainWindow):
             f"Errors: {self._session_stats.get('errors', 0)}\n"
         )
 
-        QMessageBox.information(self, "Session Statistics", stats_text)
+        self._info("Session Statistics", stats_text)
 
     def _show_alerts(self) -> None:
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QTableWidget, QTableWidgetItem, QHBoxLayout, QPushButton, QLabel, QDoubleSpinBox
+        from PySide6.QtWidgets import QDialog, QVBoxLayout, QTableView, QHBoxLayout, QPushButton, QLabel, QDoubleSpinBox
+        from ..core.alerts import AlertCondition
+        from .widgets.table_models import RecordTableModel
 
         dlg = QDialog(self)
         dlg.setWindowTitle("Price Alerts")
@@ -2496,24 +2971,16 @@ class MainWindow(QMainWindow):
         layout.addLayout(add_row)
 
         # Alerts table
-        alerts = self._alert_manager.get_all_alerts()
-        table = QTableWidget(len(alerts), 5)
-        table.setHorizontalHeaderLabels(["ID", "Symbol", "Condition", "Price", "Status"])
+        def alert_row(alert):
+            return (alert.id, alert.symbol, alert.condition, f"${alert.price:.2f}", alert.status)
+
+        table = QTableView()
+        model = RecordTableModel(["ID", "Symbol", "Condition", "Price", "Status"], alert_row, parent=table)
+        table.setModel(model)
         table.setAlternatingRowColors(True)
 
         def refresh_table():
-            alerts = self._alert_manager.get_all_alerts()
-            table.setRowCount(len(alerts))
-            for row, alert in enumerate(alerts):
-                items = [
-                    QTableWidgetItem(alert.id),
-                    QTableWidgetItem(alert.symbol),
-                    QTableWidgetItem(alert.condition),
-                    QTableWidgetItem(f"${alert.price:.2f}"),
-                    QTableWidgetItem(alert.status),
-                ]
-                for col, item in enumerate(items):
-                    table.setItem(row, col, item)
+            model.set_records(self._alert_manager.get_all_alerts())
 
         refresh_table()
 
@@ -2531,7 +2998,7 @@ class MainWindow(QMainWindow):
                 self._alert_manager.add_alert(sym, cond, price)
                 refresh_table()
                 symbol_input.clear()
-                self.logger.info(f"Added alert: {sym} {cond.value} ${price:.2f}")
+                self.logger.info("Added alert: %s %s $%.2f", sym, cond.value, price)
 
         btn_add.clicked.connect(add_alert)
         layout.addWidget(table)
@@ -2553,57 +3020,68 @@ class MainWindow(QMainWindow):
 
         try:
             backup_path = create_backup(description="Manual backup")
-            QMessageBox.information(self, "Backup Created", f"Settings backed up to:\n{backup_path}")
-            self.logger.info(f"Settings backup created: {backup_path}")
+            self._info("Backup Created", f"Settings backed up to:\n{backup_path}")
+            self.logger.info("Settings backup created: %s", backup_path)
         except Exception as e:
-            QMessageBox.warning(self, "Backup Failed", f"Failed to create backup:\n{str(e)}")
+            self._warn("Backup Failed", f"Failed to create backup:\n{str(e)}")
 
     def _on_restore_settings(self) -> None:
         """Restore settings from a backup."""
         from PySide6.QtWidgets import QFileDialog
         from ..core.config_backup import restore_backup, get_backup_dir
 
+        # The restore runs as a task, and the runner takes one task at a time
+        if not self._require_idle("Restoring a backup"):
+            return
+
         backup_dir = get_backup_dir()
         path, _ = QFileDialog.getOpenFileName(
             self, "Select Backup File", str(backup_dir), "Backup Files (*.zip)"
         )
 
         if path:
-            reply = QMessageBox.question(
-                self, "Restore Backup",
+            confirmed = self._confirm(
+                "Restore Backup",
                 "This will overwrite your current settings.\n\nContinue?",
-                QMessageBox.Yes | QMessageBox.No
             )
-            if reply == QMessageBox.Yes:
-                try:
+            # A refresh may have started while the dialogs were open
+            if confirmed and self._require_idle("Restoring a backup"):
+                # Unzipping and re-reading the config happen off the GUI thread
+                def work(ctx):
                     results = restore_backup(Path(path))
-                    self.cfg = load_config()  # Reload config
-                    QMessageBox.information(
-                        self, "Restore Complete",
-                        f"Restored {len(results['restored_files'])} files.\n\nRestart the application to apply all changes."
+                    return {"results": results, "cfg": load_config()}
+
+                def _done(r):
+                    self._set_cfg(r["cfg"])
+                    self._forget_latest_plan()
+                    self._info(
+                        "Restore Complete",
+                        f"Restored {len(r['results']['restored_files'])} files.\n\nRestart the application to apply all changes."
                     )
-                except Exception as e:
-                    QMessageBox.warning(self, "Restore Failed", f"Failed to restore backup:\n{str(e)}")
+
+                task = Task("Restore Backup", work)
+                self._wire_task_logs(task)
+                task.signals.finished.connect(_done)
+                task.signals.error.connect(lambda e: self._warn("Restore Failed", f"Failed to restore backup:\n{e}"))
+                self.runner.start(task)
 
     def _check_for_updates(self) -> None:
         """Check for application updates."""
         self.logger.info("Checking for updates...")
         self.statusBar().showMessage("Checking for updates...", 3000)
 
-        def on_result(info: Optional[UpdateInfo]):
-            if info is None:
-                QTimer.singleShot(0, lambda: QMessageBox.information(
-                    self, "Update Check", "Could not check for updates.\nPlease try again later."
-                ))
-            elif info.is_update_available:
-                QTimer.singleShot(0, lambda: self._show_update_available(info))
-            else:
-                QTimer.singleShot(0, lambda: QMessageBox.information(
-                    self, "Up to Date",
-                    f"You are running the latest version ({info.current_version})."
-                ))
+        check_for_updates_async(self._update_checked.emit)
 
-        check_for_updates_async(on_result)
+    def _on_update_checked(self, info: Optional[UpdateInfo]) -> None:
+        if info is None:
+            self._info("Update Check", "Could not check for updates.\nPlease try again later.")
+        elif info.is_update_available:
+            self._show_update_available(info)
+        else:
+            self._info(
+                "Up to Date",
+                f"You are running the latest version ({info.current_version})."
+            )
 
     def _show_update_available(self, info: UpdateInfo) -> None:
         """Show update available dialog."""
@@ -2631,6 +3109,8 @@ class MainWindow(QMainWindow):
             if self.isMinimized() and self._tray_manager.minimize_to_tray_enabled:
                 # Use timer to defer hide (avoids state conflict)
                 QTimer.singleShot(0, self._minimize_to_tray_action)
+            elif not self.isMinimized():
+                self._flush_pending_tables()
 
     def _minimize_to_tray_action(self) -> None:
         self.setWindowState(Qt.WindowState.WindowNoState)
@@ -3,6 +3,14 @@ from __future__ import annotations
 from enum import Enum
 from typing import Optional
 
+try:
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QPalette
+    _qt_available = True
+except ImportError:
+    _qt_available = False
+
 
 class ThemeMode(Enum):
     LIGHT = "light"
@@ -87,147 +95,461 @@ class Spacing:
     DIALOG_HEIGHT_STANDARD = 520
 
 
+# Style strings only depend on the constant palettes above, so they are
+# built once at import; Styles/StylesDark hand back the same objects
+_LIGHT_SECONDARY_TEXT = f"color: {Colors.TEXT_SECONDARY};"
+_LIGHT_HINT_TEXT = f"color: {Colors.TEXT_HINT};"
+_LIGHT_WORKFLOW_STEP = f"color: {Colors.TEXT_PRIMARY};"
+_LIGHT_WORKFLOW_NEXT_BOX = (
+    f"margin-top: {Spacing.PADDING_MEDIUM}px; "
+    f"padding: {Spacing.PADDING_MEDIUM}px; "
+    f"border-radius: {Spacing.BORDER_RADIUS}px; "
+    f"background: {Colors.BG_INFO}; "
+    f"border: 1px solid {Colors.BG_INFO_BORDER}; "
+    f"color: {Colors.INFO};"
+)
+_LIGHT_WARNING_BANNER = (
+    f"padding: {Spacing.PADDING_MEDIUM}px; "
+    f"border-radius: {Spacing.BORDER_RADIUS}px; "
+    f"background: {Colors.BG_WARNING}; "
+    f"border: 1px solid {Colors.BG_WARNING_BORDER}; "
+    f"color: {Colors.WARNING};"
+)
+_LIGHT_ERROR_BANNER = (
+    f"padding: {Spacing.PADDING_MEDIUM}px; "
+    f"border-radius: {Spacing.BORDER_RADIUS}px; "
+    f"background: {Colors.BG_ERROR}; "
+    f"border: 1px solid {Colors.BG_ERROR_BORDER}; "
+    f"color: {Colors.ERROR};"
+)
+_LIGHT_CHART_BORDER = (
+    f"border: 1px solid {Colors.BORDER_LIGHT}; "
+    f"border-radius: {Spacing.BORDER_RADIUS}px; "
+    f"padding: {Spacing.PADDING_SMALL}px; "
+    f"color: {Colors.TEXT_SECONDARY};"
+)
+_LIGHT_CONNECTION_DOT_CONNECTED = f"color: {Colors.SUCCESS};"
+_LIGHT_CONNECTION_DOT_DISCONNECTED = f"color: {Colors.ERROR};"
+_LIGHT_UNSAVED_WARNING = f"color: {Colors.ERROR};"
+
+_DARK_SECONDARY_TEXT = f"color: {ColorsDark.TEXT_SECONDARY};"
+_DARK_HINT_TEXT = f"color: {ColorsDark.TEXT_HINT};"
+_DARK_WORKFLOW_STEP = f"color: {ColorsDark.TEXT_PRIMARY};"
+_DARK_WORKFLOW_NEXT_BOX = (
+    f"margin-top: {Spacing.PADDING_MEDIUM}px; "
+    f"padding: {Spacing.PADDING_MEDIUM}px; "
+    f"border-radius: {Spacing.BORDER_RADIUS}px; "
+    f"background: {ColorsDark.BG_INFO}; "
+    f"border: 1px solid {ColorsDark.BG_INFO_BORDER}; "
+    f"color: {ColorsDark.INFO};"
+)
+_DARK_WARNING_BANNER = (
+    f"padding: {Spacing.PADDING_MEDIUM}px; "
+    f"border-radius: {Spacing.BORDER_RADIUS}px; "
+    f"background: {ColorsDark.BG_WARNING}; "
+    f"border: 1px solid {ColorsDark.BG_WARNING_BORDER}; "
+    f"color: {ColorsDark.WARNING};"
+)
+_DARK_ERROR_BANNER = (
+    f"padding: {Spacing.PADDING_MEDIUM}px; "
+    f"border-radius: {Spacing.BORDER_RADIUS}px; "
+    f"background: {ColorsDark.BG_ERROR}; "
+    f"border: 1px solid {ColorsDark.BG_ERROR_BORDER}; "
+    f"color: {ColorsDark.ERROR};"
+)
+_DARK_CHART_BORDER = (
+    f"border: 1px solid {ColorsDark.BORDER_LIGHT}; "
+    f"border-radius: {Spacing.BORDER_RADIUS}px; "
+    f"padding: {Spacing.PADDING_SMALL}px; "
+    f"color: {ColorsDark.TEXT_SECONDARY};"
+)
+_DARK_CONNECTION_DOT_CONNECTED = f"color: {ColorsDark.SUCCESS};"
+_DARK_CONNECTION_DOT_DISCONNECTED = f"color: {ColorsDark.ERROR};"
+_DARK_UNSAVED_WARNING = f"color: {ColorsDark.ERROR};"
+
+
 class Styles:
     @staticmethod
     def secondary_text() -> str:
-        return f"color: {Colors.TEXT_SECONDARY};"
+        return _LIGHT_SECONDARY_TEXT
 
     @staticmethod
     def hint_text() -> str:
-        return f"color: {Colors.TEXT_HINT};"
+        return _LIGHT_HINT_TEXT
 
     @staticmethod
     def workflow_step() -> str:
-        return f"color: {Colors.TEXT_PRIMARY};"
+        return _LIGHT_WORKFLOW_STEP
 
     @staticmethod
     def workflow_next_box() -> str:
-        return (
-            f"margin-top: {Spacing.PADDING_MEDIUM}px; "
-            f"padding: {Spacing.PADDING_MEDIUM}px; "
-            f"border-radius: {Spacing.BORDER_RADIUS}px; "
-            f"background: {Colors.BG_INFO}; "
-            f"border: 1px solid {Colors.BG_INFO_BORDER}; "
-            f"color: {Colors.INFO};"
-        )
+        return _LIGHT_WORKFLOW_NEXT_BOX
 
     @staticmethod
     def warning_banner() -> str:
-        return (
-            f"padding: {Spacing.PADDING_MEDIUM}px; "
-            f"border-radius: {Spacing.BORDER_RADIUS}px; "
-            f"background: {Colors.BG_WARNING}; "
-            f"border: 1px solid {Colors.BG_WARNING_BORDER}; "
-            f"color: {Colors.WARNING};"
-        )
+        return _LIGHT_WARNING_BANNER
 
     @staticmethod
     def error_banner() -> str:
-        return (
-            f"padding: {Spacing.PADDING_MEDIUM}px; "
-            f"border-radius: {Spacing.BORDER_RADIUS}px; "
-            f"background: {Colors.BG_ERROR}; "
-            f"border: 1px solid {Colors.BG_ERROR_BORDER}; "
-            f"color: {Colors.ERROR};"
-        )
+        return _LIGHT_ERROR_BANNER
 
     @staticmethod
     def chart_border() -> str:
-        return (
-            f"border: 1px solid {Colors.BORDER_LIGHT}; "
-            f"border-radius: {Spacing.BORDER_RADIUS}px; "
-            f"padding: {Spacing.PADDING_SMALL}px; "
-            f"color: {Colors.TEXT_SECONDARY};"
-        )
+        return _LIGHT_CHART_BORDER
 
     @staticmethod
     def connection_dot_connected() -> str:
-        return f"color: {Colors.SUCCESS};"
+        return _LIGHT_CONNECTION_DOT_CONNECTED
 
     @staticmethod
     def connection_dot_disconnected() -> str:
-        return f"color: {Colors.ERROR};"
+        return _LIGHT_CONNECTION_DOT_DISCONNECTED
 
     @staticmethod
     def unsaved_warning() -> str:
-        return f"color: {Colors.ERROR};"
+        return _LIGHT_UNSAVED_WARNING
 
 
 class StylesDark:
-
     @staticmethod
     def secondary_text() -> str:
-        return f"color: {ColorsDark.TEXT_SECONDARY};"
+        return _DARK_SECONDARY_TEXT
 
     @staticmethod
     def hint_text() -> str:
-        return f"color: {ColorsDark.TEXT_HINT};"
+        return _DARK_HINT_TEXT
 
     @staticmethod
     def workflow_step() -> str:
-        return f"color: {ColorsDark.TEXT_PRIMARY};"
+        return _DARK_WORKFLOW_STEP
 
     @staticmethod
     def workflow_next_box() -> str:
-        return (
-            f"margin-top: {Spacing.PADDING_MEDIUM}px; "
-            f"padding: {Spacing.PADDING_MEDIUM}px; "
-            f"border-radius: {Spacing.BORDER_RADIUS}px; "
-            f"background: {ColorsDark.BG_INFO}; "
-            f"border: 1px solid {ColorsDark.BG_INFO_BORDER}; "
-            f"color: {ColorsDark.INFO};"
-        )
+        return _DARK_WORKFLOW_NEXT_BOX
 
     @staticmethod
     def warning_banner() -> str:
-        return (
-            f"padding: {Spacing.PADDING_MEDIUM}px; "
-            f"border-radius: {Spacing.BORDER_RADIUS}px; "
-            f"background: {ColorsDark.BG_WARNING}; "
-            f"border: 1px solid {ColorsDark.BG_WARNING_BORDER}; "
-            f"color: {ColorsDark.WARNING};"
-        )
+        return _DARK_WARNING_BANNER
 
     @staticmethod
     def error_banner() -> str:
-        return (
-            f"padding: {Spacing.PADDING_MEDIUM}px; "
-            f"border-radius: {Spacing.BORDER_RADIUS}px; "
-            f"background: {ColorsDark.BG_ERROR}; "
-            f"border: 1px solid {ColorsDark.BG_ERROR_BORDER}; "
-            f"color: {ColorsDark.ERROR};"
-        )
+        return _DARK_ERROR_BANNER
 
     @staticmethod
     def chart_border() -> str:
-        return (
-            f"border: 1px solid {ColorsDark.BORDER_LIGHT}; "
-            f"border-radius: {Spacing.BORDER_RADIUS}px; "
-            f"padding: {Spacing.PADDING_SMALL}px; "
-            f"color: {ColorsDark.TEXT_SECONDARY};"
-        )
+        return _DARK_CHART_BORDER
 
     @staticmethod
     def connection_dot_connected() -> str:
-        return f"color: {ColorsDark.SUCCESS};"
+        return _DARK_CONNECTION_DOT_CONNECTED
 
     @staticmethod
     def connection_dot_disconnected() -> str:
-        return f"color: {ColorsDark.ERROR};"
+        return _DARK_CONNECTION_DOT_DISCONNECTED
 
     @staticmethod
     def unsaved_warning() -> str:
-        return f"color: {ColorsDark.ERROR};"
+        return _DARK_UNSAVED_WARNING
+
+
+# Application-wide stylesheets; ThemeManager returns these shared strings
+_DARK_STYLESHEET = """
+QMainWindow, QDialog, QWidget {
+    background-color: #1e1e1e;
+    color: #e0e0e0;
+}
+
+QLabel {
+    color: #e0e0e0;
+}
+
+QPushButton {
+    background-color: #3c3c3c;
+    color: #e0e0e0;
+    border: 1px solid #555;
+    padding: 6px 12px;
+    border-radius: 4px;
+}
+
+QPushButton:hover {
+    background-color: #4a4a4a;
+}
+
+QPushButton:pressed {
+    background-color: #2a2a2a;
+}
+
+QPushButton:disabled {
+    background-color: #2d2d2d;
+    color: #666;
+}
+
+QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox {
+    background-color: #2d2d2d;
+    color: #e0e0e0;
+    border: 1px solid #555;
+    padding: 4px;
+    border-radius: 3px;
+}
+
+QComboBox {
+    background-color: #2d2d2d;
+    color: #e0e0e0;
+    border: 1px solid #555;
+    padding: 4px;
+    border-radius: 3px;
+}
+
+QComboBox::drop-down {
+    border-left: 1px solid #555;
+}
+
+QComboBox QAbstractItemView {
+    background-color: #2d2d2d;
+    color: #e0e0e0;
+    selection-background-color: #3a5f8a;
+}
+
+QGroupBox {
+    border: 1px solid #555;
+    border-radius: 4px;
+    margin-top: 8px;
+    padding-top: 8px;
+    color: #e0e0e0;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px;
+}
+
+QTableWidget {
+    background-color: #2d2d2d;
+    color: #e0e0e0;
+    gridline-color: #444;
+    border: 1px solid #555;
+}
+
+QTableWidget::item {
+    padding: 4px;
+}
+
+QTableWidget::item:selected {
+    background-color: #3a5f8a;
+}
+
+QHeaderView::section {
+    background-color: #3c3c3c;
+    color: #e0e0e0;
+    padding: 4px;
+    border: 1px solid #555;
+}
+
+QScrollBar:vertical {
+    background-color: #2d2d2d;
+    width: 12px;
+    border-radius: 6px;
+}
+
+QScrollBar::handle:vertical {
+    background-color: #555;
+    border-radius: 6px;
+    min-height: 20px;
+}
+
+QScrollBar::handle:vertical:hover {
+    background-color: #666;
+}
+
+QScrollBar:horizontal {
+    background-color: #2d2d2d;
+    height: 12px;
+    border-radius: 6px;
+}
+
+QScrollBar::handle:horizontal {
+    background-color: #555;
+    border-radius: 6px;
+    min-width: 20px;
+}
+
+QProgressBar {
+    background-color: #2d2d2d;
+    border: 1px solid #555;
+    border-radius: 4px;
+    text-align: center;
+    color: #e0e0e0;
+}
+
+QProgressBar::chunk {
+    background-color: #3a5f8a;
+    border-radius: 3px;
+}
+
+QMenuBar {
+    background-color: #2d2d2d;
+    color: #e0e0e0;
+}
+
+QMenuBar::item:selected {
+    background-color: #3a5f8a;
+}
+
+QMenu {
+    background-color: #2d2d2d;
+    color: #e0e0e0;
+    border: 1px solid #555;
+}
+
+QMenu::item:selected {
+    background-color: #3a5f8a;
+}
+
+QStatusBar {
+    background-color: #2d2d2d;
+    color: #e0e0e0;
+}
+
+QToolTip {
+    background-color: #3c3c3c;
+    color: #e0e0e0;
+    border: 1px solid #555;
+    padding: 4px;
+}
+
+QSplitter::handle {
+    background-color: #444;
+}
+
+QTabWidget::pane {
+    border: 1px solid #555;
+    background-color: #1e1e1e;
+}
+
+QTabBar::tab {
+    background-color: #2d2d2d;
+    color: #e0e0e0;
+    padding: 8px 16px;
+    border: 1px solid #555;
+}
+
+QTabBar::tab:selected {
+    background-color: #3c3c3c;
+}
+
+QCheckBox, QRadioButton {
+    color: #e0e0e0;
+}
+"""
+
+_LIGHT_STYLESHEET = """
+QMainWindow, QDialog, QWidget {
+    background-color: #f5f5f5;
+    color: #333333;
+}
+QLabel {
+    color: #333333;
+}
+QPushButton {
+    background-color: #e0e0e0;
+    color: #333333;
+    border: 1px solid #ccc;
+    padding: 6px 12px;
+    border-radius: 4px;
+}
+QPushButton:hover {
+    background-color: #d0d0d0;
+}
+QPushButton:pressed {
+    background-color: #c0c0c0;
+}
+QPushButton:disabled {
+    background-color: #f0f0f0;
+    color: #999;
+}
+QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox {
+    background-color: #ffffff;
+    color: #333333;
+    border: 1px solid #ccc;
+    padding: 4px;
+    border-radius: 3px;
+}
+QComboBox {
+    background-color: #ffffff;
+    color: #333333;
+    border: 1px solid #ccc;
+    padding: 4px;
+    border-radius: 3px;
+}
+QComboBox QAbstractItemView {
+    background-color: #ffffff;
+    color: #333333;
+    selection-background-color: #cce5ff;
+}
+QGroupBox {
+    border: 1px solid #ccc;
+    border-radius: 4px;
+    margin-top: 8px;
+    padding-top: 8px;
+    color: #333333;
+}
+QTableWidget {
+    background-color: #ffffff;
+    color: #333333;
+    gridline-color: #ddd;
+    border: 1px solid #ccc;
+}
+QTableWidget::item:selected {
+    background-color: #cce5ff;
+}
+QHeaderView::section {
+    background-color: #e8e8e8;
+    color: #333333;
+    padding: 4px;
+    border: 1px solid #ccc;
+}
+QTabWidget::pane {
+    border: 1px solid #ccc;
+    background-color: #f5f5f5;
+}
+QTabBar::tab {
+    background-color: #e0e0e0;
+    color: #333333;
+    padding: 8px 16px;
+    border: 1px solid #ccc;
+}
+QTabBar::tab:selected {
+    background-color: #f5f5f5;
+}
+QCheckBox, QRadioButton {
+    color: #333333;
+}
+QMenuBar {
+    background-color: #f5f5f5;
+    color: #333333;
+}
+QMenu {
+    background-color: #ffffff;
+    color: #333333;
+    border: 1px solid #ccc;
+}
+QMenu::item:selected {
+    background-color: #cce5ff;
+}
+"""
 
 
 class ThemeManager:
-    _instance: Optional['ThemeManager'] = None
-    _current_mode: ThemeMode = ThemeMode.LIGHT
+    """Current theme state. Use get_theme_manager() for the shared instance."""
 
-    def __new__(cls) -> 'ThemeManager':
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    def __init__(self) -> None:
+        self._current_mode = ThemeMode.LIGHT
+        # Stylesheet last handed to QApplication; see apply_theme()
+        self._last_applied: Optional[str] = None
+        # Result of _detect_system_dark_mode(); cleared on mode or palette change
+        self._system_dark: Optional[bool] = None
+        self._palette_hooked = False
 
     @property
     def mode(self) -> ThemeMode:
@@ -236,24 +558,33 @@ class ThemeManager:
     @mode.setter
     def mode(self, value: ThemeMode) -> None:
         self._current_mode = value
+        self._system_dark = None
 
     @property
     def is_dark(self) -> bool:
         if self._current_mode == ThemeMode.SYSTEM:
+            if self._system_dark is not None:
+                return self._system_dark
             return self._detect_system_dark_mode()
         return self._current_mode == ThemeMode.DARK
 
+    def _on_palette_changed(self, *_args) -> None:
+        self._system_dark = None
+
     def _detect_system_dark_mode(self) -> bool:
+        if not _qt_available:
+            return False
         try:
-            from PySide6.QtWidgets import QApplication
-            from PySide6.QtGui import QPalette
-
             app = QApplication.instance()
             if app:
+                if not self._palette_hooked:
+                    app.paletteChanged.connect(self._on_palette_changed)
+                    self._palette_hooked = True
                 palette = app.palette()
                 bg_color = palette.color(QPalette.Window)
                 # If background is dark, we're in dark mode
-                return bg_color.lightness() < 128
+                self._system_dark = bg_color.lightness() < 128
+                return self._system_dark
         except Exception:
             pass
         return False
@@ -267,292 +598,10 @@ class ThemeManager:
         return StylesDark if self.is_dark else Styles
 
     def get_dark_mode_stylesheet(self) -> str:
-        return """
-            QMainWindow, QDialog, QWidget {
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-            }
-
-            QLabel {
-                color: #e0e0e0;
-            }
-
-            QPushButton {
-                background-color: #3c3c3c;
-                color: #e0e0e0;
-                border: 1px solid #555;
-                padding: 6px 12px;
-                border-radius: 4px;
-            }
-
-            QPushButton:hover {
-                background-color: #4a4a4a;
-            }
-
-            QPushButton:pressed {
-                background-color: #2a2a2a;
-            }
-
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #666;
-            }
-
-            QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                border: 1px solid #555;
-                padding: 4px;
-                border-radius: 3px;
-            }
-
-            QComboBox {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                border: 1px solid #555;
-                padding: 4px;
-                border-radius: 3px;
-            }
-
-            QComboBox::drop-down {
-                border-left: 1px solid #555;
-            }
-
-            QComboBox QAbstractItemView {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                selection-background-color: #3a5f8a;
-            }
-
-            QGroupBox {
-                border: 1px solid #555;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-                color: #e0e0e0;
-            }
-
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-
-            QTableWidget {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                gridline-color: #444;
-                border: 1px solid #555;
-            }
-
-            QTableWidget::item {
-                padding: 4px;
-            }
-
-            QTableWidget::item:selected {
-                background-color: #3a5f8a;
-            }
-
-            QHeaderView::section {
-                background-color: #3c3c3c;
-                color: #e0e0e0;
-                padding: 4px;
-                border: 1px solid #555;
-            }
-
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 12px;
-                border-radius: 6px;
-            }
-
-            QScrollBar::handle:vertical {
-                background-color: #555;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-
-            QScrollBar::handle:vertical:hover {
-                background-color: #666;
-            }
-
-            QScrollBar:horizontal {
-                background-color: #2d2d2d;
-                height: 12px;
-                border-radius: 6px;
-            }
-
-            QScrollBar::handle:horizontal {
-                background-color: #555;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-
-            QProgressBar {
-                background-color: #2d2d2d;
-                border: 1px solid #555;
-                border-radius: 4px;
-                text-align: center;
-                color: #e0e0e0;
-            }
-
-            QProgressBar::chunk {
-                background-color: #3a5f8a;
-                border-radius: 3px;
-            }
-
-            QMenuBar {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-            }
-
-            QMenuBar::item:selected {
-                background-color: #3a5f8a;
-            }
-
-            QMenu {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                border: 1px solid #555;
-            }
-
-            QMenu::item:selected {
-                background-color: #3a5f8a;
-            }
-
-            QStatusBar {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-            }
-
-            QToolTip {
-                background-color: #3c3c3c;
-                color: #e0e0e0;
-                border: 1px solid #555;
-                padding: 4px;
-            }
-
-            QSplitter::handle {
-                background-color: #444;
-            }
-
-            QTabWidget::pane {
-                border: 1px solid #555;
-                background-color: #1e1e1e;
-            }
-
-            QTabBar::tab {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                padding: 8px 16px;
-                border: 1px solid #555;
-            }
-
-            QTabBar::tab:selected {
-                background-color: #3c3c3c;
-            }
-
-            QCheckBox, QRadioButton {
-                color: #e0e0e0;
-            }
-        """
+        return _DARK_STYLESHEET
 
     def get_light_mode_stylesheet(self) -> str:
-        return """
-            QMainWindow, QDialog, QWidget {
-                background-color: #f5f5f5;
-                color: #333333;
-            }
-            QLabel {
-                color: #333333;
-            }
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #333333;
-                border: 1px solid #ccc;
-                padding: 6px 12px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-            QPushButton:pressed {
-                background-color: #c0c0c0;
-            }
-            QPushButton:disabled {
-                background-color: #f0f0f0;
-                color: #999;
-            }
-            QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox {
-                background-color: #ffffff;
-                color: #333333;
-                border: 1px solid #ccc;
-                padding: 4px;
-                border-radius: 3px;
-            }
-            QComboBox {
-                background-color: #ffffff;
-                color: #333333;
-                border: 1px solid #ccc;
-                padding: 4px;
-                border-radius: 3px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #ffffff;
-                color: #333333;
-                selection-background-color: #cce5ff;
-            }
-            QGroupBox {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-                color: #333333;
-            }
-            QTableWidget {
-                background-color: #ffffff;
-                color: #333333;
-                gridline-color: #ddd;
-                border: 1px solid #ccc;
-            }
-            QTableWidget::item:selected {
-                background-color: #cce5ff;
-            }
-            QHeaderView::section {
-                background-color: #e8e8e8;
-                color: #333333;
-                padding: 4px;
-                border: 1px solid #ccc;
-            }
-            QTabWidget::pane {
-                border: 1px solid #ccc;
-                background-color: #f5f5f5;
-            }
-            QTabBar::tab {
-                background-color: #e0e0e0;
-                color: #333333;
-                padding: 8px 16px;
-                border: 1px solid #ccc;
-            }
-            QTabBar::tab:selected {
-                background-color: #f5f5f5;
-            }
-            QCheckBox, QRadioButton {
-                color: #333333;
-            }
-            QMenuBar {
-                background-color: #f5f5f5;
-                color: #333333;
-            }
-            QMenu {
-                background-color: #ffffff;
-                color: #333333;
-                border: 1px solid #ccc;
-            }
-            QMenu::item:selected {
-                background-color: #cce5ff;
-            }
-        """
+        return _LIGHT_STYLESHEET
 
     def get_current_stylesheet(self) -> str:
         if self.is_dark:
@@ -571,20 +620,45 @@ def get_theme_manager() -> ThemeManager:
     return _theme_manager
 
 
-def apply_theme(mode: ThemeMode) -> None:
-    try:
-        from PySide6.QtWidgets import QApplication
+# Coalesces rapid theme changes into one stylesheet application; see apply_theme()
+_apply_timer: Optional['QTimer'] = None
 
-        manager = get_theme_manager()
-        manager.mode = mode
 
+def _apply_current_stylesheet() -> None:
+    try:
         app = QApplication.instance()
         if app:
-            app.setStyleSheet(manager.get_current_stylesheet())
+            manager = get_theme_manager()
+            # setStyleSheet re-polishes every widget; skip it when nothing changed
+            sheet = manager.get_current_stylesheet()
+            if sheet is not manager._last_applied:
+                app.setStyleSheet(sheet)
+                manager._last_applied = sheet
     except Exception:
         pass
 
 
+def apply_theme(mode: ThemeMode) -> None:
+    """Switch theme mode; the stylesheet follows within one frame (~16 ms).
+
+    The first application is immediate so the window never shows unstyled.
+    """
+    global _apply_timer
+    manager = get_theme_manager()
+    manager.mode = mode
+    if not _qt_available:
+        return
+    if manager._last_applied is None or QApplication.instance() is None:
+        _apply_current_stylesheet()
+        return
+    if _apply_timer is None:
+        _apply_timer = QTimer()
+        _apply_timer.setSingleShot(True)
+        _apply_timer.setInterval(16)
+        _apply_timer.timeout.connect(_apply_current_stylesheet)
+    _apply_timer.start()
+
+
 def toggle_dark_mode() -> bool:
     manager = get_theme_manager()
     new_mode = ThemeMode.LIGHT if manager.is_dark else ThemeMode.DARK
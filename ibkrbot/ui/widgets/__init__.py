@@ -1,10 +1,32 @@
 """
 Custom widgets for IBKRBot UI.
+
+Widgets are imported on first access so importing a single submodule
+(e.g. ``widgets.table_models``) doesn't pull in every widget.
 """
-from .portfolio_widget import PortfolioWidget
-from .watchlist_widget import WatchlistWidget
+from importlib import import_module
+
+_LAZY = {
+    "PortfolioWidget": ".portfolio_widget",
+    "WatchlistWidget": ".watchlist_widget",
+    "RecordTableModel": ".table_models",
+}
 
 __all__ = [
     "PortfolioWidget",
     "WatchlistWidget",
+    "RecordTableModel",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,23 +3,49 @@ Portfolio Summary Widget for IBKRBot.
 Displays account summary, positions, and P&L at a glance.
 """
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
 
 try:
     from PySide6.QtWidgets import (
         QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
-        QTableWidget, QTableWidgetItem, QHeaderView, QProgressBar,
-        QFrame
+        QTableView, QHeaderView, QAbstractItemView, QProgressBar, QFrame
     )
     from PySide6.QtCore import Qt, Signal
-    from PySide6.QtGui import QFont, QColor
+    from PySide6.QtGui import QFont, QColor, QBrush
+    from .table_models import KeyedRowsModel
     _qt_available = True
 except ImportError:
     _qt_available = False
 
 
+# Cell formatters; prices and P&L repeat between refreshes, so results are cached
+@lru_cache(maxsize=4096)
+def _fmt_usd(x: float) -> str:
+    return f"${x:.2f}"
+
+@lru_cache(maxsize=4096)
+def _fmt_usd_signed(x: float) -> str:
+    return f"${x:+,.2f}"
+
+@lru_cache(maxsize=4096)
+def _fmt_pct_signed(x: float) -> str:
+    return f"{x:+.2f}%"
+
+
 if _qt_available:
+    _GREEN = QBrush(QColor("#0a0"))
+    _RED = QBrush(QColor("#b00"))
+
+    class PositionsModel(KeyedRowsModel):
+        """Positions table backed by preformatted rows; P&L columns are colored."""
+
+        HEADERS = ("Symbol", "Qty", "Avg Cost", "Current", "P&L", "P&L %")
+        BRUSH_COLUMNS = (4, 5)
+
     class PortfolioWidget(QWidget):
         """Widget displaying portfolio summary and positions."""
 
@@ -31,6 +57,9 @@ if _qt_available:
             self._buying_power: float = 0.0
             self._cash: float = 0.0
             self._positions: List[Dict[str, Any]] = []
+            self._positions_stale = False  # set while hidden; see showEvent()
+            # Cost basis per position (qty * avgCost); see update_positions()
+            self._cost_basis = np.zeros(0)
             self._total_pnl: float = 0.0
             self._daily_pnl: float = 0.0
 
@@ -62,6 +91,9 @@ if _qt_available:
             row2 = QHBoxLayout()
             self.daily_pnl_label = QLabel("Daily P&L: --")
             self.total_pnl_label = QLabel("Total P&L: --")
+            for label in (self.daily_pnl_label, self.total_pnl_label):
+                label.setTextFormat(Qt.PlainText)
+            self._pnl_colors: Dict[str, str] = {}  # label title -> applied color
             row2.addWidget(self.daily_pnl_label)
             row2.addWidget(self.total_pnl_label)
             row2.addStretch()
@@ -79,11 +111,14 @@ if _qt_available:
             positions_layout.addWidget(self.position_count_label)
 
             # Positions table
-            self.positions_table = QTableWidget(0, 6)
-            self.positions_table.setHorizontalHeaderLabels([
-                "Symbol", "Qty", "Avg Cost", "Current", "P&L", "P&L %"
-            ])
+            self._positions_model = PositionsModel(self)
+            self.positions_table = QTableView()
+            self.positions_table.setModel(self._positions_model)
             self.positions_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+            # Fixed row heights: no per-update row measuring
+            self.positions_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            self.positions_table.verticalHeader().setDefaultSectionSize(22)
+            self.positions_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
             self.positions_table.setAlternatingRowColors(True)
             self.positions_table.setMaximumHeight(200)
             positions_layout.addWidget(self.positions_table)
@@ -109,6 +144,7 @@ if _qt_available:
 
             # Last update timestamp
             self.last_update_label = QLabel("Last updated: Never")
+            self._last_update_text = "Last updated: Never"
             self.last_update_label.setStyleSheet("color: #666; font-size: 10px;")
             layout.addWidget(self.last_update_label)
 
@@ -134,61 +170,59 @@ if _qt_available:
             self.buying_power_label.setText(f"Buying Power: ${buying_power:,.2f}")
             self.cash_label.setText(f"Cash: ${cash:,.2f}")
 
-            # Color-code P&L
-            daily_color = "#0a0" if daily_pnl >= 0 else "#b00"
-            total_color = "#0a0" if total_pnl >= 0 else "#b00"
-            daily_sign = "+" if daily_pnl >= 0 else ""
-            total_sign = "+" if total_pnl >= 0 else ""
-
-            self.daily_pnl_label.setText(f"Daily P&L: <span style='color:{daily_color}'>{daily_sign}${daily_pnl:,.2f}</span>")
-            self.daily_pnl_label.setTextFormat(Qt.RichText)
-            self.total_pnl_label.setText(f"Total P&L: <span style='color:{total_color}'>{total_sign}${total_pnl:,.2f}</span>")
-            self.total_pnl_label.setTextFormat(Qt.RichText)
+            self._set_pnl_label(self.daily_pnl_label, "Daily P&L", daily_pnl)
+            self._set_pnl_label(self.total_pnl_label, "Total P&L", total_pnl)
 
             self._update_exposure()
             self._update_timestamp()
 
+        def _set_pnl_label(self, label: QLabel, title: str, value: float):
+            """Show a color-coded P&L value as plain text; restyle only when the sign flips."""
+            color = "#0a0" if value >= 0 else "#b00"
+            sign = "+" if value >= 0 else ""
+            label.setText(f"{title}: {sign}${value:,.2f}")
+            if self._pnl_colors.get(title) != color:
+                self._pnl_colors[title] = color
+                label.setStyleSheet(f"color: {color};")
+
         def update_positions(self, positions: List[Dict[str, Any]]):
             """Update positions table."""
             self._positions = positions
-
-            self.positions_table.setRowCount(0)
-            self.positions_table.setRowCount(len(positions))
-
-            total_position_value = 0.0
-
-            for row, pos in enumerate(positions):
-                symbol = pos.get("symbol", "")
-                qty = pos.get("position", 0)
-                avg_cost = pos.get("avgCost", 0.0)
-                current_price = pos.get("currentPrice", avg_cost)  # Fallback to avgCost
-                market_value = pos.get("marketValue", qty * current_price)
-
-                # Calculate P&L
-                cost_basis = qty * avg_cost
-                pnl = market_value - cost_basis if qty != 0 else 0
-                pnl_pct = (pnl / cost_basis * 100) if cost_basis != 0 else 0
-
-                total_position_value += abs(market_value)
-
-                # Create table items
-                items = [
-                    QTableWidgetItem(str(symbol)),
-                    QTableWidgetItem(str(qty)),
-                    QTableWidgetItem(f"${avg_cost:.2f}"),
-                    QTableWidgetItem(f"${current_price:.2f}"),
-                    QTableWidgetItem(f"${pnl:+,.2f}"),
-                    QTableWidgetItem(f"{pnl_pct:+.2f}%"),
-                ]
-
-                # Color-code P&L columns
-                pnl_color = QColor("#0a0") if pnl >= 0 else QColor("#b00")
-                items[4].setForeground(pnl_color)
-                items[5].setForeground(pnl_color)
-
-                for col, item in enumerate(items):
-                    item.setTextAlignment(Qt.AlignCenter)
-                    self.positions_table.setItem(row, col, item)
+            # Nothing to draw while hidden; showEvent() catches up
+            if not self.isVisible():
+                self._positions_stale = True
+                return
+            self._positions_stale = False
+
+            # P&L for all positions at once; missing marketValue is NaN until filled in
+            n = len(positions)
+            qty = np.fromiter((p.get("position", 0) for p in positions), dtype=np.float64, count=n)
+            avg = np.fromiter((p.get("avgCost", 0.0) for p in positions), dtype=np.float64, count=n)
+            cur = np.fromiter((p.get("currentPrice", p.get("avgCost", 0.0)) for p in positions),
+                              dtype=np.float64, count=n)  # Fallback to avgCost
+            mv = np.fromiter((p.get("marketValue", np.nan) for p in positions), dtype=np.float64, count=n)
+            mv = np.where(np.isnan(mv), qty * cur, mv)
+
+            cost = qty * avg
+            pnl = np.where(qty != 0, mv - cost, 0.0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pnl_pct = np.where(cost != 0, pnl / cost * 100, 0.0)
+            self._cost_basis = cost
+
+            rows: List[Tuple[str, ...]] = []
+            for pos, a, c, pl, pct in zip(positions, avg.tolist(), cur.tolist(), pnl.tolist(), pnl_pct.tolist()):
+                rows.append((
+                    str(pos.get("symbol", "")),
+                    str(pos.get("position", 0)),
+                    _fmt_usd(a),
+                    _fmt_usd(c),
+                    _fmt_usd_signed(pl),
+                    _fmt_pct_signed(pct),
+                ))
+            # Color-code P&L columns
+            brushes: List[QBrush] = [_GREEN if up else _RED for up in (pnl >= 0).tolist()]
+
+            self._positions_model.set_rows(rows, brushes)
 
             # Update position count
             count = len(positions)
@@ -200,6 +234,11 @@ if _qt_available:
             self._update_exposure()
             self._update_timestamp()
 
+        def showEvent(self, event):
+            if self._positions_stale:
+                self.update_positions(self._positions)
+            super().showEvent(event)
+
         def _update_exposure(self):
             """Update exposure bar based on positions."""
             if self._net_liq <= 0:
@@ -209,10 +248,7 @@ if _qt_available:
                 return
 
             # Calculate total invested
-            invested = sum(
-                abs(p.get("position", 0) * p.get("avgCost", 0))
-                for p in self._positions
-            )
+            invested = float(np.abs(self._cost_basis).sum())
 
             exposure_pct = min(100, (invested / self._net_liq) * 100)
             cash_pct = 100 - exposure_pct
@@ -226,8 +262,10 @@ if _qt_available:
 
         def _update_timestamp(self):
             """Update the last update timestamp."""
-            now = datetime.now().strftime("%H:%M:%S")
-            self.last_update_label.setText(f"Last updated: {now}")
+            text = f"Last updated: {datetime.now().strftime('%H:%M:%S')}"
+            if text != self._last_update_text:
+                self._last_update_text = text
+                self.last_update_label.setText(text)
 
         def clear(self):
             """Clear all data."""
@@ -235,6 +273,8 @@ if _qt_available:
             self._buying_power = 0.0
             self._cash = 0.0
             self._positions = []
+            self._positions_stale = False
+            self._cost_basis = np.zeros(0)
             self._total_pnl = 0.0
             self._daily_pnl = 0.0
 
@@ -243,12 +283,17 @@ if _qt_available:
             self.cash_label.setText("Cash: --")
             self.daily_pnl_label.setText("Daily P&L: --")
             self.total_pnl_label.setText("Total P&L: --")
-            self.positions_table.setRowCount(0)
+            if self._pnl_colors:
+                self._pnl_colors.clear()
+                self.daily_pnl_label.setStyleSheet("")
+                self.total_pnl_label.setStyleSheet("")
+            self._positions_model.set_rows([], [])
             self.position_count_label.setText("No open positions")
             self.exposure_bar.setValue(0)
             self.exposure_bar.setFormat("Invested: --%")
             self.exposure_detail.setText("Cash: -- | Invested: --")
             self.last_update_label.setText("Last updated: Never")
+            self._last_update_text = "Last updated: Never"
 else:
     # Stub class when Qt is not available
     class PortfolioWidget:
@@ -0,0 +1,131 @@
+"""
+Read-only table models for IBKRBot list dialogs and widgets.
+Rows are formatted on demand, so only the rows a view actually paints are built.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+    _qt_available = True
+except ImportError:
+    _qt_available = False
+
+
+if _qt_available:
+    class RecordTableModel(QAbstractTableModel):
+        """Table model over a list of records with a per-row formatter.
+
+        ``format_row(record)`` returns one display string per header; results
+        are memoized per row until ``set_records`` replaces the data.
+        """
+
+        def __init__(self, headers: Sequence[str], format_row: Callable[[Any], Tuple[str, ...]],
+                     records: Sequence[Any] = (), parent=None):
+            super().__init__(parent)
+            self._headers = list(headers)
+            self._format_row = format_row
+            self._records: List[Any] = list(records)
+            self._rows: Dict[int, Tuple[str, ...]] = {}
+
+        def set_records(self, records: Sequence[Any]) -> None:
+            self.beginResetModel()
+            self._records = list(records)
+            self._rows.clear()
+            self.endResetModel()
+
+        def rowCount(self, parent=QModelIndex()) -> int:
+            return 0 if parent.isValid() else len(self._records)
+
+        def columnCount(self, parent=QModelIndex()) -> int:
+            return 0 if parent.isValid() else len(self._headers)
+
+        def data(self, index, role=Qt.DisplayRole):
+            if role != Qt.DisplayRole or not index.isValid():
+                return None
+            r = index.row()
+            row = self._rows.get(r)
+            if row is None:
+                row = self._rows[r] = self._format_row(self._records[r])
+            return row[index.column()]
+
+        def headerData(self, section, orientation, role=Qt.DisplayRole):
+            if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+                return self._headers[section]
+            return super().headerData(section, orientation, role)
+
+    class KeyedRowsModel(QAbstractTableModel):
+        """Table model over preformatted string rows keyed by their first cell.
+
+        ``set_rows`` diffs against the current rows: changed rows get a
+        dataChanged, a single appended/removed key becomes an insert/remove,
+        and only other reorderings reset the model. ``brushes`` holds one
+        optional foreground brush per row, applied to ``BRUSH_COLUMNS``.
+        """
+
+        HEADERS: Tuple[str, ...] = ()
+        BRUSH_COLUMNS: Tuple[int, ...] = ()
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self._rows: List[Tuple[str, ...]] = []
+            self._brushes: List[Any] = []
+
+        def set_rows(self, rows: List[Tuple[str, ...]], brushes: List[Any]) -> None:
+            old = self._rows
+            old_keys = [r[0] for r in old]
+            new_keys = [r[0] for r in rows]
+            if new_keys == old_keys:
+                self._rows, self._brushes = rows, brushes
+                last = len(self.HEADERS) - 1
+                for i, (a, b) in enumerate(zip(old, rows)):
+                    if a != b:
+                        self.dataChanged.emit(self.index(i, 0), self.index(i, last))
+            elif len(new_keys) == len(old_keys) + 1 and new_keys[:-1] == old_keys:
+                n = len(old_keys)
+                self.beginInsertRows(QModelIndex(), n, n)
+                self._rows, self._brushes = rows, brushes
+                self.endInsertRows()
+            elif len(new_keys) == len(old_keys) - 1 and self._removed_at(old_keys, new_keys) is not None:
+                i = self._removed_at(old_keys, new_keys)
+                self.beginRemoveRows(QModelIndex(), i, i)
+                self._rows, self._brushes = rows, brushes
+                self.endRemoveRows()
+            else:
+                self.beginResetModel()
+                self._rows, self._brushes = rows, brushes
+                self.endResetModel()
+
+        def set_row(self, i: int, row: Tuple[str, ...], brush: Any) -> None:
+            """Replace a single row in place, emitting dataChanged only if it differs."""
+            if self._rows[i] == row and self._brushes[i] is brush:
+                return
+            self._rows[i], self._brushes[i] = row, brush
+            self.dataChanged.emit(self.index(i, 0), self.index(i, len(self.HEADERS) - 1))
+
+        @staticmethod
+        def _removed_at(old_keys: List[str], new_keys: List[str]) -> Optional[int]:
+            i = next((k for k, (a, b) in enumerate(zip(old_keys, new_keys)) if a != b), len(new_keys))
+            return i if old_keys[:i] + old_keys[i + 1:] == new_keys else None
+
+        def rowCount(self, parent=QModelIndex()) -> int:
+            return 0 if parent.isValid() else len(self._rows)
+
+        def columnCount(self, parent=QModelIndex()) -> int:
+            return 0 if parent.isValid() else len(self.HEADERS)
+
+        def data(self, index, role=Qt.DisplayRole):
+            if not index.isValid():
+                return None
+            if role == Qt.DisplayRole:
+                return self._rows[index.row()][index.column()]
+            if role == Qt.ForegroundRole and index.column() in self.BRUSH_COLUMNS:
+                return self._brushes[index.row()]
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignCenter
+            return None
+
+        def headerData(self, section, orientation, role=Qt.DisplayRole):
+            if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+                return self.HEADERS[section]
+            return super().headerData(section, orientation, role)
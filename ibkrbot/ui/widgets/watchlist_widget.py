@@ -3,25 +3,91 @@ Watchlist Widget for IBKRBot.
 Displays a list of symbols with real-time price updates.
 """
 from __future__ import annotations
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime
+from functools import lru_cache
+import sys
 import threading
 import time
 
 try:
     from PySide6.QtWidgets import (
         QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
-        QTableWidget, QTableWidgetItem, QHeaderView, QPushButton,
+        QTableView, QAbstractItemView, QHeaderView, QPushButton,
         QLineEdit, QMessageBox, QMenu
     )
-    from PySide6.QtCore import Qt, Signal, QTimer
-    from PySide6.QtGui import QFont, QColor, QAction
+    from PySide6.QtCore import Qt, Signal, QTimer, QModelIndex, QObject, QRunnable, QThreadPool
+    from PySide6.QtGui import QFont, QColor, QBrush, QAction
+    from .table_models import KeyedRowsModel
     _qt_available = True
 except ImportError:
     _qt_available = False
 
 
+# Cell formatters; quotes repeat between refreshes, so results are cached
+@lru_cache(maxsize=4096)
+def _fmt_price(x: float) -> str:
+    return f"${x:.2f}"
+
+@lru_cache(maxsize=4096)
+def _fmt_change(x: float) -> str:
+    return f"{x:+.2f}"
+
+@lru_cache(maxsize=4096)
+def _fmt_pct_signed(x: float) -> str:
+    return f"{x:+.2f}%"
+
+
+# (price, change, change_pct, last_update) shown before a symbol's first quote
+_NO_QUOTE = ('--', 0, 0, '--')
+
+
 if _qt_available:
+    _GREEN = QBrush(QColor("#0a0"))
+    _RED = QBrush(QColor("#b00"))
+
+    class WatchlistModel(KeyedRowsModel):
+        """Watchlist table backed by preformatted rows; symbols are bold."""
+
+        HEADERS = ("Symbol", "Price", "Change", "Change %", "Last Update")
+        BRUSH_COLUMNS = (2, 3)
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self._bold = QFont()
+            self._bold.setBold(True)
+
+        def data(self, index, role=Qt.DisplayRole):
+            if role == Qt.FontRole and index.isValid() and index.column() == 0:
+                return self._bold
+            return super().data(index, role)
+
+    class _FetchSignals(QObject):
+        fetched = Signal(str, object, str)  # symbol, price data, refresh stamp
+        done = Signal(str)
+
+    class _FetchJob(QRunnable):
+        """Fetch one symbol's quote on a pool thread."""
+
+        def __init__(self, symbol: str, fetcher: Callable[[str], Optional[Dict[str, Any]]],
+                     stamp: str, signals: _FetchSignals):
+            super().__init__()
+            self.symbol = symbol
+            self.fetcher = fetcher
+            self.stamp = stamp
+            self.signals = signals
+            self.setAutoDelete(True)
+
+        def run(self) -> None:
+            try:
+                data = self.fetcher(self.symbol)
+                if data:
+                    self.signals.fetched.emit(self.symbol, data, self.stamp)
+            except Exception:
+                pass
+            finally:
+                self.signals.done.emit(self.symbol)
+
     class WatchlistWidget(QWidget):
         """Widget displaying a watchlist of symbols with prices."""
 
@@ -32,11 +98,32 @@ if _qt_available:
         def __init__(self, parent=None):
             super().__init__(parent)
             self._symbols: List[str] = []
-            self._prices: Dict[str, Dict[str, Any]] = {}  # symbol -> {price, change, change_pct, ...}
+            self._symbol_index: Dict[str, int] = {}  # symbol -> row in _symbols
+            # Latest quote per row, parallel to _symbols
+            self._price: List[Any] = []
+            self._change: List[Any] = []
+            self._change_pct: List[Any] = []
+            self._last_update: List[str] = []
             self._price_fetcher: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None
             self._update_timer: Optional[QTimer] = None
             self._update_interval_ms = 60000  # Default 1 minute
 
+            # Quotes are fetched on a small private pool so slow round-trips
+            # neither block the UI nor starve the TaskRunner's global pool
+            self._fetch_pool = QThreadPool(self)
+            self._fetch_pool.setMaxThreadCount(4)
+            self._fetch_signals = _FetchSignals(self)
+            self._fetch_signals.fetched.connect(self._on_fetched)
+            self._fetch_signals.done.connect(self._on_fetch_done)
+            self._in_flight: Set[str] = set()
+
+            # Price updates repaint the table at most this often
+            self._max_redraw_rate_hz = 10
+            self._dirty_rows: Set[int] = set()  # rows with quotes not yet shown
+            self._repaint_timer = QTimer(self)
+            self._repaint_timer.setSingleShot(True)
+            self._repaint_timer.timeout.connect(self._do_repaint)
+
             self._setup_ui()
 
         def _setup_ui(self):
@@ -62,16 +149,30 @@ if _qt_available:
             layout.addLayout(header)
 
             # Watchlist table
-            self.table = QTableWidget(0, 5)
-            self.table.setHorizontalHeaderLabels([
-                "Symbol", "Price", "Change", "Change %", "Last Update"
-            ])
+            self._model = WatchlistModel(self)
+            self.table = QTableView()
+            self.table.setModel(self._model)
             self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+            # Fixed row heights: no per-update row measuring
+            self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            self.table.verticalHeader().setDefaultSectionSize(22)
+            self.table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
             self.table.setAlternatingRowColors(True)
-            self.table.setSelectionBehavior(QTableWidget.SelectRows)
+            self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
             self.table.setContextMenuPolicy(Qt.CustomContextMenu)
             self.table.customContextMenuRequested.connect(self._show_context_menu)
-            self.table.cellDoubleClicked.connect(self._on_cell_double_clicked)
+            self.table.doubleClicked.connect(self._on_cell_double_clicked)
+
+            # One context menu, retargeted on each right-click
+            self._ctx_symbol: Optional[str] = None
+            self._ctx_menu = QMenu(self)
+            self._select_action = QAction(self)
+            self._select_action.triggered.connect(self._on_ctx_select)
+            self._ctx_menu.addAction(self._select_action)
+            self._ctx_menu.addSeparator()
+            self._remove_action = QAction(self)
+            self._remove_action.triggered.connect(self._on_ctx_remove)
+            self._ctx_menu.addAction(self._remove_action)
 
             layout.addWidget(self.table)
 
@@ -94,18 +195,31 @@ if _qt_available:
 
         def set_symbols(self, symbols: List[str]):
             """Set the list of symbols to watch."""
-            self._symbols = [s.upper() for s in symbols]
+            old_index = self._symbol_index
+            old = (self._price, self._change, self._change_pct, self._last_update)
+            # Upper-case and dedup in one pass, keeping first-seen order
+            self._symbols = list(dict.fromkeys(sys.intern(s.upper()) for s in symbols))
+            self._reindex()
+            # Keep quotes for symbols that stay on the list
+            rows = [old_index.get(sym) for sym in self._symbols]
+            self._price, self._change, self._change_pct, self._last_update = (
+                [col[r] if r is not None else default for r in rows]
+                for col, default in zip(old, _NO_QUOTE)
+            )
             self._update_table()
 
         def add_symbol(self, symbol: str) -> bool:
             """Add a symbol to the watchlist."""
-            symbol = symbol.upper().strip()
+            symbol = sys.intern(symbol.upper().strip())
             if not symbol:
                 return False
-            if symbol in self._symbols:
+            if symbol in self._symbol_index:
                 return False
 
+            self._symbol_index[symbol] = len(self._symbols)
             self._symbols.append(symbol)
+            for col, default in zip(self._quote_columns(), _NO_QUOTE):
+                col.append(default)
             self._update_table()
             self.symbol_added.emit(symbol)
             return True
@@ -113,12 +227,14 @@ if _qt_available:
         def remove_symbol(self, symbol: str) -> bool:
             """Remove a symbol from the watchlist."""
             symbol = symbol.upper()
-            if symbol not in self._symbols:
+            row = self._symbol_index.get(symbol)
+            if row is None:
                 return False
 
-            self._symbols.remove(symbol)
-            if symbol in self._prices:
-                del self._prices[symbol]
+            del self._symbols[row]
+            for col in self._quote_columns():
+                del col[row]
+            self._reindex()
             self._update_table()
             self.symbol_removed.emit(symbol)
             return True
@@ -134,6 +250,8 @@ if _qt_available:
             - high: float (optional)
             - low: float (optional)
             - volume: int (optional)
+
+            The fetcher is called from worker threads, one call per symbol.
             """
             self._price_fetcher = fetcher
 
@@ -153,72 +271,86 @@ if _qt_available:
                 self._update_timer.stop()
 
         def refresh_prices(self):
-            """Refresh all prices."""
+            """Refresh all prices in the background; rows update as quotes arrive."""
             if not self._price_fetcher:
                 return
 
+            stamp = datetime.now().strftime("%H:%M:%S")
             for symbol in self._symbols:
-                try:
-                    data = self._price_fetcher(symbol)
-                    if data:
-                        data['last_update'] = datetime.now().strftime("%H:%M:%S")
-                        self._prices[symbol] = data
-                except Exception:
-                    pass
+                # Skip symbols whose previous fetch has not come back yet
+                if symbol in self._in_flight:
+                    continue
+                self._in_flight.add(symbol)
+                self._fetch_pool.start(_FetchJob(symbol, self._price_fetcher, stamp, self._fetch_signals))
+
+        def _on_fetched(self, symbol: str, data: Dict[str, Any], stamp: str):
+            # The symbol may have been removed or moved while the fetch ran
+            row = self._symbol_index.get(symbol)
+            if row is None:
+                return
+            self._store_quote(row, data, stamp)
+            self._dirty_rows.add(row)
+            self._schedule_repaint()
 
-            self._update_table()
+        def _on_fetch_done(self, symbol: str):
+            self._in_flight.discard(symbol)
 
         def update_price(self, symbol: str, price_data: Dict[str, Any]):
             """Update price for a single symbol."""
-            symbol = symbol.upper()
-            if symbol not in self._symbols:
+            row = self._symbol_index.get(symbol.upper())
+            if row is None:
                 return
 
-            price_data['last_update'] = datetime.now().strftime("%H:%M:%S")
-            self._prices[symbol] = price_data
-            self._update_table()
+            self._store_quote(row, price_data, datetime.now().strftime("%H:%M:%S"))
+            self._dirty_rows.add(row)
+            self._schedule_repaint()
 
-        def _update_table(self):
-            """Update the table display."""
-            self.table.setRowCount(0)
-            self.table.setRowCount(len(self._symbols))
-
-            for row, symbol in enumerate(self._symbols):
-                data = self._prices.get(symbol, {})
-
-                price = data.get('price', '--')
-                change = data.get('change', 0)
-                change_pct = data.get('change_pct', 0)
-                last_update = data.get('last_update', '--')
-
-                # Format values
-                price_str = f"${price:.2f}" if isinstance(price, (int, float)) else str(price)
-                change_str = f"{change:+.2f}" if isinstance(change, (int, float)) else "--"
-                change_pct_str = f"{change_pct:+.2f}%" if isinstance(change_pct, (int, float)) else "--"
-
-                items = [
-                    QTableWidgetItem(symbol),
-                    QTableWidgetItem(price_str),
-                    QTableWidgetItem(change_str),
-                    QTableWidgetItem(change_pct_str),
-                    QTableWidgetItem(last_update),
-                ]
-
-                # Color-code change columns
-                if isinstance(change, (int, float)):
-                    color = QColor("#0a0") if change >= 0 else QColor("#b00")
-                    items[2].setForeground(color)
-                    items[3].setForeground(color)
-
-                # Bold symbol
-                font = items[0].font()
-                font.setBold(True)
-                items[0].setFont(font)
-
-                for col, item in enumerate(items):
-                    item.setTextAlignment(Qt.AlignCenter)
-                    self.table.setItem(row, col, item)
+        def _quote_columns(self):
+            return (self._price, self._change, self._change_pct, self._last_update)
+
+        def _store_quote(self, row: int, data: Dict[str, Any], stamp: str):
+            self._price[row] = data.get('price', '--')
+            self._change[row] = data.get('change', 0)
+            self._change_pct[row] = data.get('change_pct', 0)
+            self._last_update[row] = stamp
+
+        def _reindex(self):
+            self._symbol_index = {sym: row for row, sym in enumerate(self._symbols)}
+
+        def _schedule_repaint(self):
+            """Coalesce price updates into one table update per redraw interval."""
+            if not self._repaint_timer.isActive():
+                self._repaint_timer.start(1000 // self._max_redraw_rate_hz)
 
+        def _do_repaint(self):
+            """Push only the rows whose quotes changed since the last repaint."""
+            # Keep the dirty rows while hidden; showEvent() flushes them
+            if not self.isVisible():
+                return
+            dirty, self._dirty_rows = self._dirty_rows, set()
+            for row in dirty:
+                if row < len(self._symbols):
+                    self._model.set_row(row, *self._format_row(row))
+
+        def showEvent(self, event):
+            if self._dirty_rows:
+                self._do_repaint()
+            super().showEvent(event)
+
+        def _format_row(self, row: int) -> Tuple[Tuple[str, ...], Optional[QBrush]]:
+            price, change, change_pct = self._price[row], self._change[row], self._change_pct[row]
+            price_str = _fmt_price(price) if isinstance(price, (int, float)) else str(price)
+            change_str = _fmt_change(change) if isinstance(change, (int, float)) else "--"
+            change_pct_str = _fmt_pct_signed(change_pct) if isinstance(change_pct, (int, float)) else "--"
+            # Color-code change columns
+            brush = (_GREEN if change >= 0 else _RED) if isinstance(change, (int, float)) else None
+            return (self._symbols[row], price_str, change_str, change_pct_str, str(self._last_update[row])), brush
+
+        def _update_table(self):
+            """Rebuild the table display after the symbol list changed."""
+            self._dirty_rows.clear()
+            formatted = [self._format_row(row) for row in range(len(self._symbols))]
+            self._model.set_rows([r for r, _ in formatted], [b for _, b in formatted])
             self.status_label.setText(f"{len(self._symbols)} symbols")
 
         def _on_add_symbol(self):
@@ -230,9 +362,10 @@ if _qt_available:
                 else:
                     QMessageBox.warning(self, "Already in Watchlist", f"{symbol} is already in the watchlist.")
 
-        def _on_cell_double_clicked(self, row: int, col: int):
+        def _on_cell_double_clicked(self, index: QModelIndex):
             """Handle double-click on a cell."""
-            if row < len(self._symbols):
+            row = index.row()
+            if 0 <= row < len(self._symbols):
                 symbol = self._symbols[row]
                 self.symbol_selected.emit(symbol)
 
@@ -243,19 +376,18 @@ if _qt_available:
                 return
 
             symbol = self._symbols[row]
-            menu = QMenu(self)
-
-            select_action = QAction(f"Select {symbol}", self)
-            select_action.triggered.connect(lambda: self.symbol_selected.emit(symbol))
-            menu.addAction(select_action)
-
-            menu.addSeparator()
-
-            remove_action = QAction(f"Remove {symbol}", self)
-            remove_action.triggered.connect(lambda: self.remove_symbol(symbol))
-            menu.addAction(remove_action)
-
-            menu.exec(self.table.mapToGlobal(pos))
+            self._ctx_symbol = symbol
+            self._select_action.setText(f"Select {symbol}")
+            self._remove_action.setText(f"Remove {symbol}")
+            self._ctx_menu.exec(self.table.mapToGlobal(pos))
+
+        def _on_ctx_select(self):
+            if self._ctx_symbol:
+                self.symbol_selected.emit(self._ctx_symbol)
+
+        def _on_ctx_remove(self):
+            if self._ctx_symbol:
+                self.remove_symbol(self._ctx_symbol)
 
         def get_symbols(self) -> List[str]:
             """Get the current list of symbols."""
@@ -1,18 +1,20 @@
 """Entry-point wrapper for both dev runs and PyInstaller builds."""
 from __future__ import annotations
 
+import os
 import sys
-from pathlib import Path
 
 def _bootstrap_path() -> None:
     # In a PyInstaller build, resources may live under sys._MEIPASS.
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-        base = Path(getattr(sys, "_MEIPASS"))  # type: ignore[attr-defined]
+        base = getattr(sys, "_MEIPASS")  # type: ignore[attr-defined]
     else:
-        base = Path(__file__).resolve().parent
+        # When run as a script the interpreter has already put the real
+        # script directory on sys.path, so no symlink resolution is needed.
+        base = os.path.dirname(os.path.abspath(__file__))
 
-    if str(base) not in sys.path:
-        sys.path.insert(0, str(base))
+    if base not in sys.path:
+        sys.path.insert(0, base)
 
 _bootstrap_path()
 
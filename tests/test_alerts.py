@@ -3,8 +3,6 @@ Unit tests for Price Alerts module.
 """
 import json
 import pytest
-import tempfile
-from pathlib import Path
 
 from ibkrbot.core.alerts import (
     AlertManager, PriceAlert, AlertCondition, AlertStatus
@@ -12,10 +10,9 @@ from ibkrbot.core.alerts import (
 
 
 @pytest.fixture
-def temp_alerts_file():
+def temp_alerts_file(tmp_path):
     """Create a temporary file for alerts storage."""
-    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-        yield Path(f.name)
+    return tmp_path / "alerts.json"
 
 
 @pytest.fixture
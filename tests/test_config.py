@@ -0,0 +1,34 @@
+"""
+Unit tests for user config persistence.
+"""
+import json
+import pytest
+
+from ibkrbot.core.config import (
+    dumps_user_config, write_user_config_text, save_user_config, load_config
+)
+
+
+@pytest.fixture
+def temp_config_path(tmp_path, monkeypatch):
+    """Point user_config_path at a temp file."""
+    path = tmp_path / "config.json"
+    monkeypatch.setattr("ibkrbot.core.config.user_config_path", lambda: path)
+    return path
+
+
+class TestSaveUserConfig:
+    """Tests for writing the user config."""
+
+    def test_save_round_trip(self, temp_config_path):
+        """Saved config is merged back over the defaults on load."""
+        save_user_config({"ibkr": {"mode": "live"}})
+        cfg = load_config()
+        assert cfg["ibkr"]["mode"] == "live"
+
+    def test_write_is_atomic(self, temp_config_path):
+        """Serialized text replaces the file and leaves no temp file behind."""
+        temp_config_path.write_text("{}", encoding="utf-8")
+        write_user_config_text(dumps_user_config({"a": 1}))
+        assert json.loads(temp_config_path.read_text(encoding="utf-8")) == {"a": 1}
+        assert list(temp_config_path.parent.iterdir()) == [temp_config_path]
@@ -1,10 +1,11 @@
 """
 Unit tests for Configuration Backup module.
 """
+import itertools
 import json
 import pytest
-import tempfile
-from pathlib import Path
+import zipfile
+from datetime import datetime, timedelta
 import shutil
 
 from ibkrbot.core.config_backup import (
@@ -15,47 +16,88 @@ from ibkrbot.core.config_backup import (
 
 
 @pytest.fixture
-def temp_data_dir(monkeypatch):
+def temp_data_dir(tmp_path, monkeypatch):
     """Create a temporary data directory and mock user_data_dir."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        data_dir = Path(tmpdir) / "data"
-        data_dir.mkdir()
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
 
-        # Mock user_data_dir to return our temp directory
-        def mock_user_data_dir():
-            return data_dir
+    # Mock user_data_dir to return our temp directory
+    def mock_user_data_dir():
+        return data_dir
 
-        monkeypatch.setattr(
-            "ibkrbot.core.config_backup.user_data_dir",
-            mock_user_data_dir
-        )
+    monkeypatch.setattr(
+        "ibkrbot.core.config_backup.user_data_dir",
+        mock_user_data_dir
+    )
+    # Archive contents are what matter here, not the compression ratio
+    monkeypatch.setattr(
+        "ibkrbot.core.config_backup._BACKUP_COMPRESSION",
+        zipfile.ZIP_STORED
+    )
 
-        yield data_dir
+    return data_dir
 
 
 @pytest.fixture
-def populated_data_dir(temp_data_dir):
-    """Create a data directory with some content."""
+def distinct_timestamps(monkeypatch):
+    """Make each datetime.now() in config_backup one second later than the last."""
+    ticks = itertools.count()
+    start = datetime(2024, 1, 1, 12, 0, 0)
+
+    class FakeDateTime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return start + timedelta(seconds=next(ticks))
+
+    monkeypatch.setattr("ibkrbot.core.config_backup.datetime", FakeDateTime)
+
+
+@pytest.fixture(scope="session")
+def populated_template(tmp_path_factory):
+    """Build the sample data tree once per session."""
+    data_dir = tmp_path_factory.mktemp("populated")
+
     # Create config file
     config = {"setting1": "value1", "setting2": 42}
-    config_path = temp_data_dir / "config.json"
+    config_path = data_dir / "config.json"
     config_path.write_text(json.dumps(config))
 
     # Create journal
-    journal_dir = temp_data_dir / "journal"
+    journal_dir = data_dir / "journal"
     journal_dir.mkdir()
     trades = {"trades": {"T001": {"symbol": "AAPL", "qty": 100}}}
     (journal_dir / "trades.json").write_text(json.dumps(trades))
 
     # Create plans directory
-    plans_dir = temp_data_dir / "plans"
+    plans_dir = data_dir / "plans"
     plans_dir.mkdir()
     plan = {"symbol": "AAPL", "entry": 150.00}
     (plans_dir / "AAPL_draft.json").write_text(json.dumps(plan))
 
+    return data_dir
+
+
+@pytest.fixture
+def populated_data_dir(temp_data_dir, populated_template):
+    """Create a data directory with some content."""
+    # Real copies, not hardlinks: tests rewrite these files in place
+    shutil.copytree(populated_template, temp_data_dir, dirs_exist_ok=True)
     return temp_data_dir
 
 
+@pytest.fixture(scope="class")
+def backup_names(populated_template, tmp_path_factory):
+    """Entry names of one backup of the sample tree, shared by a test class."""
+    data_dir = tmp_path_factory.mktemp("data")
+    shutil.copytree(populated_template, data_dir, dirs_exist_ok=True)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("ibkrbot.core.config_backup.user_data_dir", lambda: data_dir)
+        mp.setattr("ibkrbot.core.config_backup._BACKUP_COMPRESSION", zipfile.ZIP_STORED)
+        backup_path = create_backup()
+    with zipfile.ZipFile(backup_path, 'r') as zf:
+        return frozenset(zf.namelist())
+
+
 class TestCreateBackup:
     """Tests for backup creation."""
 
@@ -67,35 +109,21 @@ class TestCreateBackup:
         assert backup_path.suffix == ".zip"
         assert backup_path.stat().st_size > 0
 
-    def test_create_backup_includes_config(self, populated_data_dir):
+    def test_create_backup_includes_config(self, backup_names):
         """Test backup includes config file."""
-        import zipfile
-
-        backup_path = create_backup()
+        assert "config.json" in backup_names
 
-        with zipfile.ZipFile(backup_path, 'r') as zf:
-            names = zf.namelist()
-            assert "config.json" in names
+    @pytest.mark.parametrize("prefix", ["journal/", "plans/"])
+    def test_create_backup_includes_dir(self, backup_names, prefix):
+        """Test backup includes the journal and plans directories."""
+        assert any(n.startswith(prefix) for n in backup_names)
 
-    def test_create_backup_includes_journal(self, populated_data_dir):
-        """Test backup includes journal."""
-        import zipfile
-
-        backup_path = create_backup()
+    def test_create_backup_compression(self, populated_data_dir):
+        """Test an explicit compression argument is used for every entry."""
+        backup_path = create_backup(compression=zipfile.ZIP_DEFLATED)
 
         with zipfile.ZipFile(backup_path, 'r') as zf:
-            names = zf.namelist()
-            assert any("journal" in n for n in names)
-
-    def test_create_backup_includes_plans(self, populated_data_dir):
-        """Test backup includes plans."""
-        import zipfile
-
-        backup_path = create_backup()
-
-        with zipfile.ZipFile(backup_path, 'r') as zf:
-            names = zf.namelist()
-            assert any("plans" in n for n in names)
+            assert {i.compress_type for i in zf.infolist()} == {zipfile.ZIP_DEFLATED}
 
     def test_create_backup_has_metadata(self, populated_data_dir):
         """Test backup includes metadata."""
@@ -160,13 +188,9 @@ class TestListBackups:
         backups = list_backups()
         assert backups == []
 
-    def test_list_multiple_backups(self, populated_data_dir):
+    def test_list_multiple_backups(self, populated_data_dir, distinct_timestamps):
         """Test listing multiple backups."""
-        import time
-
-        # Create multiple backups with sufficient delay for unique timestamps
         create_backup()
-        time.sleep(1.1)  # Sleep > 1 second to ensure different second-resolution timestamps
         create_backup()
 
         backups = list_backups()
@@ -206,15 +230,10 @@ class TestDeleteBackup:
 class TestCleanupBackups:
     """Tests for backup cleanup."""
 
-    def test_cleanup_keeps_recent(self, populated_data_dir):
+    def test_cleanup_keeps_recent(self, populated_data_dir, distinct_timestamps):
         """Test cleanup keeps specified number of backups."""
-        import time
-
-        # Create several backups with unique timestamps
-        for i in range(5):
+        for _ in range(5):
             create_backup()
-            if i < 4:  # Don't sleep after last one
-                time.sleep(1.1)  # Sleep > 1 second for unique timestamps
 
         # Should have 5 backups
         assert len(list_backups()) == 5
@@ -0,0 +1,97 @@
+"""
+Unit tests for plan helpers.
+"""
+import math
+
+from ibkrbot.core import json_utils
+from ibkrbot.core import plan as plan_mod
+from ibkrbot.core.plan import clone_plan, dumps_plan, load_json, load_json_cached, save_plan
+
+
+class TestClonePlan:
+    """Tests for clone_plan."""
+
+    def test_clone_isolates_levels_and_risk(self):
+        """Test editing the clone does not touch the original."""
+        plan = {
+            "symbol": "AAPL",
+            "levels": {"entry_limit": 150.0, "stop": 145.0},
+            "risk": {"qty": 10},
+        }
+        clone = clone_plan(plan)
+        clone["levels"]["entry_limit"] = 151.0
+        clone["risk"]["qty"] = 20
+        clone["symbol"] = "MSFT"
+
+        assert plan["levels"]["entry_limit"] == 150.0
+        assert plan["risk"]["qty"] == 10
+        assert plan["symbol"] == "AAPL"
+
+    def test_clone_shares_snapshot(self):
+        """Test large read-only sections are shared, not copied."""
+        snap = {"t": ["2024-01-01"], "close": [150.0]}
+        plan = {"levels": {}, "risk": {}, "data_snapshot": snap}
+        assert clone_plan(plan)["data_snapshot"] is snap
+
+    def test_clone_fills_missing_sections(self):
+        """Test missing levels/risk become empty dicts."""
+        clone = clone_plan({"symbol": "AAPL"})
+        assert clone["levels"] == {}
+        assert clone["risk"] == {}
+
+
+class TestPlanSerialization:
+    """Tests for plan load/dump helpers."""
+
+    def test_dump_and_load_roundtrip(self, tmp_path):
+        """Test a dumped plan loads back unchanged."""
+        plan = {"symbol": "AAPL", "levels": {"entry_limit": 150.25}, "risk": {"qty": 10}}
+        p = tmp_path / "AAPL_draft.json"
+        p.write_text(dumps_plan(plan), encoding="utf-8")
+        assert load_json(p) == plan
+
+    def test_load_legacy_nan(self, tmp_path):
+        """Test plans written with NaN by the stdlib still load."""
+        p = tmp_path / "AAPL_draft.json"
+        p.write_text('{"levels": {"atr": NaN}}', encoding="utf-8")
+        loaded = load_json(p)
+        assert loaded["levels"]["atr"] != loaded["levels"]["atr"]
+
+    def test_save_and_load_keep_nan(self, tmp_path, monkeypatch):
+        """Test NaN levels survive save_plan/load_json instead of becoming null."""
+        monkeypatch.setattr(plan_mod, "plan_dir", lambda: tmp_path)
+
+        class _NullingOrjson:
+            """Stand-in for orjson, which would write NaN as null."""
+            OPT_INDENT_2 = 0
+            JSONDecodeError = ValueError
+
+            @staticmethod
+            def dumps(obj, option=None):
+                raise AssertionError("non-finite plans must use the stdlib encoder")
+
+            @staticmethod
+            def loads(data):
+                raise ValueError("NaN")
+
+        monkeypatch.setattr(json_utils, "orjson", _NullingOrjson)
+        plan = {
+            "symbol": "AAPL",
+            "levels": {"entry_limit": float("nan"), "stop": 145.0},
+            "data_snapshot": {"close": [150.0, float("inf")]},
+        }
+        p = save_plan(plan, "draft")
+        loaded = load_json(p)
+        assert math.isnan(loaded["levels"]["entry_limit"])
+        assert loaded["levels"]["stop"] == 145.0
+        assert loaded["data_snapshot"]["close"] == [150.0, float("inf")]
+
+    def test_cached_load_reuses_until_rewritten(self, tmp_path):
+        """Test the cached loader returns the same dict until the file changes."""
+        p = tmp_path / "AAPL_draft.json"
+        p.write_text('{"risk": {"qty": 10}}', encoding="utf-8")
+        first = load_json_cached(p)
+        assert load_json_cached(p) is first
+
+        p.write_text('{"risk": {"qty": 250}}', encoding="utf-8")
+        assert load_json_cached(p)["risk"]["qty"] == 250
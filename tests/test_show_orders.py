@@ -0,0 +1,48 @@
+"""
+Unit tests for open order / position table shaping.
+"""
+from types import SimpleNamespace
+
+from ibkrbot.core.features.show_orders import order_table_rows, position_table_rows
+
+
+def _order(oid, parent=0, status="Submitted", symbol="AAPL"):
+    return SimpleNamespace(
+        orderId=oid, symbol=symbol, action="BUY", orderType="LMT", totalQuantity=10.0,
+        lmtPrice=150.0, auxPrice=0.0, status=status, parentId=parent,
+    )
+
+
+class TestOrderTableRows:
+    """Tests for bracket grouping of open orders."""
+
+    def test_children_follow_parent(self):
+        """Test children are listed under their parent with an indent marker."""
+        rows, _ = order_table_rows([_order(2, parent=1), _order(1), _order(3, parent=1)])
+        assert [r[0] for r in rows] == ["1", "2", "3"]
+        assert rows[1] == ("2", "1", "↳ AAPL", "BUY", "LMT", "10.0", "150.0", "0.0", "Submitted")
+
+    def test_orphans_go_last(self):
+        """Test children without a listed parent are appended at the end."""
+        rows, _ = order_table_rows([_order(5, parent=99), _order(1)])
+        assert [r[0] for r in rows] == ["1", "5"]
+
+    def test_open_bracket_flag(self):
+        """Test a bracket counts as open while any leg is still working."""
+        _, is_open = order_table_rows([_order(1, status="Filled"), _order(2, parent=1)])
+        assert is_open
+        _, is_open = order_table_rows([_order(1, status="Filled"), _order(2, parent=1, status="Cancelled")])
+        assert not is_open
+
+
+class TestPositionTableRows:
+    """Tests for position row shaping."""
+
+    def test_dict_and_object_positions(self):
+        """Test both ibapi dicts and attribute objects are accepted."""
+        d = {"symbol": "AAPL", "position": 10.0, "avgCost": 150.0, "account": "DU1"}
+        o = SimpleNamespace(symbol="MSFT", position=5.0, avgCost=300.0, account="DU1")
+        assert position_table_rows([d, o]) == [
+            ("AAPL", "10.0", "150.0", "DU1"),
+            ("MSFT", "5.0", "300.0", "DU1"),
+        ]
@@ -2,27 +2,32 @@
 Unit tests for Trade Journal module.
 """
 import json
+import math
 import pytest
-import tempfile
-from pathlib import Path
 from datetime import datetime
 
+from ibkrbot.core import json_utils
 from ibkrbot.core.trade_journal import (
     TradeJournal, TradeEntry, TradeStatus, TradeSide
 )
 
 
 @pytest.fixture
-def temp_journal_dir():
+def temp_journal_dir(tmp_path):
     """Create a temporary directory for journal storage."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 @pytest.fixture
 def journal(temp_journal_dir):
-    """Create a TradeJournal instance with temporary storage."""
-    return TradeJournal(journal_dir=temp_journal_dir)
+    """Create a TradeJournal instance with temporary storage.
+
+    Changes are batched, so tests asserting on in-memory state don't rewrite
+    trades.json on every call; test_persistence covers the write path.
+    """
+    j = TradeJournal(journal_dir=temp_journal_dir)
+    with j.batch():
+        yield j
 
 
 class TestTradeEntry:
@@ -80,8 +85,8 @@ class TestTradeEntry:
         assert entry.symbol == "AAPL"
         assert entry.tags == []  # Default value
 
-    def test_risk_per_share(self):
-        """Test risk per share calculation."""
+    def test_trade_entry_round_trip(self):
+        """Test to_dict/from_dict round-trip without sharing the tags list."""
         entry = TradeEntry(
             id="T001",
             symbol="AAPL",
@@ -90,27 +95,34 @@ class TestTradeEntry:
             entry_time="2024-01-15T10:00:00Z",
             entry_price=150.00,
             quantity=100,
-            stop_price=145.00,
+            tags=["earnings"],
         )
-        assert entry.risk_per_share == 5.00
+        d = entry.to_dict()
+        assert TradeEntry.from_dict(d) == entry
+        d["tags"].append("breakout")
+        assert entry.tags == ["earnings"]
 
-    def test_r_multiple_winning_trade(self):
-        """Test R-multiple calculation for winning trade."""
+    def test_risk_per_share(self):
+        """Test risk per share calculation."""
         entry = TradeEntry(
             id="T001",
             symbol="AAPL",
             side="long",
-            status="closed",
+            status="open",
             entry_time="2024-01-15T10:00:00Z",
             entry_price=150.00,
             quantity=100,
             stop_price=145.00,
-            realized_pnl=1000.00,  # 2R profit
         )
-        assert entry.r_multiple == 2.0
+        assert entry.risk_per_share == 5.00
 
-    def test_r_multiple_losing_trade(self):
-        """Test R-multiple calculation for losing trade."""
+    @pytest.mark.parametrize("pnl,r", [
+        (1000.00, 2.0),  # 2R profit
+        (-500.00, -1.0),  # 1R loss
+        (0.00, None),  # scratch trade has no R-multiple
+    ])
+    def test_r_multiple(self, pnl, r):
+        """Test R-multiple calculation for closed trades."""
         entry = TradeEntry(
             id="T001",
             symbol="AAPL",
@@ -120,9 +132,9 @@ class TestTradeEntry:
             entry_price=150.00,
             quantity=100,
             stop_price=145.00,
-            realized_pnl=-500.00,  # 1R loss
+            realized_pnl=pnl,
         )
-        assert entry.r_multiple == -1.0
+        assert entry.r_multiple == r
 
 
 class TestTradeJournal:
@@ -241,6 +253,63 @@ class TestTradeJournal:
         assert stats["win_rate"] == 50.0
         assert stats["total_pnl"] == 500.00  # Net
 
+    def test_statistics_extremes(self, journal):
+        """Test best/worst trade, averages and profit factor."""
+        t1 = journal.add_trade("AAPL", "long", 150.00, 100)
+        journal.close_trade(t1.id, exit_price=160.00)  # +$1000
+        t2 = journal.add_trade("MSFT", "long", 300.00, 10)
+        journal.close_trade(t2.id, exit_price=330.00)  # +$300
+        t3 = journal.add_trade("GOOGL", "long", 100.00, 20)
+        journal.close_trade(t3.id, exit_price=90.00)  # -$200
+
+        stats = journal.get_statistics()
+        assert stats["best_trade"] == 1000.00
+        assert stats["worst_trade"] == -200.00
+        assert stats["avg_winner"] == 650.00
+        assert stats["avg_loser"] == -200.00
+        assert stats["profit_factor"] == 6.5
+        assert isinstance(stats["total_pnl"], float)
+
+    def test_statistics_no_losses(self, journal):
+        """Test profit factor is infinite without losing trades."""
+        t1 = journal.add_trade("AAPL", "long", 150.00, 100)
+        journal.close_trade(t1.id, exit_price=160.00)
+
+        stats = journal.get_statistics()
+        assert stats["losers"] == 0
+        assert stats["avg_loser"] == 0
+        assert stats["profit_factor"] == float('inf')
+
+    def test_statistics_follow_changes(self, journal):
+        """Test cached statistics and trade lists are refreshed after each change."""
+        t1 = journal.add_trade("AAPL", "long", 150.00, 100)
+        assert journal.get_statistics()["closed_trades"] == 0
+        assert [t.id for t in journal.get_all_trades()] == [t1.id]
+
+        journal.close_trade(t1.id, exit_price=160.00)
+        t2 = journal.add_trade("MSFT", "long", 300.00, 10)
+        stats = journal.get_statistics()
+        assert stats["closed_trades"] == 1
+        assert stats["total_pnl"] == 1000.00
+        assert len(journal.get_all_trades()) == 2
+
+        # Callers get copies, so editing a result can't corrupt the cache
+        stats["total_pnl"] = 0.0
+        journal.get_all_trades().clear()
+        assert journal.get_statistics()["total_pnl"] == 1000.00
+        assert journal.get_trade(t2.id) in journal.get_all_trades()
+
+    def test_recent_trades(self, journal):
+        """Test recent() returns the newest trades first, capped at n."""
+        trades = [journal.add_trade(sym, "long", 100.00, 10) for sym in ("AAPL", "MSFT", "GOOGL")]
+        for i, t in enumerate(trades):
+            t.entry_time = f"2024-01-1{i}T10:00:00Z"
+        journal.update_notes(trades[0].id, "touch")  # invalidate the sorted cache
+
+        assert len(journal) == 3
+        assert [t.symbol for t in journal.recent(2)] == ["GOOGL", "MSFT"]
+        assert len(journal.recent()) == 3
+
     def test_persistence(self, temp_journal_dir):
         """Test that trades persist to disk."""
         # Create journal and add trade
@@ -254,6 +323,48 @@ class TestTradeJournal:
         assert loaded is not None
         assert loaded.symbol == "AAPL"
 
+    def test_save_and_load_keep_nan(self, temp_journal_dir, monkeypatch):
+        """Test NaN/Infinity prices survive a save and reload instead of becoming null."""
+
+        class _NullingOrjson:
+            """Stand-in for orjson, which would write NaN as null."""
+            OPT_INDENT_2 = 0
+            JSONDecodeError = ValueError
+
+            @staticmethod
+            def dumps(obj, option=None):
+                raise AssertionError("non-finite trades must use the stdlib encoder")
+
+            @staticmethod
+            def loads(data):
+                raise ValueError("NaN")
+
+        monkeypatch.setattr(json_utils, "orjson", _NullingOrjson)
+        j1 = TradeJournal(journal_dir=temp_journal_dir)
+        trade = j1.add_trade("AAPL", "long", float("nan"), 100, take_profit_price=float("inf"))
+
+        j2 = TradeJournal(journal_dir=temp_journal_dir)
+        loaded = j2.get_trade(trade.id)
+
+        assert loaded is not None
+        assert math.isnan(loaded.entry_price)
+        assert loaded.take_profit_price == float("inf")
+
+    def test_batch_writes_once(self, temp_journal_dir):
+        """Test batch() defers saving until the outermost block exits."""
+        j = TradeJournal(journal_dir=temp_journal_dir)
+        journal_file = temp_journal_dir / "trades.json"
+        with j.batch():
+            t1 = j.add_trade("AAPL", "long", 150.00, 100)
+            with j.batch():
+                j.close_trade(t1.id, exit_price=160.00)
+            assert not journal_file.exists()
+            assert j.get_statistics()["closed_trades"] == 1
+        assert journal_file.exists()
+
+        reloaded = TradeJournal(journal_dir=temp_journal_dir)
+        assert reloaded.get_trade(t1.id).status == TradeStatus.CLOSED.value
+
     def test_add_tag(self, journal):
         """Test adding tags to a trade."""
         trade = journal.add_trade("AAPL", "long", 150.00, 100)
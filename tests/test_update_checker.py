@@ -2,8 +2,9 @@
 Unit tests for Update Checker module.
 """
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import json
+import urllib.error
 
 from ibkrbot.core.update_checker import (
     parse_version, is_newer_version, check_for_updates,
@@ -11,6 +12,31 @@ from ibkrbot.core.update_checker import (
 )
 
 
+class _FakeResponse:
+    """Minimal urlopen() response: a context manager whose read() returns a payload."""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def read(self, *args):
+        return self._payload
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _mock_response(tag, body="Release notes"):
+    """Build a urlopen() response carrying a GitHub release payload."""
+    return _FakeResponse(json.dumps({
+        "tag_name": tag,
+        "html_url": "https://github.com/test/release",
+        "body": body,
+    }).encode('utf-8'))
+
+
 class TestVersionParsing:
     """Tests for version parsing functions."""
 
@@ -65,48 +91,24 @@ class TestUpdateInfo:
 class TestCheckForUpdates:
     """Tests for check_for_updates function."""
 
+    @pytest.mark.parametrize("tag,available,latest", [
+        ("v99.0.0", True, "99.0.0"),  # Very high version
+        ("v0.0.1", False, "0.0.1"),  # Very low version
+    ])
     @patch('urllib.request.urlopen')
-    def test_check_for_updates_newer_available(self, mock_urlopen):
-        """Test check when newer version is available."""
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({
-            "tag_name": "v99.0.0",  # Very high version
-            "html_url": "https://github.com/test/release",
-            "body": "Release notes here"
-        }).encode('utf-8')
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
-
-        result = check_for_updates()
-
-        assert result is not None
-        assert result.is_update_available is True
-        assert result.latest_version == "99.0.0"
-
-    @patch('urllib.request.urlopen')
-    def test_check_for_updates_no_newer(self, mock_urlopen):
-        """Test check when no newer version is available."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({
-            "tag_name": "v0.0.1",  # Very low version
-            "html_url": "https://github.com/test/release",
-            "body": "Release notes"
-        }).encode('utf-8')
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+    def test_check_for_updates_release(self, mock_urlopen, tag, available, latest):
+        """Test check reports whether the latest release is newer."""
+        mock_urlopen.return_value = _mock_response(tag)
 
         result = check_for_updates()
 
         assert result is not None
-        assert result.is_update_available is False
+        assert result.is_update_available is available
+        assert result.latest_version == latest
 
     @patch('urllib.request.urlopen')
     def test_check_for_updates_network_error(self, mock_urlopen):
         """Test check handles network errors gracefully."""
-        import urllib.error
         mock_urlopen.side_effect = urllib.error.URLError("Network error")
 
         result = check_for_updates()
@@ -116,7 +118,6 @@ class TestCheckForUpdates:
     @patch('urllib.request.urlopen')
     def test_check_for_updates_404(self, mock_urlopen):
         """Test check handles 404 errors (no releases)."""
-        import urllib.error
         mock_urlopen.side_effect = urllib.error.HTTPError(
             "url", 404, "Not Found", {}, None
         )
@@ -126,6 +127,23 @@ class TestCheckForUpdates:
         assert result is None
 
 
+class _FakeTimer:
+    """threading.Timer stand-in that never starts a thread."""
+
+    def __init__(self, interval, function):
+        self.interval = interval
+        self.function = function
+        self.daemon = False
+        self.started = False
+        self.cancelled = False
+
+    def start(self):
+        self.started = True
+
+    def cancel(self):
+        self.cancelled = True
+
+
 class TestUpdateChecker:
     """Tests for UpdateChecker class."""
 
@@ -136,7 +154,13 @@ class TestUpdateChecker:
 
     def test_start_stop_checker(self):
         """Test starting and stopping the checker."""
-        checker = UpdateChecker()
+        timers = []
+
+        def timer_factory(interval, function):
+            timers.append(_FakeTimer(interval, function))
+            return timers[-1]
+
+        checker = UpdateChecker(timer_factory=timer_factory)
         callback_called = []
 
         def callback(info):
@@ -144,9 +168,13 @@ class TestUpdateChecker:
 
         checker.start(callback)
         assert checker._running is True
+        assert len(timers) == 1
+        assert timers[0].started and timers[0].daemon
+        assert timers[0].interval == 24.0 * 3600
 
         checker.stop()
         assert checker._running is False
+        assert timers[0].cancelled
 
     def test_last_check_property(self):
         """Test last_check property."""